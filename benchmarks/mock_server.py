@@ -0,0 +1,136 @@
+"""Local HTTP server that replays synthetic FRED API payloads."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib import parse as urlparse
+
+from . import payloads
+
+
+class MockFredServer:
+    """Serve ``/fred/<endpoint>`` with synthetic payloads on localhost.
+
+    ``observations`` and ``table_elements`` control payload size, ``tags``
+    the number of tags per tag group served page by page, and ``latency``
+    the delay in seconds added before every response. With ``compression``
+    enabled, bodies are gzipped for clients that send
+    ``Accept-Encoding: gzip``.
+
+    Use as a context manager; :attr:`base_url` is suitable for
+    ``FredConfig(base_url=...)``.
+    """
+
+    def __init__(
+        self,
+        observations: int = 1000,
+        table_elements: int = 200,
+        tags: int = 500,
+        latency: float = 0.0,
+        compression: bool = True,
+    ) -> None:
+        self.observations = observations
+        self.table_elements = table_elements
+        self.tags = tags
+        self.latency = latency
+        self.compression = compression
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/fred"
+
+    def start(self) -> MockFredServer:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> MockFredServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def respond(self, endpoint: str, params: dict[str, str]) -> Any:
+        if endpoint == "series/observations":
+            return _encoded_observations(self.observations)
+        if endpoint == "series":
+            return json.dumps(payloads.series_payload(params.get("series_id", "S"))).encode()
+        if endpoint == "release/tables":
+            return _encoded_table(self.table_elements)
+        if endpoint == "tags":
+            return json.dumps(
+                payloads.tags_payload(
+                    self.tags,
+                    int(params.get("limit", 1000)),
+                    int(params.get("offset", 0)),
+                    params.get("tag_group_id"),
+                )
+            ).encode()
+        return None
+
+
+@lru_cache(maxsize=8)
+def _encoded_observations(count: int) -> bytes:
+    return json.dumps(payloads.observations_payload(count)).encode()
+
+
+@lru_cache(maxsize=8)
+def _gzipped(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=6)
+
+
+@lru_cache(maxsize=8)
+def _encoded_table(count: int) -> bytes:
+    return json.dumps(payloads.release_table_payload(count)).encode()
+
+
+def _make_handler(server: MockFredServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            parsed = urlparse.urlsplit(self.path)
+            endpoint = parsed.path.removeprefix("/fred/").strip("/")
+            params = dict(urlparse.parse_qsl(parsed.query))
+            with server._lock:
+                server.requests += 1
+            if server.latency:
+                time.sleep(server.latency)
+            body = server.respond(endpoint, params)
+            if body is None:
+                body = json.dumps(
+                    {"error_code": 404, "error_message": f"Unknown endpoint {endpoint}"}
+                ).encode()
+                self.send_response(404)
+            else:
+                self.send_response(200)
+            if server.compression and "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = _gzipped(body)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return None
+
+    return Handler
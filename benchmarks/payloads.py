@@ -0,0 +1,115 @@
+"""Synthetic FRED API payloads of configurable size."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+
+def observations_payload(count: int, missing_every: int = 50) -> dict[str, Any]:
+    """Daily observations shaped like a ``series/observations`` response."""
+    start = date(1960, 1, 1)
+    observations = []
+    for index in range(count):
+        day = (start + timedelta(days=index)).isoformat()
+        value = "." if missing_every and index % missing_every == 0 else f"{100 + index * 0.01:.4f}"
+        observations.append(
+            {
+                "realtime_start": "2024-01-01",
+                "realtime_end": "9999-12-31",
+                "date": day,
+                "value": value,
+            }
+        )
+    return {
+        "realtime_start": "2024-01-01",
+        "realtime_end": "9999-12-31",
+        "observation_start": "1600-01-01",
+        "observation_end": "9999-12-31",
+        "units": "lin",
+        "output_type": 1,
+        "file_type": "json",
+        "order_by": "observation_date",
+        "sort_order": "asc",
+        "count": count,
+        "offset": 0,
+        "limit": 100000,
+        "observations": observations,
+    }
+
+
+def series_payload(series_id: str) -> dict[str, Any]:
+    """Metadata shaped like a ``series`` response."""
+    return {
+        "seriess": [
+            {
+                "id": series_id,
+                "realtime_start": "2024-01-01",
+                "realtime_end": "9999-12-31",
+                "title": f"Synthetic series {series_id}",
+                "observation_start": "1960-01-01",
+                "observation_end": "2024-01-01",
+                "frequency": "Daily",
+                "frequency_short": "D",
+                "units": "Index",
+                "units_short": "Index",
+                "seasonal_adjustment": "Not Seasonally Adjusted",
+                "seasonal_adjustment_short": "NSA",
+                "last_updated": "2024-01-02 07:01:02-06",
+                "popularity": 50,
+                "notes": "Synthetic benchmark series.",
+            }
+        ]
+    }
+
+
+def release_table_payload(count: int, fanout: int = 8) -> dict[str, Any]:
+    """A ``release/tables`` response with ``count`` elements in a tree."""
+    elements: dict[str, Any] = {}
+    for element_id in range(1, count + 1):
+        parent_id = None if element_id <= fanout else (element_id - 1) // fanout
+        elements[str(element_id)] = {
+            "element_id": element_id,
+            "release_id": 53,
+            "series_id": f"S{element_id}" if element_id % 3 else None,
+            "parent_id": parent_id,
+            "line": str(element_id),
+            "type": "series" if element_id % 3 else "header",
+            "name": f"Element {element_id}",
+            "level": "0" if parent_id is None else "1",
+            "children": [],
+        }
+    for element in elements.values():
+        parent_id = element["parent_id"]
+        if parent_id is not None:
+            parent = elements[str(parent_id)]
+            parent["children"].append(
+                {key: value for key, value in element.items() if key != "children"}
+            )
+    return {"name": "Synthetic table", "element_id": None, "release_id": "53", "elements": elements}
+
+
+def tags_payload(total: int, limit: int, offset: int, group_id: str | None) -> dict[str, Any]:
+    """One page of a ``tags`` response drawn from ``total`` synthetic tags."""
+    group = group_id or "gen"
+    tags = [
+        {
+            "name": f"{group}-tag-{index}",
+            "group_id": group,
+            "notes": "",
+            "created": "2012-02-27 10:18:19-06",
+            "popularity": index % 100,
+            "series_count": index,
+        }
+        for index in range(offset, min(total, offset + limit))
+    ]
+    return {
+        "realtime_start": "2024-01-01",
+        "realtime_end": "2024-01-01",
+        "order_by": "series_count",
+        "sort_order": "desc",
+        "count": total,
+        "offset": offset,
+        "limit": limit,
+        "tags": tags,
+    }
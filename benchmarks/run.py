@@ -0,0 +1,311 @@
+"""Run the fredtools benchmark suite and compare against a baseline.
+
+Usage::
+
+    python -m benchmarks --output bench.json
+    python -m benchmarks --compare bench.json --threshold 1.25
+
+Every benchmark reports the minimum and median wall time over ``--repeat``
+runs. With ``--compare`` the exit status is non-zero when any median is
+more than ``--threshold`` times slower than the baseline, so results saved
+on one commit can gate another.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from fredtools.client import Fred, FredConfig, use_client
+from fredtools.releases import Release
+from fredtools.series import Series
+from fredtools.tags import TagCatalog
+from fredtools.ENUMS import TagGroups
+
+from . import payloads
+from .mock_server import MockFredServer
+
+
+@dataclass
+class Settings:
+    observations: int = 20000
+    table_elements: int = 2000
+    tags: int = 2500
+    series: int = 32
+    concurrency: int = 8
+    latency: float = 0.005
+    compression: bool = True
+    repeat: int = 5
+
+    @classmethod
+    def quick(cls) -> Settings:
+        return cls(
+            observations=500,
+            table_elements=100,
+            tags=150,
+            series=4,
+            concurrency=2,
+            latency=0.0,
+            repeat=1,
+        )
+
+
+@dataclass
+class Context:
+    settings: Settings
+    server: MockFredServer
+
+    def client(self) -> Fred:
+        return Fred(FredConfig(api_key="bench", base_url=self.server.base_url), register_default=False)
+
+
+Setup = Callable[[Context], Callable[[], Any]]
+BENCHMARKS: dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _in_memory_client(response: Any) -> Fred:
+    return Fred(
+        FredConfig(api_key="bench", transport=lambda url, params, timeout: response),
+        register_default=False,
+    )
+
+
+def _series(series_id: str = "BENCH") -> Series:
+    return Series(series_id=series_id, title="Benchmark", realtime_start="2024-01-01")
+
+
+@benchmark("import.fredtools")
+def bench_import(ctx: Context) -> Callable[[], Any]:
+    command = [sys.executable, "-c", "import fredtools; fredtools.Fred"]
+    return lambda: subprocess.run(command, check=True)
+
+
+@benchmark("series.observations.parse")
+def bench_observations_parse(ctx: Context) -> Callable[[], Any]:
+    client = _in_memory_client(payloads.observations_payload(ctx.settings.observations))
+    series = _series()
+
+    def run() -> Any:
+        with use_client(client):
+            return series.observations()
+
+    return run
+
+
+@benchmark("series.observation_columns.parse")
+def bench_observation_columns_parse(ctx: Context) -> Callable[[], Any]:
+    client = _in_memory_client(payloads.observations_payload(ctx.settings.observations))
+    series = _series()
+
+    def run() -> Any:
+        with use_client(client):
+            return series.observation_columns()
+
+    return run
+
+
+@benchmark("series.observations.http")
+def bench_observations_http(ctx: Context) -> Callable[[], Any]:
+    client = ctx.client()
+    series = _series()
+
+    def run() -> Any:
+        with use_client(client):
+            return series.observations()
+
+    return run
+
+
+@benchmark("observations_result.df")
+def bench_observations_df(ctx: Context) -> Callable[[], Any] | None:
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        return None
+    client = _in_memory_client(payloads.observations_payload(ctx.settings.observations))
+    with use_client(client):
+        result = _series().observations()
+    return lambda: result.df
+
+
+def _json_decode_benchmark(backend: str) -> Setup:
+    def setup(ctx: Context) -> Callable[[], Any] | None:
+        from fredtools.decoders import available_backends, resolve_json_decoder
+
+        if backend not in available_backends():
+            return None
+        decode = resolve_json_decoder(backend)
+        observations = json.dumps(payloads.observations_payload(ctx.settings.observations)).encode()
+        table = json.dumps(payloads.release_table_payload(ctx.settings.table_elements)).encode()
+        return lambda: (decode(observations), decode(table))
+
+    return setup
+
+
+for _backend in ("json", "orjson", "msgspec"):
+    benchmark(f"json.decode.{_backend}")(_json_decode_benchmark(_backend))
+
+
+@benchmark("release.parse_release_table")
+def bench_parse_release_table(ctx: Context) -> Callable[[], Any]:
+    payload = payloads.release_table_payload(ctx.settings.table_elements)
+    return lambda: Release._parse_release_table(payload)
+
+
+@benchmark("tags.catalog.paginate")
+def bench_tag_catalog_paginate(ctx: Context) -> Callable[[], Any]:
+    client = ctx.client()
+    page_size = max(1, ctx.settings.tags // 10)
+
+    def run() -> Any:
+        catalog = TagCatalog(page_size=page_size, tag_groups=[TagGroups.GEN, TagGroups.GEO])
+        with use_client(client):
+            catalog.load()
+        return catalog
+
+    return run
+
+
+@benchmark("pipeline.stream_observations")
+def bench_stream_observations(ctx: Context) -> Callable[[], Any]:
+    import asyncio
+
+    from fredtools.pipeline import stream_observations
+
+    client = ctx.client()
+    ids = [f"S{index}" for index in range(ctx.settings.series)]
+
+    async def consume() -> int:
+        count = 0
+        async for _ in stream_observations(ids, client=client, concurrency=ctx.settings.concurrency):
+            count += 1
+        return count
+
+    return lambda: asyncio.run(consume())
+
+
+def run_benchmarks(settings: Settings, selected: Sequence[str] | None = None) -> dict[str, dict[str, Any]]:
+    results: dict[str, dict[str, Any]] = {}
+    with MockFredServer(
+        observations=settings.observations,
+        table_elements=settings.table_elements,
+        tags=settings.tags,
+        latency=settings.latency,
+        compression=settings.compression,
+    ) as server:
+        context = Context(settings=settings, server=server)
+        for name, setup in BENCHMARKS.items():
+            if selected and not any(pattern in name for pattern in selected):
+                continue
+            run = setup(context)
+            if run is None:
+                print(f"{name:<36} skipped", file=sys.stderr)
+                continue
+            run()
+            timings = []
+            for _ in range(settings.repeat):
+                started = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - started)
+            results[name] = {
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "runs": len(timings),
+            }
+            print(
+                f"{name:<36} min {results[name]['min'] * 1e3:10.3f} ms  "
+                f"median {results[name]['median'] * 1e3:10.3f} ms",
+                file=sys.stderr,
+            )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Return the names of benchmarks slower than ``threshold`` x baseline."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get("median"):
+            continue
+        ratio = result["median"] / previous["median"]
+        marker = "REGRESSION" if ratio > threshold else ""
+        print(f"{name:<36} {ratio:6.2f}x baseline {marker}", file=sys.stderr)
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Tiny payloads and one run; for smoke tests.")
+    parser.add_argument("--repeat", type=int)
+    parser.add_argument("--observations", type=int, help="Observations per series payload.")
+    parser.add_argument("--latency", type=float, help="Mock server latency per request, in seconds.")
+    parser.add_argument("--no-compression", action="store_true", help="Serve uncompressed bodies.")
+    parser.add_argument("--filter", action="append", help="Only run benchmarks whose name contains this text.")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this path.")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON written by --output.")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    settings = Settings.quick() if args.quick else Settings()
+    if args.repeat is not None:
+        settings.repeat = args.repeat
+    if args.observations is not None:
+        settings.observations = args.observations
+    if args.latency is not None:
+        settings.latency = args.latency
+    if args.no_compression:
+        settings.compression = False
+
+    results = run_benchmarks(settings, args.filter)
+    report = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": asdict(settings),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline.get("settings") != report["settings"]:
+            print("warning: baseline was recorded with different settings", file=sys.stderr)
+        if compare(results, baseline.get("results", {}), args.threshold):
+            return 1
+    return 0
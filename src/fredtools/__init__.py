@@ -1,13 +1,61 @@
-"""FRED Tools package."""
-
-from .client import Fred, FredConfig
-from .series import Series
-from .types import Observation, ObservationsResult
-from .releases import Release
-from .categories import Category
-from .tags import Tag
+"""FRED Tools package.
+
+Public names are imported on first access, so ``import fredtools`` stays
+cheap for short-lived processes that only touch part of the API.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .archive import ObservationArchive, write_archive
+    from .categories import Category
+    from .client import Fred, FredConfig
+    from .panel import Panel
+    from .releases import Release
+    from .search_index import SeriesIndex
+    from .series import Series
+    from .tag_index import TagIndex
+    from .tags import Tag, TagCatalog, set_tag_catalog
+    from .types import Observation, ObservationsResult
+
+_LAZY_ATTRIBUTES = {
+    "Fred": "client",
+    "FredConfig": "client",
+    "Series": "series",
+    "Observation": "types",
+    "ObservationsResult": "types",
+    "Release": "releases",
+    "Category": "categories",
+    "Tag": "tags",
+    "TagCatalog": "tags",
+    "set_tag_catalog": "tags",
+    "SeriesIndex": "search_index",
+    "TagIndex": "tag_index",
+    "Panel": "panel",
+    "ObservationArchive": "archive",
+    "write_archive": "archive",
+}
+
 __all__ = [
     "__version__", "Fred", "FredConfig", "Series", "Observation",
-    "Category", "Release", "ObservationsResult", "Tag"
+    "Category", "Release", "ObservationsResult", "Tag", "SeriesIndex",
+    "TagIndex", "TagCatalog", "set_tag_catalog",
+    "Panel", "ObservationArchive", "write_archive"
     ]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
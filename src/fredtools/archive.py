@@ -0,0 +1,218 @@
+"""Read-optimized, memory-mappable on-disk archive of many series.
+
+Layout (all integers little-endian)::
+
+    b"FREDARC1"                    magic
+    uint64                         header length in bytes
+    JSON header                    {"version", "rows", "sections", "series"}
+    padding to 8 bytes             start of the data block
+    int64[rows]   date             days since 1970-01-01
+    float64[rows] value            NaN for missing observations
+    int64[rows]   realtime_start   days since 1970-01-01
+    int64[rows]   realtime_end     days since 1970-01-01
+
+``sections`` maps each column to its byte offset in the data block and
+``series`` maps a series id to ``{"offset", "length", "frequency"}`` in
+rows, so every series is a contiguous slice of each column.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+from array import array
+from datetime import date, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Sequence
+
+from .logging import get_logger
+from .types import ObservationsResult
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = get_logger(__name__)
+
+MAGIC = b"FREDARC1"
+VERSION = 1
+_EPOCH = date(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_SECTIONS = (
+    ("date", "q"),
+    ("value", "d"),
+    ("realtime_start", "q"),
+    ("realtime_end", "q"),
+)
+_LENGTH = struct.Struct("<Q")
+
+
+def _days(value: date) -> int:
+    return value.toordinal() - _EPOCH_ORDINAL
+
+
+def _columns_of(result: ObservationsResult | Mapping[str, Sequence]) -> Mapping[str, Sequence]:
+    return result if isinstance(result, Mapping) else result.columns
+
+
+def write_archive(
+    path: str | os.PathLike[str],
+    results: Mapping[str, ObservationsResult | Mapping[str, Sequence]],
+    frequencies: Mapping[str, str] | None = None,
+) -> Path:
+    """Write ``results`` (series id to observations) as an archive at ``path``.
+
+    Accepts :class:`ObservationsResult` objects or observation column
+    mappings. The file is written beside ``path`` and moved into place, so
+    readers never see a partial archive.
+    """
+    path = Path(path)
+    frequencies = frequencies or {}
+    buffers = {name: array(typecode) for name, typecode in _SECTIONS}
+    index: dict[str, dict[str, Any]] = {}
+    for series_id, result in results.items():
+        columns = _columns_of(result)
+        index[series_id] = {
+            "offset": len(buffers["date"]),
+            "length": len(columns["date"]),
+            "frequency": frequencies.get(series_id),
+        }
+        buffers["date"].extend(_days(value) for value in columns["date"])
+        buffers["value"].extend(columns["value"])
+        buffers["realtime_start"].extend(_days(value) for value in columns["realtime_start"])
+        buffers["realtime_end"].extend(_days(value) for value in columns["realtime_end"])
+
+    rows = len(buffers["date"])
+    header = {
+        "version": VERSION,
+        "rows": rows,
+        "sections": {
+            name: position * rows * 8 for position, (name, _) in enumerate(_SECTIONS)
+        },
+        "series": index,
+    }
+    encoded = json.dumps(header).encode()
+    prefix = MAGIC + _LENGTH.pack(len(encoded)) + encoded
+
+    partial = path.with_name(f".{path.name}.partial")
+    with partial.open("wb") as handle:
+        handle.write(prefix)
+        handle.write(b"\0" * (_align(len(prefix)) - len(prefix)))
+        for name, _ in _SECTIONS:
+            buffer = buffers[name]
+            if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+                buffer.byteswap()
+            buffer.tofile(handle)
+    os.replace(partial, path)
+    logger.debug("Wrote %d series (%d rows) to %s", len(index), rows, path)
+    return path
+
+
+def _align(offset: int, boundary: int = 8) -> int:
+    return -(-offset // boundary) * boundary
+
+
+class ObservationArchive:
+    """Memory-mapped reader for files produced by :func:`write_archive`.
+
+    Only the JSON header is parsed on open; column data stays in the page
+    cache and is shared by every process mapping the same file. Requires
+    numpy.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        try:
+            import numpy as np
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "numpy is required to read archives. Install it with "
+                "`pip install numpy`."
+            ) from exc
+
+        with self.path.open("rb") as handle:
+            magic = handle.read(len(MAGIC))
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a fredtools archive")
+            (length,) = _LENGTH.unpack(handle.read(_LENGTH.size))
+            header = json.loads(handle.read(length))
+        data_start = _align(len(MAGIC) + _LENGTH.size + length)
+        if header.get("version") != VERSION:
+            raise ValueError(f"Unsupported archive version: {header.get('version')!r}")
+        self._index: dict[str, dict[str, Any]] = header["series"]
+        rows = header["rows"]
+        self._map = np.memmap(self.path, dtype=np.uint8, mode="r")
+        self._columns = {
+            name: self._map[data_start + offset : data_start + offset + rows * 8].view(
+                "<f8" if name == "value" else "<i8"
+            )
+            for name, offset in header["sections"].items()
+        }
+
+    def keys(self) -> list[str]:
+        return list(self._index)
+
+    def frequency(self, series_id: str) -> str | None:
+        return self._entry(series_id)["frequency"]
+
+    def arrays(self, series_id: str) -> dict[str, "np.ndarray"]:
+        """Return zero-copy views of one series: dates as ``datetime64[D]``, values as ``float64``."""
+        entry = self._entry(series_id)
+        window = slice(entry["offset"], entry["offset"] + entry["length"])
+        return {
+            name: column[window] if name == "value" else column[window].view("datetime64[D]")
+            for name, column in self._columns.items()
+        }
+
+    def columns(self, series_id: str) -> dict[str, list]:
+        """Return one series as observation column lists of dates and floats."""
+        entry = self._entry(series_id)
+        window = slice(entry["offset"], entry["offset"] + entry["length"])
+        return {
+            name: column[window].tolist()
+            if name == "value"
+            else [_EPOCH + timedelta(days=days) for days in column[window].tolist()]
+            for name, column in self._columns.items()
+        }
+
+    def get(self, series_id: str) -> ObservationsResult:
+        return ObservationsResult.from_columns(self.columns(series_id))
+
+    def close(self) -> None:
+        """Drop this reader's mapping; views from :meth:`arrays` stay valid."""
+        self._columns = {}
+        self._map = None
+
+    def _entry(self, series_id: str) -> dict[str, Any]:
+        try:
+            return self._index[series_id]
+        except KeyError:
+            raise KeyError(f"Series {series_id!r} is not in {self.path}") from None
+
+    def __getitem__(self, series_id: str) -> ObservationsResult:
+        return self.get(series_id)
+
+    def __contains__(self, series_id: object) -> bool:
+        return series_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __enter__(self) -> ObservationArchive:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["path"])
+
+    def __repr__(self) -> str:
+        return f"ObservationArchive({str(self.path)!r}, series={len(self)})"
@@ -0,0 +1,215 @@
+"""Split observation requests that exceed the API's row cap.
+
+FRED returns at most ``limit`` rows per ``series/observations`` request
+but reports the full ``count``. :func:`fetch_observations` notices the
+shortfall and fetches the rest as further date windows, stitching the
+pieces into one list without duplicates.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+from typing import Any, Callable, Mapping
+
+from .logging import get_logger
+from .types import Observation
+
+logger = get_logger(__name__)
+
+ObservationFetch = Callable[[Mapping[str, Any]], tuple[list[Observation], int | None]]
+
+DEFAULT_CHUNK_WORKERS = 4
+# Chunks aim below the cap so uneven row density rarely forces a re-split.
+CHUNK_FILL = 0.8
+
+_ONE_DAY = timedelta(days=1)
+
+
+def is_truncated(rows: list[Observation], count: int | None) -> bool:
+    return count is not None and count > len(rows)
+
+
+def fetch_observations(
+    fetch: ObservationFetch,
+    params: Mapping[str, Any],
+    max_workers: int = DEFAULT_CHUNK_WORKERS,
+    first_page: tuple[list[Observation], int | None] | None = None,
+) -> list[Observation]:
+    """Fetch every observation matching ``params``, however many requests it takes.
+
+    ``fetch(params)`` makes one request and returns its rows with the
+    reported ``count``. When rows are missing, the dates after the last
+    one returned are split into windows sized from the density seen so
+    far and fetched with up to ``max_workers`` threads; windows that are
+    still cut short are split again. A page filled by a single date is
+    re-fetched as two halves of the realtime window. ``units`` and
+    ``frequency`` transforms depend on earlier observations, so those
+    requests continue sequentially from the last date instead. Callers
+    that already hold the first response pass it as ``first_page``.
+
+    Raises ``RuntimeError`` rather than returning a partial result when a
+    capped response cannot be split: ``output_type`` 2-4, or a single date
+    whose vintages overflow a one-day realtime window.
+    """
+    rows, count = fetch(params) if first_page is None else first_page
+    if not is_truncated(rows, count):
+        return rows
+    if params.get("output_type") not in (None, 1):
+        raise RuntimeError(
+            f"Observations for {params.get('series_id')} were truncated at "
+            f"{len(rows)} of {count} rows and output_type="
+            f"{params.get('output_type')} responses cannot be split; narrow "
+            "observation_start/observation_end or the realtime window"
+        )
+    if not rows:
+        raise RuntimeError(
+            f"Observations for {params.get('series_id')} reported {count} rows "
+            "but returned none"
+        )
+    logger.debug(
+        "Observations for %s truncated at %d of %d rows; splitting",
+        params.get("series_id"), len(rows), count,
+    )
+    return _dedupe(_complete(fetch, params, rows, count, max_workers))
+
+
+def _complete(
+    fetch: ObservationFetch,
+    params: Mapping[str, Any],
+    rows: list[Observation],
+    count: int,
+    max_workers: int,
+) -> list[Observation]:
+    first = min(row.date for row in rows)
+    last = max(row.date for row in rows)
+    end = _param_date(params, "observation_end")
+    pieces: list[list[Observation]] = []
+
+    if first == last:
+        # Dates cannot be split further; split the vintages instead.
+        single_day = {
+            **params,
+            "observation_start": last.isoformat(),
+            "observation_end": last.isoformat(),
+        }
+        pieces.append(_split_realtime(fetch, single_day, max_workers))
+        start = last + _ONE_DAY
+    else:
+        pieces.append(rows)
+        # The page may have stopped partway through ``last``'s vintages.
+        start = last
+    if end is not None and start > end:
+        return [row for piece in pieces for row in piece]
+
+    if _is_transformed(params):
+        rest = {**params, "observation_start": start.isoformat()}
+        pieces.append(fetch_observations(fetch, rest, max_workers))
+        return [row for piece in pieces for row in piece]
+
+    target = max(1, int(len(rows) * CHUNK_FILL))
+    density = len(rows) / ((last - first).days + 1)
+    chunk_days = max(1, int(target / density))
+    chunks = max(1, math.ceil((count - len(rows)) / target))
+    windows: list[dict[str, Any]] = []
+    for index in range(chunks):
+        window_start = start + timedelta(days=index * chunk_days)
+        if end is not None and window_start > end:
+            break
+        if index == chunks - 1:
+            window_end = end
+        else:
+            window_end = window_start + timedelta(days=chunk_days - 1)
+            if end is not None:
+                window_end = min(window_end, end)
+        windows.append(
+            {
+                **params,
+                "observation_start": window_start.isoformat(),
+                "observation_end": window_end.isoformat() if window_end else None,
+            }
+        )
+    pieces.extend(_fetch_windows(fetch, windows, max_workers))
+    return [row for piece in pieces for row in piece]
+
+
+def _split_realtime(
+    fetch: ObservationFetch,
+    params: Mapping[str, Any],
+    max_workers: int,
+) -> list[Observation]:
+    # The API defaults both ends of the realtime window to today.
+    realtime_start = _param_date(params, "realtime_start") or date.today()
+    realtime_end = _param_date(params, "realtime_end") or date.today()
+    if realtime_start >= realtime_end:
+        raise RuntimeError(
+            f"Observations for {params.get('series_id')} on "
+            f"{params.get('observation_start')} exceed the row cap within a "
+            "single realtime day and cannot be split further"
+        )
+    middle = realtime_start + (realtime_end - realtime_start) // 2
+    left, right = _fetch_windows(
+        fetch,
+        [
+            {**params, "realtime_end": middle.isoformat()},
+            {**params, "realtime_start": (middle + _ONE_DAY).isoformat()},
+        ],
+        max_workers,
+    )
+    return _join_vintages(left, right, middle)
+
+
+def _fetch_windows(
+    fetch: ObservationFetch,
+    windows: list[dict[str, Any]],
+    max_workers: int,
+) -> list[list[Observation]]:
+    if len(windows) == 1 or max_workers <= 1:
+        return [fetch_observations(fetch, window, max_workers) for window in windows]
+
+    from .concurrency import ContextThreadPoolExecutor
+
+    with ContextThreadPoolExecutor(max_workers=min(max_workers, len(windows))) as executor:
+        futures = [
+            executor.submit(fetch_observations, fetch, window, max_workers)
+            for window in windows
+        ]
+        return [future.result() for future in futures]
+
+
+def _join_vintages(
+    left: list[Observation],
+    right: list[Observation],
+    middle: date,
+) -> list[Observation]:
+    # The API clips vintages to the requested realtime window, so one that
+    # spans the split comes back as two rows meeting at ``middle``.
+    open_at_middle = {
+        (row.date, row.value): row for row in left if row.realtime_end == middle
+    }
+    joined = list(left)
+    for row in right:
+        match = open_at_middle.pop((row.date, row.value), None)
+        if match is not None and row.realtime_start == middle + _ONE_DAY:
+            match.realtime_end = row.realtime_end
+        else:
+            joined.append(row)
+    return joined
+
+
+def _dedupe(rows: list[Observation]) -> list[Observation]:
+    unique: dict[tuple[date, date, date], Observation] = {}
+    for row in rows:
+        unique.setdefault((row.date, row.realtime_start, row.realtime_end), row)
+    return sorted(unique.values(), key=lambda row: (row.date, row.realtime_start))
+
+
+def _is_transformed(params: Mapping[str, Any]) -> bool:
+    return params.get("units") not in (None, "lin") or params.get("frequency") is not None
+
+
+def _param_date(params: Mapping[str, Any], name: str) -> date | None:
+    value = params.get(name)
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
@@ -0,0 +1,283 @@
+"""Command line interface for fredtools."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+from .client import DEFAULT_BASE_URL, Fred, FredConfig, get_current_client
+from .logging import configure_logging, get_logger
+from .ratelimit import DEFAULT_MAX_CALLS, RateLimiter, SharedRateLimiter
+from .series import fetch_observation_columns
+
+logger = get_logger(__name__)
+
+CHECKPOINT_NAME = ".fredtools-checkpoint"
+OUTPUT_FORMATS = ("csv", "npz", "parquet")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="fredtools",
+        description="Tools for working with the FRED API.",
+    )
+    parser.add_argument(
+        "--log-level",
+        default=None,
+        help="Log level for fredtools loggers (default: FREDTOOLS_LOG_LEVEL or WARNING).",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    download = commands.add_parser(
+        "download",
+        help="Download observations for many series in parallel.",
+    )
+    download.add_argument(
+        "--ids",
+        required=True,
+        type=Path,
+        help="File with one series id per line ('-' for stdin). Blank lines and '#' comments are ignored.",
+    )
+    download.add_argument("--out", required=True, type=Path, help="Output directory.")
+    download.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (1 runs in-process).",
+    )
+    download.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="csv",
+        help="Output file format.",
+    )
+    download.add_argument(
+        "--rate-limit",
+        type=int,
+        default=DEFAULT_MAX_CALLS,
+        help="Maximum requests per minute shared by all workers.",
+    )
+    download.add_argument(
+        "--api-key",
+        default=os.environ.get("FRED_API_KEY"),
+        help="FRED API key (default: $FRED_API_KEY).",
+    )
+    download.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    download.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Ignore the checkpoint and download every id again.",
+    )
+    download.add_argument("--observation-start", type=date.fromisoformat)
+    download.add_argument("--observation-end", type=date.fromisoformat)
+    download.add_argument("--realtime-start", type=date.fromisoformat)
+    download.add_argument("--realtime-end", type=date.fromisoformat)
+    download.add_argument("--units")
+    download.add_argument("--frequency")
+    download.add_argument("--aggregation-method")
+    download.set_defaults(handler=_run_download)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.log_level:
+        configure_logging(args.log_level)
+    return args.handler(parser, args)
+
+
+def _run_download(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if not args.api_key:
+        parser.error("an API key is required: pass --api-key or set FRED_API_KEY")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    series_ids = _read_ids(args.ids)
+    out_dir: Path = args.out
+    out_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint = out_dir / CHECKPOINT_NAME
+    if args.no_resume:
+        checkpoint.unlink(missing_ok=True)
+    completed = _read_checkpoint(checkpoint)
+    todo = [series_id for series_id in series_ids if series_id not in completed]
+    skipped = len(series_ids) - len(todo)
+    if skipped:
+        logger.info("Skipping %s series already in %s", skipped, checkpoint)
+
+    params = {
+        "observation_start": _isoformat(args.observation_start),
+        "observation_end": _isoformat(args.observation_end),
+        "realtime_start": _isoformat(args.realtime_start),
+        "realtime_end": _isoformat(args.realtime_end),
+        "units": args.units,
+        "frequency": args.frequency,
+        "aggregation_method": args.aggregation_method,
+    }
+    failures = 0
+    with checkpoint.open("a", encoding="utf-8") as checkpoint_file:
+        for series_id, error in _download_all(
+            todo,
+            out_dir=out_dir,
+            output_format=args.format,
+            params=params,
+            workers=args.workers,
+            api_key=args.api_key,
+            base_url=args.base_url,
+            rate_limit=args.rate_limit,
+        ):
+            if error is None:
+                checkpoint_file.write(f"{series_id}\n")
+                checkpoint_file.flush()
+            else:
+                failures += 1
+                print(f"{series_id}: {error}", file=sys.stderr)
+
+    print(
+        f"Downloaded {len(todo) - failures} series, skipped {skipped}, "
+        f"failed {failures}.",
+        file=sys.stderr,
+    )
+    return 1 if failures else 0
+
+
+def _download_all(
+    series_ids: list[str],
+    *,
+    out_dir: Path,
+    output_format: str,
+    params: dict[str, Any],
+    workers: int,
+    api_key: str,
+    base_url: str,
+    rate_limit: int,
+) -> Iterable[tuple[str, str | None]]:
+    if workers == 1 or len(series_ids) <= 1:
+        _init_worker(api_key, base_url, RateLimiter(max_calls=rate_limit))
+        for series_id in series_ids:
+            yield series_id, _download_one(series_id, out_dir, output_format, params)
+        return
+
+    limiter = SharedRateLimiter(max_calls=rate_limit)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(api_key, base_url, limiter),
+    ) as executor:
+        futures = {
+            executor.submit(_download_one, series_id, out_dir, output_format, params): series_id
+            for series_id in series_ids
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _init_worker(api_key: str, base_url: str, limiter: RateLimiter) -> None:
+    Fred(FredConfig(api_key=api_key, base_url=base_url, rate_limiter=limiter))
+
+
+def _download_one(
+    series_id: str,
+    out_dir: Path,
+    output_format: str,
+    params: dict[str, Any],
+) -> str | None:
+    """Fetch, parse and write one series, returning an error message on failure."""
+    try:
+        client = get_current_client()
+        columns = fetch_observation_columns(client, {"series_id": series_id, **params})
+        _write_columns(columns, out_dir / f"{series_id}.{output_format}", output_format)
+    except Exception as exc:  # noqa: BLE001 - reported per series
+        logger.debug("Download failed for %s", series_id, exc_info=True)
+        return f"{type(exc).__name__}: {exc}"
+    return None
+
+
+def _write_columns(columns: dict[str, list], path: Path, output_format: str) -> None:
+    partial = path.with_name(f".{path.name}.partial")
+    if output_format == "csv":
+        with partial.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(("date", "value", "realtime_start", "realtime_end"))
+            for row in zip(
+                columns["date"],
+                columns["value"],
+                columns["realtime_start"],
+                columns["realtime_end"],
+            ):
+                writer.writerow(
+                    (
+                        row[0].isoformat(),
+                        "." if math.isnan(row[1]) else repr(row[1]),
+                        row[2].isoformat(),
+                        row[3].isoformat(),
+                    )
+                )
+    elif output_format == "npz":
+        try:
+            import numpy as np
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "numpy is required for npz output. Install it with "
+                "`pip install numpy`."
+            ) from exc
+        with partial.open("wb") as handle:
+            np.savez(
+                handle,
+                date=np.array(columns["date"], dtype="datetime64[D]"),
+                value=np.array(columns["value"], dtype="float64"),
+                realtime_start=np.array(columns["realtime_start"], dtype="datetime64[D]"),
+                realtime_end=np.array(columns["realtime_end"], dtype="datetime64[D]"),
+            )
+    elif output_format == "parquet":
+        try:
+            import pandas as pd
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "pandas and pyarrow are required for parquet output. Install "
+                "them with `pip install pandas pyarrow`."
+            ) from exc
+        pd.DataFrame(columns).to_parquet(partial, index=False)
+    else:
+        raise ValueError(f"Unsupported output format: {output_format!r}")
+    os.replace(partial, path)
+
+
+def _read_ids(path: Path) -> list[str]:
+    if str(path) == "-":
+        lines: Iterable[str] = sys.stdin
+    else:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    series_ids: list[str] = []
+    seen: set[str] = set()
+    for line in lines:
+        series_id = line.split("#", 1)[0].strip()
+        if series_id and series_id not in seen:
+            seen.add(series_id)
+            series_ids.append(series_id)
+    return series_ids
+
+
+def _read_checkpoint(path: Path) -> set[str]:
+    if not path.exists():
+        return set()
+    return {
+        line.strip()
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    }
+
+
+def _isoformat(value: date | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-import json
-from typing import Any, Callable, Mapping
+from dataclasses import dataclass, field
+from functools import partial
+import logging
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, Mapping, Sequence
 from urllib import parse as urlparse
-from urllib import request as urlrequest
 from contextvars import ContextVar
 
+from .compression import accept_encoding, decompressor_for, read_body
+from .decoders import Buffer, JsonDecoder, resolve_json_decoder
+from .instrumentation import RequestStats, _current_stats
 from .logging import get_logger
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .concurrency import ConcurrencyLimiter
+    from .hedging import HedgePolicy
+    from .instrumentation import RequestHook
+    from .ratelimit import RateLimiter
+    from .schemas import Schema
+
 _current_client: ContextVar[Fred | None] = ContextVar(
     "_current_client",
     default=None,
@@ -46,18 +60,90 @@ def get_current_client() -> Fred:
 
 
 DEFAULT_BASE_URL = "https://api.stlouisfed.org/fred"
+DEFAULT_MAP_WORKERS = 8
+_REDACTED = "REDACTED"
+_SECRET_PARAMS = frozenset({"api_key"})
 
 
 Transport = Callable[[str, Mapping[str, Any], float | None], Any]
 
 
+@dataclass(slots=True)
+class RawResponse:
+    """Undecoded response returned by a :data:`ByteTransport`.
+
+    ``body`` is a bytes-like object (``bytes``, ``bytearray`` or
+    ``memoryview``) or a binary stream. ``content_encoding`` defaults to
+    the ``Content-Encoding`` header; ``wire_bytes`` is the size on the wire
+    when the transport knows it.
+    """
+
+    body: Buffer | BinaryIO
+    headers: Mapping[str, str] = field(default_factory=dict)
+    wire_bytes: int | None = None
+    content_encoding: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.content_encoding is None:
+            self.content_encoding = _header(self.headers, "Content-Encoding")
+
+    def buffer(self) -> Buffer:
+        """Return the decompressed body, reading a stream to the end first.
+
+        Uncompressed bytes-like bodies are returned as is, without copying.
+        """
+        encoding = (self.content_encoding or "identity").strip().lower()
+        if isinstance(self.body, (bytes, bytearray, memoryview)):
+            if encoding != "identity":
+                decompressor = decompressor_for(encoding)
+                self.body = decompressor.decompress(self.body) + decompressor.flush()
+        else:
+            self.body, wire_bytes = read_body(self.body, encoding)
+            if self.wire_bytes is None:
+                self.wire_bytes = wire_bytes
+        self.content_encoding = "identity"
+        return self.body
+
+
+ByteTransport = Callable[[str, Mapping[str, Any], float | None], RawResponse]
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    value = headers.get(name)
+    if value is not None:
+        return value
+    lowered = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lowered:
+            return value
+    return None
+
+
 @dataclass(slots=True)
 class FredConfig:
-    """Configuration for the FRED client."""
+    """Configuration for the FRED client.
+
+    Set at most one of ``transport`` (returns decoded JSON) and
+    ``byte_transport`` (returns a :class:`RawResponse` for fredtools to
+    decode); by default fredtools uses its own urllib byte transport.
+
+    Byte bodies are decoded with ``json_decoder``, except that while it is
+    ``"auto"`` or ``"msgspec"`` endpoints with a schema (see
+    :mod:`fredtools.schemas`) decode straight into dataclasses instead.
+    Naming another decoder turns schema decoding off.
+    """
 
     api_key: str
     base_url: str = DEFAULT_BASE_URL
     transport: Transport | None = None
+    byte_transport: ByteTransport | None = None
+    rate_limiter: RateLimiter | None = None
+    hooks: Sequence[RequestHook] = ()
+    compression: bool = True
+    json_decoder: str | JsonDecoder = "auto"
+    max_concurrency: int | None = None
+    concurrency_limiter: ConcurrencyLimiter | None = None
+    hedging: HedgePolicy | None = None
 
 
 class Fred:
@@ -68,26 +154,118 @@ class Fred:
         config: FredConfig,
         register_default: bool = True,
     ) -> None:
+        if config.transport is not None and config.byte_transport is not None:
+            raise ValueError("Configure either transport or byte_transport, not both")
         self._config = config
         self._base_url = self._config.base_url.rstrip("/")
+        self.hooks: tuple[RequestHook, ...] = tuple(self._config.hooks)
+        self._decode = resolve_json_decoder(self._config.json_decoder)
+        if config.max_concurrency is not None and config.concurrency_limiter is not None:
+            raise ValueError("Configure either max_concurrency or concurrency_limiter, not both")
+        self.concurrency_limiter: ConcurrencyLimiter | None = config.concurrency_limiter
+        if self._config.max_concurrency is not None:
+            from .concurrency import ConcurrencyLimiter
+
+            self.concurrency_limiter = ConcurrencyLimiter(self._config.max_concurrency)
+        self._hedge_executor: Executor | None = None
+        self._hedge_executor_lock = threading.Lock()
         if register_default:
             set_default_client(self)
 
-    def _default_transport(
+    def _default_byte_transport(
         self,
         url: str,
         params: Mapping[str, Any],
         timeout: float | None = None,
-    ) -> Any:
+    ) -> RawResponse:
         query_string = urlparse.urlencode(params)
         full_url = f"{url}?{query_string}"
-        with urlrequest.urlopen(full_url, timeout=timeout) as response:
-            return json.load(response)
+        headers = {}
+        if self._config.compression:
+            headers["Accept-Encoding"] = accept_encoding()
+        from urllib import request as urlrequest
+
+        request = urlrequest.Request(full_url, headers=headers)
+        with urlrequest.urlopen(request, timeout=timeout) as response:
+            body, wire_bytes = read_body(
+                response,
+                response.headers.get("Content-Encoding"),
+            )
+            return RawResponse(
+                body,
+                headers=dict(response.headers.items()),
+                wire_bytes=wire_bytes,
+                content_encoding="identity",
+            )
+
+    @property
+    def supports_raw(self) -> bool:
+        """Whether :meth:`request_raw` can fetch undecoded responses."""
+        return self._raw_transport() is not None
 
-    def _get_transport(self) -> Transport:
+    def _raw_transport(self) -> ByteTransport | None:
+        transport = self._config.transport
+        if transport is None:
+            return self._config.byte_transport or self._default_byte_transport
+        # Transports such as Http2Transport also expose their byte form.
+        raw = getattr(transport, "raw", None)
+        return raw if callable(raw) else None
+
+    def _get_byte_transport(self) -> ByteTransport:
+        transport = self._raw_transport()
+        if transport is None:
+            raise RuntimeError(
+                "Raw responses need a byte transport; this client is "
+                "configured with a decoded-object transport that has no "
+                "raw() method. Configure FredConfig.byte_transport instead."
+            )
+        return transport
+
+    def _default_transport(
+        self,
+        url: str,
+        params: Mapping[str, Any],
+        timeout: float | None = None,
+        decode: JsonDecoder | None = None,
+    ) -> Any:
+        decode = decode or self._decode
+        raw = self._get_byte_transport()(url, params, timeout)
+        body = raw.buffer()
+        stats = _current_stats.get()
+        if stats is None:
+            return decode(body)
+        started = perf_counter()
+        decoded = decode(body)
+        stats.decode_time = perf_counter() - started
+        stats.bytes_received = memoryview(body).nbytes
+        stats.compressed_bytes = raw.wire_bytes
+        return decoded
+
+    def schema_for(self, endpoint: str) -> Schema | None:
+        """Return the schema :meth:`request` can decode ``endpoint`` with.
+
+        ``None`` when msgspec is missing, the endpoint has no schema, a
+        decoded-object ``transport`` is configured (its bodies are already
+        decoded) or ``json_decoder`` names a decoder other than msgspec.
+        """
         if self._config.transport is not None:
-            return self._config.transport
-        return self._default_transport
+            return None
+        if self._config.json_decoder not in ("auto", "msgspec"):
+            return None
+        from .schemas import get_schema
+
+        return get_schema(endpoint)
+
+    def _get_transport(self, schema: Schema | None = None) -> Transport:
+        transport = self._config.transport
+        if schema is None:
+            return transport if transport is not None else self._default_transport
+        if transport is not None:
+            raise ValueError(
+                "Schemas decode raw bytes and cannot be used with a "
+                "decoded-object transport; check Fred.schema_for first"
+            )
+        return partial(self._default_transport, decode=schema.decode)
 
     def _build_url(self, endpoint: str) -> str:
         endpoint = endpoint.lstrip("/")
@@ -113,16 +291,219 @@ class Fred:
         endpoint: str,
         params: Mapping[str, Any] | None = None,
         timeout: float | None = None,
+        schema: Schema | None = None,
+    ) -> Any:
+        """Call ``endpoint`` and return the decoded response.
+
+        With a ``schema`` from :meth:`schema_for` the body decodes
+        straight into typed objects instead of plain dicts.
+        """
+        return self._send(endpoint, params, timeout, self._get_transport(schema))
+
+    def request_raw(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> RawResponse:
+        """Call ``endpoint`` and return the undecoded :class:`RawResponse`.
+
+        Rate limiting and hooks apply as for :meth:`request`. With a
+        decoded ``FredConfig.transport`` this uses its ``raw`` method, such
+        as :meth:`Http2Transport.raw`, and raises ``RuntimeError`` if it
+        has none.
+        """
+        return self._send(endpoint, params, timeout, self._get_byte_transport())
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_workers: int | None = None,
+    ) -> list[Any]:
+        """Call ``fn`` on every item from worker threads bound to this client.
+
+        Workers run with this client current and the caller's context
+        variables copied in, so model methods such as
+        ``Series.observations`` work unchanged. Requests still go through
+        this client's transport, rate limiter and concurrency limit. Returns
+        results in input order and re-raises the first failure.
+        """
+        with self.executor(max_workers) as executor:
+            return list(executor.map(fn, items))
+
+    def executor(self, max_workers: int | None = None) -> Executor:
+        """Return a context-propagating thread pool bound to this client."""
+        from .concurrency import ContextThreadPoolExecutor
+
+        if max_workers is None:
+            limiter = self.concurrency_limiter
+            max_workers = limiter.max_limit if limiter is not None else DEFAULT_MAP_WORKERS
+        return ContextThreadPoolExecutor(max_workers=max_workers, client=self)
+
+    def _call_transport(
+        self,
+        endpoint: str,
+        transport: Transport | ByteTransport,
+        url: str,
+        params: dict[str, Any],
+        timeout: float | None,
+    ) -> Any:
+        policy = self._config.hedging
+        if policy is None or not policy.applies_to(endpoint):
+            return self._limited_call(transport, url, params, timeout)
+        from .hedging import hedged_call
+
+        stats = _current_stats.get()
+
+        def on_hedge(won: bool) -> None:
+            if stats is not None:
+                stats.extra["hedged"] = True
+                stats.extra["hedge_won"] = won
+
+        return hedged_call(
+            policy,
+            self._get_hedge_executor(policy),
+            endpoint.strip("/"),
+            partial(self._limited_call, transport, url, params, timeout),
+            rate_limiter=self._config.rate_limiter,
+            on_hedge=on_hedge,
+        )
+
+    def close(self) -> None:
+        """Shut down the hedging thread pool; transports stay open.
+
+        Configured transports belong to the caller, who closes them. The
+        client stays usable and starts a new pool if it hedges again.
+        """
+        with self._hedge_executor_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> Fred:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _get_hedge_executor(self, policy: HedgePolicy) -> Executor:
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None:
+                from .concurrency import ContextThreadPoolExecutor
+
+                self._hedge_executor = ContextThreadPoolExecutor(
+                    max_workers=policy.max_workers,
+                    thread_name_prefix="fredtools-hedge",
+                )
+            return self._hedge_executor
+
+    def _limited_call(
+        self,
+        transport: Transport | ByteTransport,
+        url: str,
+        params: dict[str, Any],
+        timeout: float | None,
+    ) -> Any:
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return transport(url, params, timeout)
+        limiter.acquire()
+        started = perf_counter()
+        try:
+            result = transport(url, params, timeout)
+        except BaseException as exc:
+            limiter.release(error=exc)
+            raise
+        limiter.release(latency=perf_counter() - started)
+        return result
+
+    def _send(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any] | None,
+        timeout: float | None,
+        transport: Transport | ByteTransport,
     ) -> Any:
         url = self._build_url(endpoint)
         prepared_params = self._build_params(params)
-        transport = self._get_transport()
-        scrubbed_params = dict(prepared_params)
-        query_string = urlparse.urlencode(scrubbed_params)
-        scrubbed_url = f"{url}?{query_string}" if query_string else url
-        logger.info(
-            "Requesting %s timeout=%s",
-            scrubbed_url,
-            timeout,
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Requesting %s timeout=%s",
+                _ScrubbedURL(url, prepared_params),
+                timeout,
+                extra={"fred_endpoint": endpoint},
+            )
+        if self.hooks:
+            return self._instrumented_request(
+                endpoint, url, prepared_params, timeout, transport
+            )
+        if self._config.rate_limiter is not None:
+            self._config.rate_limiter.acquire()
+        return self._call_transport(endpoint, transport, url, prepared_params, timeout)
+
+    def _instrumented_request(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict[str, Any],
+        timeout: float | None,
+        transport: Transport | ByteTransport,
+    ) -> Any:
+        stats = RequestStats(
+            endpoint=endpoint.strip("/"),
+            params=params,
+            started=perf_counter(),
+        )
+        tokens = []
+        for hook in self.hooks:
+            try:
+                tokens.append(hook.on_request_start(stats))
+            except Exception:  # noqa: BLE001 - hooks must not break requests
+                logger.exception("Instrumentation hook %r failed", hook)
+                tokens.append(None)
+        context_token = _current_stats.set(stats)
+        try:
+            if self._config.rate_limiter is not None:
+                stats.rate_limit_wait = self._config.rate_limiter.acquire()
+            return self._call_transport(endpoint, transport, url, params, timeout)
+        except BaseException as exc:
+            stats.error = exc
+            raise
+        finally:
+            stats.latency = (
+                perf_counter() - stats.started - stats.rate_limit_wait
+            )
+            _current_stats.reset(context_token)
+            for hook, token in zip(self.hooks, tokens):
+                try:
+                    hook.on_request_end(stats, token)
+                except Exception:  # noqa: BLE001 - hooks must not break requests
+                    logger.exception("Instrumentation hook %r failed", hook)
+
+
+class _ScrubbedURL:
+    """Log argument that renders a request URL with secrets redacted.
+
+    The query string is only built when a handler formats the record.
+    """
+
+    __slots__ = ("url", "params")
+
+    def __init__(self, url: str, params: Mapping[str, Any]) -> None:
+        self.url = url
+        self.params = params
+
+    def __str__(self) -> str:
+        if not self.params:
+            return self.url
+        query_string = urlparse.urlencode(
+            {
+                key: _REDACTED if key in _SECRET_PARAMS else value
+                for key, value in self.params.items()
+            },
+            safe=";",
         )
-        return transport(url, prepared_params, timeout)
+        return f"{self.url}?{query_string}"
+
+    __repr__ = __str__
@@ -0,0 +1,139 @@
+"""HTTP content-encoding negotiation and streaming decompression."""
+
+from __future__ import annotations
+
+import zlib
+from functools import lru_cache
+from typing import Any, BinaryIO, Protocol
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Decompressor(Protocol):
+    def decompress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _Identity:
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _Deflate:
+    """Accepts zlib-wrapped and raw deflate, which servers use interchangeably."""
+
+    def __init__(self) -> None:
+        self._decompressor: Any = None
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._decompressor is None:
+            try:
+                self._decompressor = zlib.decompressobj()
+                return self._decompressor.decompress(data)
+            except zlib.error:
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._decompressor.flush() if self._decompressor is not None else b""
+
+
+class _Brotli:
+    def __init__(self, module: Any) -> None:
+        self._decompressor = module.Decompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        process = getattr(self._decompressor, "process", None)
+        if process is not None:
+            return process(data)
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _Zstd:
+    def __init__(self, module: Any) -> None:
+        if module.__name__ == "zstandard":
+            self._decompressor = module.ZstdDecompressor().decompressobj()
+        else:
+            self._decompressor = module.ZstdDecompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        flush = getattr(self._decompressor, "flush", None)
+        return flush() if flush is not None else b""
+
+
+def _import_first(*names: str) -> Any:
+    for name in names:
+        try:
+            return __import__(name, fromlist=["_"])
+        except ImportError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=None)
+def _brotli_module() -> Any:
+    return _import_first("brotli", "brotlicffi")
+
+
+@lru_cache(maxsize=None)
+def _zstd_module() -> Any:
+    return _import_first("compression.zstd", "zstandard")
+
+
+@lru_cache(maxsize=None)
+def accept_encoding() -> str:
+    """Return the ``Accept-Encoding`` value for the codecs available here."""
+    encodings = ["gzip", "deflate"]
+    if _brotli_module() is not None:
+        encodings.append("br")
+    if _zstd_module() is not None:
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+def decompressor_for(encoding: str | None) -> Decompressor:
+    """Return a streaming decompressor for a ``Content-Encoding`` value."""
+    name = (encoding or "identity").strip().lower()
+    if name in ("identity", ""):
+        return _Identity()
+    if name in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if name == "deflate":
+        return _Deflate()
+    if name == "br" and _brotli_module() is not None:
+        return _Brotli(_brotli_module())
+    if name == "zstd" and _zstd_module() is not None:
+        return _Zstd(_zstd_module())
+    raise ValueError(f"Unsupported Content-Encoding: {encoding!r}")
+
+
+def read_body(
+    stream: BinaryIO,
+    encoding: str | None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[bytes, int]:
+    """Read and decode ``stream`` chunk by chunk.
+
+    Returns the decompressed body and the number of bytes read off the wire.
+    """
+    decoder = decompressor_for(encoding)
+    parts: list[bytes] = []
+    wire_bytes = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        wire_bytes += len(chunk)
+        parts.append(decoder.decompress(chunk))
+    parts.append(decoder.flush())
+    return b"".join(parts), wire_bytes
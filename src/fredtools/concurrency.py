@@ -0,0 +1,222 @@
+"""Context-aware thread pools and request concurrency limits."""
+
+from __future__ import annotations
+
+import contextvars
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from .client import set_default_client
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from .client import Fred
+    from .instrumentation import MetricsCollector
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool whose tasks run in a copy of the submitting context.
+
+    A plain ``ThreadPoolExecutor`` starts every task with an empty context,
+    so ``get_current_client()`` fails in workers. Here each task sees the
+    context variables set where it was submitted; passing ``client`` also
+    makes that client current inside every task.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        client: Fred | None = None,
+        **kwargs: Any,
+    ) -> None:
+        kwargs.setdefault("thread_name_prefix", "fredtools")
+        super().__init__(max_workers=max_workers, **kwargs)
+        self.client = client
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        context = contextvars.copy_context()
+        if self.client is not None:
+            context.run(set_default_client, self.client)
+        return super().submit(context.run, fn, *args, **kwargs)
+
+
+class ConcurrencyLimiter:
+    """Caps how many requests one client has in flight at once.
+
+    Fred acquires a slot around each transport call and reports the outcome
+    to :meth:`release`; callers beyond ``limit`` block until a slot frees
+    up. Also usable as a context manager.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self._limit = limit
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def max_limit(self) -> int:
+        """Upper bound ``limit`` can reach; sizes worker pools."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(
+        self,
+        latency: float | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def __enter__(self) -> ConcurrencyLimiter:
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release(error=exc)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(limit={self.limit}, in_flight={self.in_flight})"
+
+
+OVERLOAD_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def response_status(error: BaseException) -> int | None:
+    """Return the HTTP status carried by a transport error, if any.
+
+    Understands ``urllib.error.HTTPError`` (``code``), httpx errors
+    (``response.status_code``) and anything with a ``status`` attribute.
+    """
+    for value in (
+        getattr(error, "code", None),
+        getattr(getattr(error, "response", None), "status_code", None),
+        getattr(error, "status", None),
+    ):
+        if isinstance(value, int):
+            return value
+    return None
+
+
+class AdaptiveConcurrencyLimiter(ConcurrencyLimiter):
+    """Concurrency limit tuned by additive increase, multiplicative decrease.
+
+    Each successful request adds ``increase / limit``, so the limit grows
+    by about ``increase`` per round of requests while responses stay
+    healthy. A 429/5xx response or a latency above ``latency_tolerance``
+    times the smoothed latency multiplies the limit by ``decrease``, at
+    most once per ``cooldown`` seconds. The limit stays within
+    ``min_limit`` and ``max_limit`` and, given a ``MetricsCollector``, is
+    published as the ``gauge_name`` gauge.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 3.0,
+        smoothing: float = 0.1,
+        cooldown: float = 1.0,
+        metrics: MetricsCollector | None = None,
+        gauge_name: str = "concurrency_limit",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial <= max_limit")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        super().__init__(initial)
+        self.min_limit = min_limit
+        self._max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.cooldown = cooldown
+        self.metrics = metrics
+        self.gauge_name = gauge_name
+        self._clock = clock
+        self._estimate = float(initial)
+        self._smoothed_latency: float | None = None
+        self._last_decrease = -math.inf
+        self._publish()
+
+    @property
+    def max_limit(self) -> int:
+        return self._max_limit
+
+    def release(
+        self,
+        latency: float | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if error is not None:
+                status = response_status(error)
+                if status in OVERLOAD_STATUSES:
+                    self._back_off(f"HTTP {status}")
+            elif latency is not None:
+                self._observe(latency)
+            self._condition.notify_all()
+
+    def _observe(self, latency: float) -> None:
+        smoothed = self._smoothed_latency
+        if smoothed is not None and latency > self.latency_tolerance * smoothed:
+            self._back_off(f"latency {latency:.3f}s")
+        else:
+            self._estimate = min(
+                float(self._max_limit),
+                self._estimate + self.increase / max(self._estimate, 1.0),
+            )
+            self._apply()
+        if smoothed is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency = smoothed + self.smoothing * (latency - smoothed)
+
+    def _back_off(self, reason: str) -> None:
+        now = self._clock()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._estimate = max(float(self.min_limit), self._estimate * self.decrease)
+        logger.debug("Concurrency limit reduced to %d after %s", int(self._estimate), reason)
+        self._apply()
+
+    def _apply(self) -> None:
+        limit = max(self.min_limit, int(self._estimate))
+        if limit != self._limit:
+            self._limit = limit
+            self._publish()
+
+    def _publish(self) -> None:
+        if self.metrics is not None:
+            self.metrics.set_gauge(self.gauge_name, self._limit)
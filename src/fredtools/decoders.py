@@ -0,0 +1,63 @@
+"""JSON decoder backends for response bodies."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+Buffer = bytes | bytearray | memoryview
+JsonDecoder = Callable[[Buffer], Any]
+
+# Tried in order by ``resolve_json_decoder("auto")``.
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _load_backend(name: str) -> JsonDecoder:
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads
+    if name == "msgspec":
+        import msgspec
+
+        return msgspec.json.Decoder().decode
+    if name == "json":
+        return _stdlib_loads
+    raise ValueError(f"Unknown JSON decoder {name!r}; expected one of {BACKENDS} or 'auto'")
+
+
+def _stdlib_loads(body: Buffer) -> Any:
+    # json.loads takes bytes but not other buffers.
+    return json.loads(body if isinstance(body, (bytes, bytearray)) else bytes(body))
+
+
+def available_backends() -> list[str]:
+    """Return the names of the decoder backends importable here."""
+    names = []
+    for name in BACKENDS:
+        try:
+            _load_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def resolve_json_decoder(decoder: str | JsonDecoder = "auto") -> JsonDecoder:
+    """Turn a backend name, ``"auto"`` or a callable into a bytes decoder.
+
+    ``"auto"`` picks the fastest installed backend: orjson, then msgspec,
+    then the standard library. Decoders take ``bytes``, ``bytearray`` or
+    ``memoryview`` bodies; naming a backend that is not installed raises
+    ``RuntimeError``.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == "auto":
+        return _load_backend(available_backends()[0])
+    try:
+        return _load_backend(decoder)
+    except ImportError as exc:
+        raise RuntimeError(
+            f"{decoder} is not installed. Install it with `pip install {decoder}`."
+        ) from exc
@@ -0,0 +1,182 @@
+"""Hedged requests: race a duplicate against a slow response."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Collection
+
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .ratelimit import RateLimiter
+
+logger = get_logger(__name__)
+
+
+class HedgePolicy:
+    """When and how often ``Fred.request`` may send a duplicate request.
+
+    If a response takes longer than the ``percentile`` of recent latencies
+    for its endpoint (never less than ``min_delay``), one duplicate is sent
+    and whichever answers first wins. Until ``min_samples`` latencies have
+    been seen, requests are not hedged unless a fixed ``delay`` is given.
+    Every request earns ``budget`` hedge tokens (up to ``burst``) and a
+    hedge spends one, so duplicates stay below that share of traffic.
+    ``endpoints`` limits hedging to the listed endpoints.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        *,
+        delay: float | None = None,
+        min_delay: float = 0.01,
+        budget: float = 0.05,
+        burst: float = 10.0,
+        window: int = 500,
+        min_samples: int = 20,
+        endpoints: Collection[str] | None = None,
+        max_workers: int = 64,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+        self.percentile = percentile
+        self.delay = delay
+        self.min_delay = min_delay
+        self.budget = budget
+        self.burst = burst
+        self.window = window
+        self.min_samples = min_samples
+        self.endpoints = (
+            None if endpoints is None else frozenset(e.strip("/") for e in endpoints)
+        )
+        self.max_workers = max_workers
+        self.hedges_sent = 0
+        self._tokens = burst
+        self._latencies: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def applies_to(self, endpoint: str) -> bool:
+        return self.endpoints is None or endpoint.strip("/") in self.endpoints
+
+    def delay_for(self, endpoint: str) -> float | None:
+        """Return how long to wait before hedging, or ``None`` to not hedge."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            samples = self._latencies.get(endpoint)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def record(self, endpoint: str, latency: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(endpoint)
+            if samples is None:
+                samples = self._latencies[endpoint] = deque(maxlen=self.window)
+            samples.append(latency)
+            self._tokens = min(self.burst, self._tokens + self.budget)
+
+    def try_spend(self) -> bool:
+        """Take one hedge from the budget; ``False`` when it is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedges_sent += 1
+            return True
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(percentile={self.percentile}, "
+            f"budget={self.budget}, hedges_sent={self.hedges_sent})"
+        )
+
+
+def hedged_call(
+    policy: HedgePolicy,
+    executor: Executor,
+    endpoint: str,
+    call: Callable[[], Any],
+    rate_limiter: RateLimiter | None = None,
+    on_hedge: Callable[[bool], None] | None = None,
+) -> Any:
+    """Run ``call``, racing a duplicate against it once the policy's delay passes.
+
+    While the policy has no delay yet, ``call`` runs inline. The delay and
+    the recorded latency count from when the primary starts running, not
+    from submission, so time queued in ``executor`` never triggers a hedge.
+    The duplicate waits on ``rate_limiter`` like any other request. The
+    first successful result wins; if every attempt fails, the primary's
+    error is raised. ``on_hedge(won)`` is told whether a hedge was sent
+    and won.
+    """
+    delay = policy.delay_for(endpoint)
+    if delay is None:
+        started = perf_counter()
+        result = call()
+        policy.record(endpoint, perf_counter() - started)
+        return result
+
+    began = threading.Event()
+    started = 0.0
+
+    def _primary() -> Any:
+        nonlocal started
+        started = perf_counter()
+        began.set()
+        return call()
+
+    def _record(future: Future[Any]) -> None:
+        began.set()
+        if not future.cancelled() and future.exception() is None:
+            policy.record(endpoint, perf_counter() - started)
+
+    primary = executor.submit(_primary)
+    primary.add_done_callback(_record)
+    began.wait()
+    try:
+        return primary.result(timeout=max(0.0, started + delay - perf_counter()))
+    except FutureTimeoutError:
+        pass
+    if not policy.try_spend():
+        return primary.result()
+
+    settled = threading.Event()
+
+    def _hedge() -> Any:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        if settled.is_set():
+            # The primary answered while this attempt waited for its turn.
+            raise CancelledError()
+        return call()
+
+    logger.debug("Hedging %s after %.3fs", endpoint, delay)
+    hedge = executor.submit(_hedge)
+    attempts: set[Future[Any]] = {primary, hedge}
+    while attempts:
+        done, attempts = wait(attempts, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                # Losers that have not started are dropped; one already
+                # sending finishes in the background and is ignored.
+                settled.set()
+                for loser in attempts:
+                    loser.cancel()
+                if on_hedge is not None:
+                    on_hedge(future is hedge)
+                return future.result()
+    if on_hedge is not None:
+        on_hedge(False)
+    return primary.result()
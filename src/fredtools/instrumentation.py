@@ -0,0 +1,270 @@
+"""Request instrumentation hooks and in-process metrics."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, ContextManager, Iterator, Mapping, Protocol, Sequence
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class RequestStats:
+    """Measurements collected while a single request is in flight.
+
+    Fred fills in timing and rate-limit fields. Transports may report
+    ``bytes_received`` (decoded body size), ``compressed_bytes`` (size on
+    the wire), ``decode_time``, ``retries`` and ``cache_hit`` on the object
+    returned by :func:`current_request_stats`.
+    """
+
+    endpoint: str
+    params: Mapping[str, Any]
+    started: float
+    latency: float | None = None
+    rate_limit_wait: float = 0.0
+    bytes_received: int | None = None
+    compressed_bytes: int | None = None
+    decode_time: float | None = None
+    retries: int = 0
+    cache_hit: bool = False
+    error: BaseException | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+class RequestHook(Protocol):
+    """Callbacks invoked around every ``Fred.request`` call.
+
+    ``on_request_start`` may return a token that is passed back to
+    ``on_request_end``; ``on_parse`` reports time spent turning a response
+    into fredtools objects.
+    """
+
+    def on_request_start(self, stats: RequestStats) -> Any: ...
+
+    def on_request_end(self, stats: RequestStats, token: Any) -> None: ...
+
+    def on_parse(self, endpoint: str, seconds: float) -> None: ...
+
+
+_current_stats: ContextVar[RequestStats | None] = ContextVar(
+    "_current_request_stats",
+    default=None,
+)
+
+
+def current_request_stats() -> RequestStats | None:
+    """Return the stats of the instrumented request running in this context."""
+    return _current_stats.get()
+
+
+def measure_parse(client: Any, endpoint: str) -> ContextManager[None]:
+    """Time a parse step and report it to ``client``'s hooks, if any."""
+    hooks = getattr(client, "hooks", ())
+    if not hooks:
+        return nullcontext()
+    return _timed_parse(hooks, endpoint)
+
+
+@contextmanager
+def _timed_parse(hooks: Sequence[RequestHook], endpoint: str) -> Iterator[None]:
+    started = perf_counter()
+    yield
+    elapsed = perf_counter() - started
+    for hook in hooks:
+        try:
+            hook.on_parse(endpoint, elapsed)
+        except Exception:  # noqa: BLE001 - hooks must not break requests
+            logger.exception("Instrumentation hook %r failed in on_parse", hook)
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum, min and max."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": dict(zip((*self.buckets, float("inf")), self.counts)),
+        }
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+
+
+class _EndpointMetrics:
+    def __init__(self) -> None:
+        self.counters = {
+            "requests": 0,
+            "errors": 0,
+            "cache_hits": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "bytes_received": 0,
+            "compressed_bytes": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+        }
+        self.histograms = {
+            "latency": Histogram(LATENCY_BUCKETS),
+            "decode_time": Histogram(LATENCY_BUCKETS),
+            "parse_time": Histogram(LATENCY_BUCKETS),
+            "rate_limit_wait": Histogram(LATENCY_BUCKETS),
+            "bytes_received": Histogram(BYTES_BUCKETS),
+        }
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "counters": dict(self.counters),
+            "histograms": {
+                name: histogram.snapshot()
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+
+class MetricsCollector:
+    """Request hook that aggregates counters and histograms per endpoint."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, _EndpointMetrics] = {}
+        self._gauges: dict[str, float] = {}
+
+    def on_request_start(self, stats: RequestStats) -> None:
+        return None
+
+    def on_request_end(self, stats: RequestStats, token: Any) -> None:
+        with self._lock:
+            metrics = self._metrics(stats.endpoint)
+            counters = metrics.counters
+            histograms = metrics.histograms
+            counters["requests"] += 1
+            counters["retries"] += stats.retries
+            if stats.error is not None:
+                counters["errors"] += 1
+            if stats.cache_hit:
+                counters["cache_hits"] += 1
+            if stats.latency is not None:
+                histograms["latency"].observe(stats.latency)
+            if stats.rate_limit_wait:
+                counters["rate_limited"] += 1
+                histograms["rate_limit_wait"].observe(stats.rate_limit_wait)
+            if stats.decode_time is not None:
+                histograms["decode_time"].observe(stats.decode_time)
+            if stats.bytes_received is not None:
+                counters["bytes_received"] += stats.bytes_received
+                histograms["bytes_received"].observe(stats.bytes_received)
+            if stats.compressed_bytes is not None:
+                counters["compressed_bytes"] += stats.compressed_bytes
+            if stats.extra.get("hedged"):
+                counters["hedged"] += 1
+                counters["hedge_wins"] += bool(stats.extra.get("hedge_won"))
+
+    def on_parse(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            self._metrics(endpoint).histograms["parse_time"].observe(seconds)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a plain-dict copy of all metrics, keyed by endpoint."""
+        with self._lock:
+            return {
+                "endpoints": {
+                    endpoint: metrics.snapshot()
+                    for endpoint, metrics in self._endpoints.items()
+                },
+                "gauges": dict(self._gauges),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._gauges.clear()
+
+    def _metrics(self, endpoint: str) -> _EndpointMetrics:
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = _EndpointMetrics()
+        return metrics
+
+
+class OpenTelemetryHook:
+    """Request hook that opens one span per request on an OpenTelemetry tracer.
+
+    Any object with a ``start_span(name, attributes=...)`` method returning a
+    span with ``set_attribute``, ``record_exception`` and ``end`` works, so
+    the ``opentelemetry`` package is only needed by the caller.
+    """
+
+    def __init__(self, tracer: Any, span_name: str = "fred.request") -> None:
+        self.tracer = tracer
+        self.span_name = span_name
+
+    def on_request_start(self, stats: RequestStats) -> Any:
+        return self.tracer.start_span(
+            self.span_name,
+            attributes={"fred.endpoint": stats.endpoint},
+        )
+
+    def on_request_end(self, stats: RequestStats, token: Any) -> None:
+        span = token
+        if stats.latency is not None:
+            span.set_attribute("fred.latency_s", stats.latency)
+        if stats.rate_limit_wait:
+            span.set_attribute("fred.rate_limit_wait_s", stats.rate_limit_wait)
+        if stats.bytes_received is not None:
+            span.set_attribute("fred.bytes_received", stats.bytes_received)
+        if stats.compressed_bytes is not None:
+            span.set_attribute("fred.compressed_bytes", stats.compressed_bytes)
+        if stats.decode_time is not None:
+            span.set_attribute("fred.decode_time_s", stats.decode_time)
+        if stats.retries:
+            span.set_attribute("fred.retries", stats.retries)
+        if stats.cache_hit:
+            span.set_attribute("fred.cache_hit", True)
+        if stats.error is not None:
+            span.record_exception(stats.error)
+        span.end()
+
+    def on_parse(self, endpoint: str, seconds: float) -> None:
+        return None
+
+
+__all__ = [
+    "Histogram",
+    "MetricsCollector",
+    "OpenTelemetryHook",
+    "RequestHook",
+    "RequestStats",
+    "current_request_stats",
+    "measure_parse",
+]
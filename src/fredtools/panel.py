@@ -0,0 +1,234 @@
+"""Align many observation series into one wide panel."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Sequence
+
+from .types import ObservationsResult
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+Columns = Mapping[str, Sequence]
+
+JOINS = ("outer", "inner")
+FILLS = (None, "ffill")
+
+
+@dataclass
+class PanelFrame:
+    """Aligned observations stored as one contiguous row-major float buffer.
+
+    ``values`` holds ``len(dates) * len(names)`` doubles; the value of
+    series ``j`` on ``dates[i]`` is at ``i * len(names) + j``.
+    """
+
+    names: list[str]
+    dates: list[date]
+    values: array
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.dates), len(self.names)
+
+    def column(self, name: str) -> list[float]:
+        width = len(self.names)
+        return list(self.values[self.names.index(name) :: width])
+
+    def to_numpy(self) -> "np.ndarray":
+        """Return a 2-D ``float64`` view of :attr:`values` without copying."""
+        try:
+            import numpy as np
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "numpy is required for to_numpy(). Install it with "
+                "`pip install numpy`."
+            ) from exc
+        return np.frombuffer(self.values, dtype=np.float64).reshape(self.shape)
+
+    @property
+    def df(self) -> "pd.DataFrame":
+        try:
+            import pandas as pd
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "pandas is required to access .df. Install it with "
+                "`pip install pandas`."
+            ) from exc
+        return pd.DataFrame(
+            self.to_numpy(),
+            index=pd.DatetimeIndex(self.dates, name="date"),
+            columns=self.names,
+            copy=False,
+        )
+
+
+class Panel:
+    """Collects observation results and aligns them on a shared date index.
+
+    Accepts :class:`ObservationsResult` objects or the column mappings
+    produced by :meth:`Series.observation_columns`.
+    """
+
+    def __init__(
+        self,
+        results: Mapping[str, ObservationsResult | Columns] | None = None,
+    ) -> None:
+        self._results: dict[str, ObservationsResult | Columns] = {}
+        for name, result in (results or {}).items():
+            self.add(name, result)
+
+    def add(self, name: str, result: ObservationsResult | Columns) -> Panel:
+        if name in self._results:
+            raise ValueError(f"Panel already has a series named {name!r}")
+        self._results[name] = result
+        return self
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._results)
+
+    def build(self, how: str = "outer", fill: str | None = None) -> PanelFrame:
+        """Align every series in a single pass.
+
+        With numpy installed the alignment is vectorized and writes straight
+        into the frame's buffer; otherwise a pure-Python loop does the same.
+        ``how="outer"`` keeps the union of all dates and ``"inner"`` only the
+        dates every series observes. ``fill="ffill"`` carries each series'
+        last observation forward onto dates it does not observe, which lines
+        up mixed frequencies; explicit missing values are left as NaN.
+        """
+        if how not in JOINS:
+            raise ValueError(f"how must be one of {JOINS}, got {how!r}")
+        if fill not in FILLS:
+            raise ValueError(f"fill must be one of {FILLS}, got {fill!r}")
+
+        names = list(self._results)
+        results = list(self._results.values())
+        np = _numpy()
+        if np is None or not results:
+            dates, values = _align_python(results, how, fill)
+        else:
+            dates, values = _align_numpy(np, results, how, fill)
+        return PanelFrame(names=names, dates=dates, values=values)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        return f"Panel(series={self.names})"
+
+
+def _pairs(result: ObservationsResult | Columns) -> Iterator[tuple[date, float]]:
+    if isinstance(result, Mapping):
+        yield from zip(result["date"], result["value"])
+        return
+    items: Iterable = result
+    for observation in items:
+        yield observation.date, observation.value
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _align_numpy(
+    np, results: list[ObservationsResult | Columns], how: str, fill: str | None
+) -> tuple[list[date], array]:
+    columns = [_columns(result) for result in results]
+    # Day ordinals convert from ``date`` far faster than datetime64 does.
+    series_dates = [
+        np.fromiter(map(date.toordinal, dates), dtype=np.int64, count=len(dates))
+        for dates, _ in columns
+    ]
+    series_values = [np.asarray(values, dtype=np.float64) for _, values in columns]
+
+    index = np.unique(np.concatenate(series_dates))
+    if how == "inner":
+        hits = np.zeros(len(index), dtype=np.int64)
+        for dates in series_dates:
+            present = np.zeros(len(index), dtype=bool)
+            present[np.searchsorted(index, dates)] = True
+            hits += present
+        index = index[hits == len(series_dates)]
+
+    height, width = len(index), len(columns)
+    values = array("d", [math.nan]) * (height * width)
+    # Writes through this view land directly in the frame's buffer.
+    matrix = np.frombuffer(values, dtype=np.float64).reshape(height, width)
+    observed_mask = np.zeros((height, width), dtype=bool) if fill else None
+    for column, (dates, column_values) in enumerate(zip(series_dates, series_values)):
+        rows = np.searchsorted(index, dates)
+        keep = rows < height
+        keep[keep] = index[rows[keep]] == dates[keep]
+        matrix[rows[keep], column] = column_values[keep]
+        if observed_mask is not None:
+            observed_mask[rows[keep], column] = True
+
+    if observed_mask is not None and height:
+        # Index of the latest observed row at or above each cell.
+        source = np.where(observed_mask, np.arange(height)[:, None], 0)
+        np.maximum.accumulate(source, axis=0, out=source)
+        seen = np.logical_or.accumulate(observed_mask, axis=0)
+        filled = np.take_along_axis(matrix, source, axis=0)
+        np.copyto(matrix, filled, where=seen & ~observed_mask)
+
+    return list(map(date.fromordinal, index.tolist())), values
+
+
+def _align_python(
+    results: list[ObservationsResult | Columns], how: str, fill: str | None
+) -> tuple[list[date], array]:
+    series_pairs = [list(_pairs(result)) for result in results]
+
+    if how == "outer":
+        date_set: set[date] = set()
+        for pairs in series_pairs:
+            date_set.update(observation_date for observation_date, _ in pairs)
+    else:
+        date_set = set()
+        for position, pairs in enumerate(series_pairs):
+            observed = {observation_date for observation_date, _ in pairs}
+            date_set = observed if position == 0 else date_set & observed
+    dates = sorted(date_set)
+    rows = {observation_date: row for row, observation_date in enumerate(dates)}
+
+    width = len(series_pairs)
+    values = array("d", [math.nan]) * (len(dates) * width)
+    observed_mask = bytearray(len(dates) * width) if fill else None
+    for column, pairs in enumerate(series_pairs):
+        for observation_date, value in pairs:
+            row = rows.get(observation_date)
+            if row is None:
+                continue
+            offset = row * width + column
+            values[offset] = value
+            if observed_mask is not None:
+                observed_mask[offset] = 1
+
+    if observed_mask is not None:
+        for column in range(width):
+            last = math.nan
+            seen = False
+            for offset in range(column, len(values), width):
+                if observed_mask[offset]:
+                    last = values[offset]
+                    seen = True
+                elif seen:
+                    values[offset] = last
+    return dates, values
+
+
+def _columns(result: ObservationsResult | Columns) -> tuple[Sequence, Sequence]:
+    if isinstance(result, Mapping):
+        return result["date"], result["value"]
+    return [item.date for item in result], [item.value for item in result]
@@ -0,0 +1,105 @@
+"""Async streaming pipeline stages built on the client."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from typing import TYPE_CHECKING, AsyncIterable, AsyncIterator, Iterable
+
+from .client import get_current_client
+from .concurrency import ContextThreadPoolExecutor
+from .logging import get_logger
+from .series import Series
+
+if TYPE_CHECKING:
+    from .client import Fred
+
+logger = get_logger(__name__)
+
+
+async def stream_observations(
+    series_ids: Iterable[str] | AsyncIterable[str],
+    *,
+    concurrency: int = 8,
+    client: "Fred | None" = None,
+    realtime_start: date | None = None,
+    realtime_end: date | None = None,
+    observation_start: date | None = None,
+    observation_end: date | None = None,
+    units: str | None = None,
+    frequency: str | None = None,
+    aggregation_method: str | None = None,
+    output_type: int | None = None,
+    wire_format: str = "json",
+) -> AsyncIterator[tuple[Series, dict[str, list]]]:
+    """Fetch metadata and columnar observations for many series.
+
+    Yields ``(Series, columns)`` pairs in completion order, where ``columns``
+    is the mapping returned by :meth:`Series.observation_columns`. At most
+    ``concurrency`` series are in flight and the next id is only pulled from
+    ``series_ids`` once a finished result has been consumed, so memory stays
+    bounded however long the input is. ``series_ids`` may be a regular or an
+    async iterable, which lets stages be chained. ``wire_format="csv"``
+    downloads each series as a zipped CSV.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    client = client if client is not None else get_current_client()
+    observation_kwargs = {
+        "realtime_start": realtime_start,
+        "realtime_end": realtime_end,
+        "observation_start": observation_start,
+        "observation_end": observation_end,
+        "units": units,
+        "frequency": frequency,
+        "aggregation_method": aggregation_method,
+        "output_type": output_type,
+        "wire_format": wire_format,
+    }
+
+    def _fetch(series_id: str) -> tuple[Series, dict[str, list]]:
+        series = Series(series_id)
+        return series, series.observation_columns(**observation_kwargs)
+
+    loop = asyncio.get_running_loop()
+    executor = ContextThreadPoolExecutor(
+        max_workers=concurrency,
+        client=client,
+        thread_name_prefix="fredtools-pipeline",
+    )
+    ids = _aiter_ids(series_ids)
+    pending: set[asyncio.Future[tuple[Series, dict[str, list]]]] = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    series_id = await ids.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(loop.run_in_executor(executor, _fetch, series_id))
+            if not pending:
+                break
+            done, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug("Observation stream closed with %s pending", len(pending))
+
+
+async def _aiter_ids(
+    series_ids: Iterable[str] | AsyncIterable[str],
+) -> AsyncIterator[str]:
+    if isinstance(series_ids, AsyncIterable):
+        async for series_id in series_ids:
+            yield series_id
+    else:
+        for series_id in series_ids:
+            yield series_id
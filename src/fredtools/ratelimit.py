@@ -0,0 +1,97 @@
+"""Client-side request rate limiting."""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+from typing import Any, Callable
+
+# FRED allows 120 requests per minute per API key.
+DEFAULT_MAX_CALLS = 120
+DEFAULT_PERIOD = 60.0
+
+
+class RateLimiter:
+    """Spaces calls evenly so at most ``max_calls`` start per ``period``.
+
+    Each :meth:`acquire` reserves the next free slot and sleeps until it
+    arrives. The limiter is thread-safe; use :class:`SharedRateLimiter` to
+    share one budget between processes.
+    """
+
+    def __init__(
+        self,
+        max_calls: int = DEFAULT_MAX_CALLS,
+        period: float = DEFAULT_PERIOD,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        if max_calls < 1:
+            raise ValueError("max_calls must be at least 1")
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.max_calls = max_calls
+        self.period = period
+        self.interval = period / max_calls
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> float:
+        """Block until the caller may issue a request; return seconds waited."""
+        now = self._clock()
+        wait = self._reserve(now) - now
+        if wait <= 0:
+            return 0.0
+        self._sleep(wait)
+        return wait
+
+    def _reserve(self, now: float) -> float:
+        with self._lock:
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        return slot
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(max_calls={self.max_calls}, "
+            f"period={self.period})"
+        )
+
+
+class SharedRateLimiter(RateLimiter):
+    """Rate limiter whose schedule lives in shared memory.
+
+    Pass the instance to worker processes (for example through a pool
+    initializer) and every process draws from the same budget.
+    """
+
+    def __init__(
+        self,
+        max_calls: int = DEFAULT_MAX_CALLS,
+        period: float = DEFAULT_PERIOD,
+        context: Any = None,
+    ) -> None:
+        super().__init__(max_calls, period)
+        ctx = context if context is not None else multiprocessing.get_context()
+        self._shared_next_slot = ctx.Value("d", 0.0)
+
+    def _reserve(self, now: float) -> float:
+        with self._shared_next_slot.get_lock():
+            slot = max(now, self._shared_next_slot.value)
+            self._shared_next_slot.value = slot + self.interval
+        return slot
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+__all__ = ["RateLimiter", "SharedRateLimiter"]
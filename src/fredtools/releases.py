@@ -4,12 +4,13 @@ from datetime import date, datetime
 from typing import Any, TYPE_CHECKING
 
 from .client import get_current_client
+from .instrumentation import measure_parse
 from .logging import get_logger
-from .tags import Tag
 from .types import ReleaseTable, ReleaseTableElement, Source
 
 if TYPE_CHECKING:
     from .series import Series
+    from .tags import Tag
 
 class Release:
     """Class for FRED release operations."""
@@ -222,9 +223,21 @@ class Release:
         self._logger.debug(
             "Fetching sources for release_id=%s", self.release_id
         )
+        schema = client.schema_for("release/sources")
+        if schema is not None:
+            return client.request("release/sources", params=params, schema=schema).sources
+
         response = client.request("release/sources", params=params)
-        sources_list = response.get("sources", [])
-        return [Source(**src) for src in sources_list]
+        return [
+            Source(
+                id=src["id"],
+                name=src["name"],
+                realtime_start=_as_date(src["realtime_start"]),
+                realtime_end=_as_date(src["realtime_end"]),
+                link=src["link"],
+            )
+            for src in response.get("sources", [])
+        ]
 
     def table(
         self,
@@ -255,16 +268,18 @@ class Release:
             self.release_id,
             element_id,
         )
-        response = client.request("release/tables", params=params)
+        schema = client.schema_for("release/tables")
+        response = client.request("release/tables", params=params, schema=schema)
         print(response)
-        elements = response.get("elements", {})
+        elements = _field(response, "elements", {})
         if not elements:
             raise ValueError(
                 "No table data returned for "
                 f"release_id={self.release_id} element_id={element_id}"
             )
 
-        return self._parse_release_table(response, self.release_id)
+        with measure_parse(client, "release/tables"):
+            return self._parse_release_table(response, self.release_id)
 
     def tags(
         self,
@@ -302,6 +317,8 @@ class Release:
         )
         response = client.request("release/tags", params=params)
         tags_list = response.get("tags", [])
+        from .tags import Tag
+
         return [Tag(**tag) for tag in tags_list]
 
     def related_tags(
@@ -344,18 +361,22 @@ class Release:
         )
         response = client.request("release/related_tags", params=params)
         tags_list = response.get("tags", [])
+        from .tags import Tag
+
         return [Tag(**tag) for tag in tags_list]
 
     @staticmethod
     def _parse_release_table(
-        data: dict[str, Any],
+        data: Any,
         fallback_release_id: int | None = None,
     ) -> ReleaseTable:
-        elements_raw = data.get("elements")
+        # ``data`` is the decoded JSON dict or, with a schema, the typed
+        # response; :func:`_field` reads either.
+        elements_raw = _field(data, "elements")
         if not isinstance(elements_raw, dict) or not elements_raw:
             raise ValueError("Release table response did not include elements")
 
-        default_release_id = Release._coerce_int(data.get("release_id"))
+        default_release_id = Release._coerce_int(_field(data, "release_id"))
         if default_release_id is None:
             default_release_id = fallback_release_id
         if default_release_id is None:
@@ -366,9 +387,9 @@ class Release:
         element_lookup: dict[int, ReleaseTableElement] = {}
 
         def _get_or_create(
-            element_data: dict[str, Any],
+            element_data: Any,
         ) -> ReleaseTableElement:
-            element_id = Release._coerce_int(element_data.get("element_id"))
+            element_id = Release._coerce_int(_field(element_data, "element_id"))
             if element_id is None:
                 raise ValueError("Table element is missing an element_id")
 
@@ -376,7 +397,7 @@ class Release:
             if existing is not None:
                 return existing
 
-            release_id = Release._coerce_int(element_data.get("release_id"))
+            release_id = Release._coerce_int(_field(element_data, "release_id"))
             if release_id is None:
                 release_id = default_release_id
             if release_id is None:
@@ -384,16 +405,16 @@ class Release:
                     f"Table element {element_id} is missing release data"
                 )
 
-            parent_id = Release._coerce_int(element_data.get("parent_id"))
-            level = Release._coerce_int(element_data.get("level"))
+            parent_id = Release._coerce_int(_field(element_data, "parent_id"))
+            level = Release._coerce_int(_field(element_data, "level"))
             element = ReleaseTableElement(
                 element_id=element_id,
                 release_id=release_id,
-                series_id=element_data.get("series_id"),
+                series_id=_field(element_data, "series_id"),
                 parent_id=parent_id,
-                line=element_data.get("line"),
-                type=element_data.get("type", ""),
-                name=element_data.get("name", ""),
+                line=_field(element_data, "line"),
+                type=_field(element_data, "type", ""),
+                name=_field(element_data, "name", ""),
                 level=level,
             )
             element_lookup[element_id] = element
@@ -401,7 +422,7 @@ class Release:
 
         for raw_element in elements_raw.values():
             parent = _get_or_create(raw_element)
-            for child_data in raw_element.get("children") or []:
+            for child_data in _field(raw_element, "children") or []:
                 child = _get_or_create(child_data)
                 if all(
                     existing.element_id != child.element_id
@@ -409,7 +430,7 @@ class Release:
                 ):
                     parent.children.append(child)
 
-        root_element_id = Release._coerce_int(data.get("element_id"))
+        root_element_id = Release._coerce_int(_field(data, "element_id"))
 
         def _collect_children(
             target_parent_id: int | None,
@@ -437,7 +458,7 @@ class Release:
             top_level_elements = _collect_children(None)
 
         return ReleaseTable(
-            name=data.get("name"),
+            name=_field(data, "name"),
             element_id=root_element_id,
             release_id=default_release_id,
             elements=top_level_elements,
@@ -478,3 +499,13 @@ class Release:
             f"realtime_start={self.realtime_start}, "
             f"realtime_end={self.realtime_end})"
         )
+
+
+def _as_date(value: str | date) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _field(data: Any, name: str, default: Any = None) -> Any:
+    if isinstance(data, dict):
+        return data.get(name, default)
+    return getattr(data, name, default)
@@ -0,0 +1,194 @@
+"""Priority lanes for requests sharing one client."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
+
+from .concurrency import ConcurrencyLimiter
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from .ratelimit import RateLimiter
+
+logger = get_logger(__name__)
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+_current_lane: ContextVar[str] = ContextVar("_current_lane", default=INTERACTIVE)
+
+
+def current_lane() -> str:
+    """Return the lane requests made in this context are scheduled on."""
+    return _current_lane.get()
+
+
+@contextmanager
+def lane(name: str) -> Iterator[None]:
+    """Schedule requests made inside the block on lane ``name``.
+
+    The lane follows work submitted through ``Fred.map`` or
+    ``ContextThreadPoolExecutor``, since both copy the context.
+    """
+    token = _current_lane.set(name)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+@dataclass(frozen=True)
+class Lane:
+    """Scheduling class for a group of requests.
+
+    Waiting requests on higher-``priority`` lanes are always dispatched
+    first. Lanes of equal priority share slots in proportion to
+    ``weight``. ``max_concurrency`` caps a lane's requests in flight and
+    ``rate_limiter`` gives it its own request rate.
+    """
+
+    name: str
+    priority: int = 0
+    weight: float = 1.0
+    max_concurrency: int | None = None
+    rate_limiter: RateLimiter | None = None
+
+
+class _LaneState:
+    __slots__ = ("lane", "waiting", "in_flight", "virtual_time", "dispatched")
+
+    def __init__(self, lane: Lane) -> None:
+        self.lane = lane
+        self.waiting: deque[object] = deque()
+        self.in_flight = 0
+        self.virtual_time = 0.0
+        self.dispatched = 0
+
+    def has_room(self) -> bool:
+        limit = self.lane.max_concurrency
+        return limit is None or self.in_flight < limit
+
+
+def default_lanes(capacity: int) -> tuple[Lane, Lane]:
+    """Interactive ahead of batch, with one slot kept free of batch work.
+
+    Needs ``capacity >= 2``: with a single slot, a long batch call would
+    hold it and starve interactive requests anyway.
+    """
+    if capacity < 2:
+        raise ValueError(
+            f"The default lanes need capacity >= 2 to reserve an interactive "
+            f"slot, got {capacity}; pass lanes explicitly for a single slot"
+        )
+    return (
+        Lane(INTERACTIVE, priority=1),
+        Lane(BATCH, priority=0, max_concurrency=max(1, capacity - 1)),
+    )
+
+
+class RequestScheduler(ConcurrencyLimiter):
+    """Concurrency limiter that dispatches queued requests by lane.
+
+    Pass it as ``FredConfig.concurrency_limiter``. ``capacity`` requests
+    run at once; when a slot frees up it goes to the waiting request on
+    the highest-priority lane with room, using weighted fair queuing
+    between lanes of equal priority and FIFO within a lane. The default
+    lanes put ``interactive`` (the default for every request) ahead of
+    ``batch`` and keep batch work from filling the last slot, so a large
+    refresh run under :func:`lane` ``("batch")`` never blocks lookups.
+    Custom ``lanes`` must include ``interactive``; the default lanes need
+    ``capacity >= 2``.
+
+    Give lanes their own ``rate_limiter`` rather than setting
+    ``FredConfig.rate_limiter``: the shared limiter hands out slots in
+    arrival order, which would queue interactive calls behind batch ones.
+    """
+
+    def __init__(self, capacity: int = 8, lanes: Sequence[Lane] | None = None) -> None:
+        super().__init__(capacity)
+        lanes = default_lanes(capacity) if lanes is None else lanes
+        names = [item.name for item in lanes]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Lane names must be unique, got {names}")
+        if INTERACTIVE not in names:
+            # Requests made outside ``lane()`` are scheduled on it.
+            raise ValueError(f"Lanes must include {INTERACTIVE!r}, got {names}")
+        self._lanes = {item.name: _LaneState(item) for item in lanes}
+        self._virtual_clock = 0.0
+
+    @property
+    def lanes(self) -> list[Lane]:
+        return [state.lane for state in self._lanes.values()]
+
+    def acquire(self) -> None:
+        state = self._state(current_lane())
+        if state.lane.rate_limiter is not None:
+            state.lane.rate_limiter.acquire()
+        ticket = object()
+        with self._condition:
+            if not state.waiting:
+                state.virtual_time = max(state.virtual_time, self._virtual_clock)
+            state.waiting.append(ticket)
+            while not (state.waiting[0] is ticket and self._next_lane() is state):
+                self._condition.wait()
+            state.waiting.popleft()
+            state.in_flight += 1
+            state.dispatched += 1
+            self._in_flight += 1
+            self._virtual_clock = state.virtual_time
+            state.virtual_time += 1.0 / state.lane.weight
+            self._condition.notify_all()
+
+    def release(
+        self,
+        latency: float | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        state = self._state(current_lane())
+        with self._condition:
+            state.in_flight -= 1
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return queued, in-flight and dispatched counts per lane."""
+        with self._condition:
+            return {
+                name: {
+                    "queued": len(state.waiting),
+                    "in_flight": state.in_flight,
+                    "dispatched": state.dispatched,
+                }
+                for name, state in self._lanes.items()
+            }
+
+    def _next_lane(self) -> _LaneState | None:
+        if self._in_flight >= self._limit:
+            return None
+        candidates = [
+            state for state in self._lanes.values() if state.waiting and state.has_room()
+        ]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda state: (-state.lane.priority, state.virtual_time),
+        )
+
+    def _state(self, name: str) -> _LaneState:
+        try:
+            return self._lanes[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown lane {name!r}; expected one of {sorted(self._lanes)}"
+            ) from None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(capacity={self.limit}, "
+            f"lanes={list(self._lanes)})"
+        )
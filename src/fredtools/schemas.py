@@ -0,0 +1,114 @@
+"""Schema-directed decoding of endpoint responses with msgspec.
+
+With ``msgspec`` installed, endpoints registered here decode their JSON
+body in one pass straight into the fredtools dataclasses, with dates
+already parsed, instead of going through dicts and a Python parse loop.
+Both paths produce the same types. Schemas work on raw bytes, so callers
+ask :meth:`Fred.schema_for`, which returns ``None`` when the client has a
+decoded-object transport, an explicit ``json_decoder`` or no msgspec;
+callers then keep using the plain JSON path.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Callable
+
+from .decoders import Buffer
+from .types import Observation, Source
+
+# FRED marks missing observations with "." (sometimes ""), which no float
+# parser accepts.
+_MISSING_VALUE = re.compile(rb'("value"\s*:\s*)"\.?"')
+
+
+def _mark_missing_values(body: Buffer) -> Buffer:
+    if _MISSING_VALUE.search(body) is None:
+        return body
+    return _MISSING_VALUE.sub(rb'\1"NaN"', bytes(body))
+
+
+class Schema:
+    """Decoder for one endpoint's response type."""
+
+    __slots__ = ("type", "_decoder", "_prepare")
+
+    def __init__(
+        self,
+        type: Any,
+        prepare: Callable[[Buffer], Buffer] | None = None,
+    ) -> None:
+        import msgspec
+
+        self.type = type
+        # Lax mode lets numeric strings such as "1.5" decode into floats.
+        self._decoder = msgspec.json.Decoder(type, strict=False)
+        self._prepare = prepare
+
+    def decode(self, body: Buffer) -> Any:
+        if self._prepare is not None:
+            body = self._prepare(body)
+        return self._decoder.decode(body)
+
+    def __repr__(self) -> str:
+        return f"Schema({self.type.__name__})"
+
+
+@lru_cache(maxsize=None)
+def _response_types() -> dict[str, tuple[Any, Callable[[Buffer], Buffer] | None]]:
+    import msgspec
+
+    class ObservationsResponse(msgspec.Struct, gc=False):
+        observations: list[Observation] = []
+        count: int | None = None
+
+    class SourcesResponse(msgspec.Struct, gc=False):
+        sources: list[Source] = []
+
+    # Table ids arrive as ints or numeric strings; the release-table parser
+    # coerces them, so they are left untyped here.
+    class TableChild(msgspec.Struct):
+        element_id: Any = None
+        release_id: Any = None
+        series_id: str | None = None
+        parent_id: Any = None
+        line: Any = None
+        type: str | None = ""
+        name: str | None = ""
+        level: Any = None
+
+    # Built with defstruct: string annotations cannot name these local classes.
+    TableElement = msgspec.defstruct(
+        "TableElement",
+        [("children", list[TableChild] | None, None)],
+        bases=(TableChild,),
+    )
+    ReleaseTableResponse = msgspec.defstruct(
+        "ReleaseTableResponse",
+        [
+            ("name", str | None, None),
+            ("element_id", Any, None),
+            ("release_id", Any, None),
+            ("elements", dict[str, TableElement], {}),
+        ],
+    )
+
+    return {
+        "series/observations": (ObservationsResponse, _mark_missing_values),
+        "release/sources": (SourcesResponse, None),
+        "release/tables": (ReleaseTableResponse, None),
+    }
+
+
+@lru_cache(maxsize=None)
+def get_schema(endpoint: str) -> Schema | None:
+    """Return the schema for ``endpoint``, or ``None`` if unavailable."""
+    try:
+        response_types = _response_types()
+    except ImportError:
+        return None
+    entry = response_types.get(endpoint.strip("/"))
+    if entry is None:
+        return None
+    return Schema(*entry)
@@ -0,0 +1,310 @@
+"""Offline full-text search over cached series metadata."""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from .logging import get_logger
+from .tags import tag_name_list
+
+if TYPE_CHECKING:
+    from .series import Series
+    from .tags import Tag
+
+logger = get_logger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+_METADATA_FIELDS = (
+    "title",
+    "notes",
+    "units",
+    "units_short",
+    "frequency",
+    "frequency_short",
+    "seasonal_adjustment",
+    "seasonal_adjustment_short",
+    "realtime_start",
+    "realtime_end",
+    "observation_start",
+    "observation_end",
+    "last_updated",
+    "popularity",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    rowid INTEGER PRIMARY KEY,
+    series_id TEXT NOT NULL UNIQUE,
+    title TEXT,
+    notes TEXT,
+    units TEXT,
+    units_short TEXT,
+    frequency TEXT,
+    frequency_short TEXT,
+    seasonal_adjustment TEXT,
+    seasonal_adjustment_short TEXT,
+    realtime_start TEXT,
+    realtime_end TEXT,
+    observation_start TEXT,
+    observation_end TEXT,
+    last_updated TEXT,
+    popularity INTEGER
+);
+CREATE TABLE IF NOT EXISTS series_tags (
+    series_rowid INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, series_rowid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS series_frequency
+    ON series (frequency_short COLLATE NOCASE);
+CREATE VIRTUAL TABLE IF NOT EXISTS series_fts USING fts5(
+    series_id,
+    title,
+    notes,
+    units,
+    tags,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# bm25 column weights: series_id, title, notes, units, tags.
+_RANK = "bm25(series_fts, 8.0, 10.0, 1.0, 2.0, 4.0)"
+
+
+class SeriesIndex:
+    """Local inverted index over series metadata backed by SQLite FTS5.
+
+    The index lives in a single SQLite file, so a crawled catalogue can be
+    persisted once and reopened instantly. Pass ``":memory:"`` for a
+    throwaway index.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:") -> None:
+        self.path = os.fspath(path)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(_SCHEMA)
+
+    @classmethod
+    def build(
+        cls,
+        series: Iterable["Series"],
+        tags: Mapping[str, list[str] | list["Tag"]] | None = None,
+        path: str | os.PathLike[str] = ":memory:",
+    ) -> SeriesIndex:
+        """Create an index from crawled series and optional tags per series id."""
+        index = cls(path)
+        index.add_many(series, tags)
+        return index
+
+    def add(
+        self,
+        series: "Series",
+        tags: list[str] | list["Tag"] | None = None,
+    ) -> None:
+        """Insert or replace the metadata for a single series."""
+        self._add(series, tags)
+        self._connection.commit()
+
+    def add_many(
+        self,
+        series: Iterable["Series"],
+        tags: Mapping[str, list[str] | list["Tag"]] | None = None,
+    ) -> None:
+        """Insert or replace many series in a single transaction."""
+        tags = tags or {}
+        count = 0
+        for item in series:
+            self._add(item, tags.get(item.series_id or ""))
+            count += 1
+        self._connection.commit()
+        logger.debug("Indexed %s series into %s", count, self.path)
+
+    def remove(self, series_id: str) -> bool:
+        """Drop a series from the index, returning whether it was present."""
+        rowid = self._rowid(series_id)
+        if rowid is None:
+            return False
+        self._delete_rowid(rowid)
+        self._connection.commit()
+        return True
+
+    def search(
+        self,
+        text: str = "",
+        *,
+        prefix: bool = False,
+        frequency: str | None = None,
+        seasonal_adjustment: str | None = None,
+        tag_names: list[str] | list["Tag"] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list["Series"]:
+        """Return series ranked by relevance to ``text``.
+
+        Every word in ``text`` must match. With ``prefix=True`` each word also
+        matches longer terms; otherwise only the final word is treated as a
+        prefix when ``text`` ends without whitespace, which suits type-ahead
+        search. ``frequency`` and ``seasonal_adjustment`` accept either the
+        long or the short form, e.g. ``"Monthly"`` or ``"M"``. All of
+        ``tag_names`` must be attached to a returned series.
+        """
+        from .series import Series
+
+        clauses: list[str] = []
+        args: list[Any] = []
+        match = self._match_expression(text, prefix)
+        if match:
+            source = "series_fts JOIN series ON series.rowid = series_fts.rowid"
+            clauses.append("series_fts MATCH ?")
+            args.append(match)
+            order = f"{_RANK}, series.popularity DESC"
+        else:
+            source = "series"
+            order = "series.popularity DESC, series.series_id"
+
+        if frequency is not None:
+            clauses.append(
+                "(series.frequency = ? COLLATE NOCASE "
+                "OR series.frequency_short = ? COLLATE NOCASE)"
+            )
+            args.extend((frequency, frequency))
+        if seasonal_adjustment is not None:
+            clauses.append(
+                "(series.seasonal_adjustment = ? COLLATE NOCASE "
+                "OR series.seasonal_adjustment_short = ? COLLATE NOCASE)"
+            )
+            args.extend((seasonal_adjustment, seasonal_adjustment))
+        for tag in tag_name_list(tag_names):
+            clauses.append(
+                "EXISTS (SELECT 1 FROM series_tags "
+                "WHERE series_tags.tag = ? "
+                "AND series_tags.series_rowid = series.rowid)"
+            )
+            args.append(tag)
+
+        query = f"SELECT series.* FROM {source}"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY {order}"
+        if limit is not None or offset is not None:
+            query += " LIMIT ? OFFSET ?"
+            args.extend((-1 if limit is None else limit, offset or 0))
+
+        rows = self._connection.execute(query, args).fetchall()
+        return [Series._from_metadata(**self._row_to_kwargs(row)) for row in rows]
+
+    def tags(self, series_id: str) -> list[str]:
+        """Return the tag names indexed for ``series_id``."""
+        rows = self._connection.execute(
+            "SELECT tag FROM series_tags JOIN series "
+            "ON series.rowid = series_tags.series_rowid "
+            "WHERE series.series_id = ? ORDER BY tag",
+            (series_id,),
+        ).fetchall()
+        return [row["tag"] for row in rows]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> SeriesIndex:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM series").fetchone()[0]
+
+    def __contains__(self, series_id: object) -> bool:
+        return isinstance(series_id, str) and self._rowid(series_id) is not None
+
+    def __repr__(self) -> str:
+        return f"SeriesIndex(path={self.path!r}, series={len(self)})"
+
+    def _add(
+        self,
+        series: "Series",
+        tags: list[str] | list["Tag"] | None,
+    ) -> None:
+        if not series.series_id:
+            raise ValueError("Cannot index a series without a series_id")
+        existing = self._rowid(series.series_id)
+        if existing is not None:
+            self._delete_rowid(existing)
+
+        values = [_to_text(getattr(series, name, None)) for name in _METADATA_FIELDS]
+        cursor = self._connection.execute(
+            "INSERT INTO series (series_id, "
+            + ", ".join(_METADATA_FIELDS)
+            + ") VALUES (?, "
+            + ", ".join("?" for _ in _METADATA_FIELDS)
+            + ")",
+            [series.series_id, *values],
+        )
+        rowid = cursor.lastrowid
+        names = tag_name_list(tags)
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO series_tags (series_rowid, tag) VALUES (?, ?)",
+            [(rowid, name) for name in names],
+        )
+        self._connection.execute(
+            "INSERT INTO series_fts (rowid, series_id, title, notes, units, tags) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                rowid,
+                series.series_id,
+                series.title or "",
+                series.notes or "",
+                " ".join(filter(None, (series.units, series.units_short))),
+                " ".join(names),
+            ),
+        )
+
+    def _rowid(self, series_id: str) -> int | None:
+        row = self._connection.execute(
+            "SELECT rowid FROM series WHERE series_id = ?", (series_id,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _delete_rowid(self, rowid: int) -> None:
+        self._connection.execute("DELETE FROM series_fts WHERE rowid = ?", (rowid,))
+        self._connection.execute(
+            "DELETE FROM series_tags WHERE series_rowid = ?", (rowid,)
+        )
+        self._connection.execute("DELETE FROM series WHERE rowid = ?", (rowid,))
+
+    @staticmethod
+    def _match_expression(text: str, prefix: bool) -> str | None:
+        tokens = _TOKEN_PATTERN.findall(text)
+        if not tokens:
+            return None
+        terms = [f'"{token}"' for token in tokens]
+        if prefix:
+            terms = [f"{term}*" for term in terms]
+        elif not text[-1:].isspace():
+            terms[-1] = f"{terms[-1]}*"
+        return " ".join(terms)
+
+    @staticmethod
+    def _row_to_kwargs(row: sqlite3.Row) -> dict[str, Any]:
+        # Date columns hold the text Series parses from the API.
+        kwargs: dict[str, Any] = {"series_id": row["series_id"]}
+        for name in _METADATA_FIELDS:
+            kwargs[name] = row[name]
+        return kwargs
+
+
+def _to_text(value: Any) -> Any:
+    if isinstance(value, datetime):
+        from .series import LAST_UPDATED_FORMAT
+
+        return value.strftime(LAST_UPDATED_FORMAT)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
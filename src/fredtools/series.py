@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import TYPE_CHECKING
+from typing import Any, Iterable, Mapping, TYPE_CHECKING
 
+from .chunking import DEFAULT_CHUNK_WORKERS, ObservationFetch, fetch_observations
 from .client import get_current_client
-from .releases import Release
+from .instrumentation import measure_parse
 from .tags import stringify_tags
 from .types import Observation, ObservationsResult
 
 if TYPE_CHECKING:
     from .categories import Category
+    from .releases import Release
     from .tags import Tag
 
 
@@ -19,23 +21,33 @@ class Series:
     def __init__(self, series_id: str | None = None, **kwargs) -> None:
         if not series_id and not kwargs.get("id"):
             raise ValueError("Either series_id or series_id must be provided")
+        self._assign(series_id, kwargs)
+        if not self.realtime_start and not self.realtime_end and not self.title and not self.observation_start:
+            self.info()
+
+    @classmethod
+    def _from_metadata(cls, series_id: str, **kwargs) -> Series:
+        """Build a series from stored metadata without calling the API."""
+        series = cls.__new__(cls)
+        series._assign(series_id, kwargs)
+        return series
+
+    def _assign(self, series_id: str | None, kwargs: dict[str, Any]) -> None:
         self.series_id: str | None = series_id or kwargs.get("id")
-        self.realtime_start: date | None = kwargs.get("realtime_start")
-        self.realtime_end: date | None = kwargs.get("realtime_end")
+        self.realtime_start: date | None = _metadata_date(kwargs.get("realtime_start"))
+        self.realtime_end: date | None = _metadata_date(kwargs.get("realtime_end"))
         self.title: str | None = kwargs.get("title")
-        self.observation_start: date | None = kwargs.get("observation_start")
-        self.observation_end: date | None = kwargs.get("observation_end")
+        self.observation_start: date | None = _metadata_date(kwargs.get("observation_start"))
+        self.observation_end: date | None = _metadata_date(kwargs.get("observation_end"))
         self.frequency: str | None = kwargs.get("frequency")
         self.frequency_short: str | None = kwargs.get("frequency_short")
         self.units: str | None = kwargs.get("units")
         self.units_short: str | None = kwargs.get("units_short")
         self.seasonal_adjustment: str | None = kwargs.get("seasonal_adjustment")
         self.seasonal_adjustment_short: str | None = kwargs.get("seasonal_adjustment_short")
-        self.last_updated: date | None = kwargs.get("last_updated")
+        self.last_updated: date | None = parse_last_updated(kwargs.get("last_updated"))
         self.popularity: int | None = kwargs.get("popularity")
         self.notes: str | None = kwargs.get("notes")
-        if not self.realtime_start and not self.realtime_end and not self.title and not self.observation_start:
-            self.info()
 
     def categories(
         self,
@@ -58,10 +70,93 @@ class Series:
         frequency: str | None = None,
         aggregation_method: str | None = None,
         output_type: int | None = None,
+        max_workers: int = DEFAULT_CHUNK_WORKERS,
+        wire_format: str = "json",
     ) -> ObservationsResult:
+        """Fetch the series' observations.
+
+        Requests that exceed the API's row cap are split into date windows,
+        fetched with up to ``max_workers`` concurrent requests, and stitched
+        back together; see :func:`fredtools.chunking.fetch_observations`.
+        ``wire_format="csv"`` downloads a zipped CSV instead, which is much
+        smaller for large series but sent as a single request; see
+        :mod:`fredtools.wire_formats`.
+        """
         client = get_current_client()
 
-        params = {
+        params = self._observations_params(
+            realtime_start=realtime_start,
+            realtime_end=realtime_end,
+            observation_start=observation_start,
+            observation_end=observation_end,
+            units=units,
+            frequency=frequency,
+            aggregation_method=aggregation_method,
+            output_type=output_type,
+        )
+
+        if wire_format != "json":
+            from .wire_formats import check_wire_format, fetch_observation_columns_csv
+
+            check_wire_format(wire_format)
+            return ObservationsResult.from_columns(
+                fetch_observation_columns_csv(client, params)
+            )
+
+        return ObservationsResult(
+            fetch_observations(_observation_fetch(client), params, max_workers)
+        )
+
+    def observation_columns(
+        self,
+        realtime_start: date | None = None,
+        realtime_end: date | None = None,
+        observation_start: date | None = None,
+        observation_end: date | None = None,
+        units: str | None = None,
+        frequency: str | None = None,
+        aggregation_method: str | None = None,
+        output_type: int | None = None,
+        max_workers: int = DEFAULT_CHUNK_WORKERS,
+        wire_format: str = "json",
+    ) -> dict[str, list]:
+        """Fetch observations parsed straight into per-field column lists.
+
+        Requests over the API's row cap are split as in :meth:`observations`.
+        """
+        client = get_current_client()
+
+        params = self._observations_params(
+            realtime_start=realtime_start,
+            realtime_end=realtime_end,
+            observation_start=observation_start,
+            observation_end=observation_end,
+            units=units,
+            frequency=frequency,
+            aggregation_method=aggregation_method,
+            output_type=output_type,
+        )
+
+        if wire_format != "json":
+            from .wire_formats import check_wire_format, fetch_observation_columns_csv
+
+            check_wire_format(wire_format)
+            return fetch_observation_columns_csv(client, params)
+
+        return fetch_observation_columns(client, params, max_workers)
+
+    def _observations_params(
+        self,
+        realtime_start: date | None = None,
+        realtime_end: date | None = None,
+        observation_start: date | None = None,
+        observation_end: date | None = None,
+        units: str | None = None,
+        frequency: str | None = None,
+        aggregation_method: str | None = None,
+        output_type: int | None = None,
+    ) -> dict[str, Any]:
+        return {
             "series_id": self.series_id,
             "realtime_start": (
                 realtime_start.isoformat() if realtime_start else None
@@ -79,28 +174,6 @@ class Series:
             "output_type": output_type,
         }
 
-        response = client.request("series/observations", params=params)
-
-        def _parse_date(value: str) -> date:
-            return datetime.strptime(value, "%Y-%m-%d").date()
-
-        def _parse_value(value: str) -> float:
-            if value in ("", "."):
-                return float("nan")
-            return float(value)
-
-        observations = ObservationsResult(
-            Observation(
-                realtime_start=_parse_date(observation["realtime_start"]),
-                realtime_end=_parse_date(observation["realtime_end"]),
-                date=_parse_date(observation["date"]),
-                value=_parse_value(observation["value"]),
-            )
-            for observation in response.get("observations", [])
-        )
-
-        return observations
-
     def release(
         self,
         realtime_start: date | None = None,
@@ -125,6 +198,8 @@ class Series:
                 f"No release metadata returned for series_id='{self.series_id}'."
             )
 
+        from .releases import Release
+
         release_data = releases[0]
         release = Release(**release_data)
         return release
@@ -285,6 +360,68 @@ class Series:
             for vintage_date in response
         ]
     
+    @staticmethod
+    def hydrate_many(
+        ids_or_series: Iterable[str | Series],
+        max_workers: int = 8,
+    ) -> list[Series]:
+        """Return fully populated series for many ids in one call.
+
+        Series objects that already carry metadata, such as those returned
+        by ``Series.search``, ``Release.series`` or ``Category.series``, are
+        returned unchanged. Every distinct remaining id is fetched once with
+        up to ``max_workers`` concurrent ``series`` requests; series objects
+        missing metadata are filled in place. Results follow input order.
+        """
+        items = list(ids_or_series)
+        resolved: dict[str, Series] = {}
+        pending: dict[str, Series | None] = {}
+        for item in items:
+            if isinstance(item, Series):
+                if item.title is not None and item.series_id is not None:
+                    resolved.setdefault(item.series_id, item)
+                elif item.series_id is not None:
+                    pending.setdefault(item.series_id, item)
+            else:
+                pending.setdefault(item, None)
+        for series_id in resolved:
+            pending.pop(series_id, None)
+
+        def _hydrate(series_id: str, target: Series | None) -> Series:
+            if target is not None:
+                target.info()
+                return target
+            client = get_current_client()
+            response = client.request(
+                "series", params={"series_id": series_id}
+            ).get("seriess", [])
+            if not response:
+                raise ValueError(f"No series found with id {series_id}")
+            return Series(**response[0])
+
+        if pending:
+            workers = max(1, min(max_workers, len(pending)))
+            from .concurrency import ContextThreadPoolExecutor
+
+            with ContextThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    series_id: executor.submit(_hydrate, series_id, target)
+                    for series_id, target in pending.items()
+                }
+                for series_id, future in futures.items():
+                    resolved[series_id] = future.result()
+
+        hydrated: list[Series] = []
+        for item in items:
+            if isinstance(item, Series):
+                if item.title is not None or item.series_id is None:
+                    hydrated.append(item)
+                else:
+                    hydrated.append(resolved[item.series_id])
+            else:
+                hydrated.append(resolved[item])
+        return hydrated
+
     def info(self) -> Series:
         client = get_current_client()
 
@@ -319,4 +456,102 @@ class Series:
         return f"Series ID: {self.series_id}, Title: {self.title} \n" \
                f"Observation Start: {self.observation_start}, Observation End: {self.observation_end} \n" \
                f"Frequency: {self.frequency}, Units: {self.units}"
-    
+
+
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def _metadata_date(value: str | date | None) -> date | None:
+    if value is None or isinstance(value, date):
+        return value
+    return _parse_date(value)
+
+
+LAST_UPDATED_FORMAT = "%Y-%m-%d %H:%M:%S%z"
+
+
+def parse_last_updated(value: str | date | None) -> date | None:
+    """Parse ``last_updated`` as FRED sends it, e.g. ``2013-07-31 09:26:16-05``.
+
+    Plain ``YYYY-MM-DD`` dates are also accepted. The formats are matched
+    explicitly so every Python version decodes a value the same way.
+    """
+    if value is None or isinstance(value, date):
+        return value
+    if len(value) == 10:
+        return _parse_date(value)
+    if len(value) == 22:
+        # FRED writes the UTC offset as bare hours, which %z does not accept.
+        value += "00"
+    return datetime.strptime(value, LAST_UPDATED_FORMAT)
+
+
+def _parse_value(value: str) -> float:
+    if value in ("", "."):
+        return float("nan")
+    return float(value)
+
+
+def _parse_observation(row: Mapping[str, Any]) -> Observation:
+    return Observation(
+        realtime_start=_parse_date(row["realtime_start"]),
+        realtime_end=_parse_date(row["realtime_end"]),
+        date=_parse_date(row["date"]),
+        value=_parse_value(row["value"]),
+    )
+
+
+def _observation_fetch(client: Any) -> ObservationFetch:
+    """Return a one-request ``series/observations`` fetch for chunking."""
+
+    def _fetch(params: Mapping[str, Any]) -> tuple[list[Observation], int | None]:
+        schema = client.schema_for("series/observations")
+        if schema is not None:
+            response = client.request("series/observations", params=params, schema=schema)
+            with measure_parse(client, "series/observations"):
+                rows = list(response.observations)
+            return rows, response.count
+
+        response = client.request("series/observations", params=params)
+        with measure_parse(client, "series/observations"):
+            rows = [_parse_observation(row) for row in response.get("observations", [])]
+        return rows, response.get("count")
+
+    return _fetch
+
+
+def fetch_observation_columns(
+    client: Any,
+    params: Mapping[str, Any],
+    max_workers: int = DEFAULT_CHUNK_WORKERS,
+) -> dict[str, list]:
+    """Fetch ``series/observations`` for ``params`` as column lists.
+
+    A complete first page parses straight into columns. A page cut off at
+    the row cap is completed with :func:`fredtools.chunking.fetch_observations`.
+    """
+    response = client.request("series/observations", params=params)
+    raw_rows = response.get("observations", [])
+    count = response.get("count")
+    if count is None or count <= len(raw_rows):
+        with measure_parse(client, "series/observations"):
+            return parse_observation_columns(raw_rows)
+    with measure_parse(client, "series/observations"):
+        first_page = [_parse_observation(row) for row in raw_rows]
+    rows = fetch_observations(
+        _observation_fetch(client), params, max_workers, first_page=(first_page, count)
+    )
+    return ObservationsResult(rows).columns
+
+
+def parse_observation_columns(
+    observations: list[dict[str, Any]],
+) -> dict[str, list]:
+    """Parse raw ``series/observations`` rows into column lists."""
+    return {
+        "realtime_start": [_parse_date(row["realtime_start"]) for row in observations],
+        "realtime_end": [_parse_date(row["realtime_end"]) for row in observations],
+        "date": [_parse_date(row["date"]) for row in observations],
+        "value": [_parse_value(row["value"]) for row in observations],
+    }
@@ -0,0 +1,224 @@
+"""Local tag to series inverted index over sorted id arrays."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence
+
+from .logging import get_logger
+from .tags import tag_name_list
+
+if TYPE_CHECKING:
+    from .series import Series
+    from .tags import Tag
+
+logger = get_logger(__name__)
+
+
+class TagIndex:
+    """Maps tag names to series, answering tag queries locally.
+
+    Every indexed series is assigned a dense integer slot and each tag keeps
+    a sorted ``array('I')`` of the slots of its series, four bytes per
+    pairing. Queries intersect those arrays starting from the smallest, so
+    their cost follows the number of matches rather than the index size.
+    Slots freed by :meth:`remove` are reused so the arrays stay compact as
+    series churn.
+    """
+
+    def __init__(self) -> None:
+        self._slots: dict[str, int] = {}
+        self._series_ids: list[str | None] = []
+        self._free_slots: list[int] = []
+        self._postings: dict[str, array] = {}
+        self._tags_by_series: dict[str, frozenset[str]] = {}
+
+    @classmethod
+    def from_mapping(
+        cls,
+        tags_by_series: Mapping[str, list[str] | list["Tag"]],
+    ) -> TagIndex:
+        """Build an index from ``{series_id: tags}`` pairs."""
+        index = cls()
+        for series_id, tags in tags_by_series.items():
+            index.update(series_id, tags)
+        return index
+
+    @classmethod
+    def from_series(cls, series: Iterable["Series"]) -> TagIndex:
+        """Build an index by calling ``series/tags`` for each series."""
+        index = cls()
+        for item in series:
+            if item.series_id is None:
+                continue
+            index.update(item.series_id, item.tags())
+        logger.debug("Built tag index over %s series", len(index))
+        return index
+
+    def update(
+        self,
+        series_id: str,
+        tags: list[str] | list["Tag"] | None,
+    ) -> None:
+        """Replace the tags attached to ``series_id``."""
+        new_tags = frozenset(tag_name_list(tags))
+        slot = self._slots.get(series_id)
+        if slot is None:
+            slot = self._allocate(series_id)
+            old_tags: frozenset[str] = frozenset()
+        else:
+            old_tags = self._tags_by_series[series_id]
+
+        for name in old_tags - new_tags:
+            self._discard(name, slot)
+        for name in new_tags - old_tags:
+            slots = self._postings.get(name)
+            if slots is None:
+                self._postings[name] = array("I", (slot,))
+            elif slot > slots[-1]:
+                slots.append(slot)
+            else:
+                slots.insert(bisect_left(slots, slot), slot)
+        self._tags_by_series[series_id] = new_tags
+
+    def remove(self, series_id: str) -> bool:
+        """Drop ``series_id`` from the index, returning whether it was present."""
+        slot = self._slots.pop(series_id, None)
+        if slot is None:
+            return False
+        for name in self._tags_by_series.pop(series_id):
+            self._discard(name, slot)
+        self._series_ids[slot] = None
+        self._free_slots.append(slot)
+        return True
+
+    def series(
+        self,
+        tag_names: list[str] | list["Tag"] | None = None,
+        exclude_tag_names: list[str] | list["Tag"] | None = None,
+    ) -> list[str]:
+        """Return series tagged with all of ``tag_names`` and none of the excluded."""
+        return self._ids(self._select(tag_names, exclude_tag_names))
+
+    def union(self, tag_names: list[str] | list["Tag"]) -> list[str]:
+        """Return series tagged with any of ``tag_names``."""
+        slots: set[int] = set()
+        for name in tag_name_list(tag_names):
+            slots.update(self._postings.get(name, ()))
+        return self._ids(sorted(slots))
+
+    def count(
+        self,
+        tag_names: list[str] | list["Tag"] | None = None,
+        exclude_tag_names: list[str] | list["Tag"] | None = None,
+    ) -> int:
+        """Return the number of series :meth:`series` would match."""
+        return len(self._select(tag_names, exclude_tag_names))
+
+    def related_tags(
+        self,
+        tag_names: list[str] | list["Tag"],
+        exclude_tag_names: list[str] | list["Tag"] | None = None,
+    ) -> dict[str, int]:
+        """Count co-occurring tags over the series matched by ``tag_names``.
+
+        Mirrors ``related_tags`` on the API: the result maps every other tag
+        to the number of matching series carrying it, most frequent first.
+        """
+        selected = self._select(tag_names, exclude_tag_names)
+        if not selected:
+            return {}
+        skip = set(tag_name_list(tag_names)) | set(tag_name_list(exclude_tag_names))
+        counts: Counter[str] = Counter()
+        for series_id in self._ids(selected):
+            counts.update(self._tags_by_series[series_id])
+        return dict(
+            sorted(
+                ((name, count) for name, count in counts.items() if name not in skip),
+                key=lambda item: (-item[1], item[0]),
+            )
+        )
+
+    def tags(self, series_id: str) -> list[str]:
+        """Return the tags indexed for ``series_id``."""
+        return sorted(self._tags_by_series.get(series_id, ()))
+
+    def tag_names(self) -> list[str]:
+        return sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, series_id: object) -> bool:
+        return series_id in self._slots
+
+    def __repr__(self) -> str:
+        return f"TagIndex(series={len(self)}, tags={len(self._postings)})"
+
+    def _select(
+        self,
+        tag_names: list[str] | list["Tag"] | None,
+        exclude_tag_names: list[str] | list["Tag"] | None,
+    ) -> Sequence[int]:
+        names = tag_name_list(tag_names)
+        if names:
+            postings = [self._postings.get(name) for name in set(names)]
+            if any(slots is None for slots in postings):
+                return ()
+            postings.sort(key=len)
+            selected: Sequence[int] = postings[0]
+            for slots in postings[1:]:
+                selected = _intersect(selected, slots)
+                if not selected:
+                    return ()
+        else:
+            selected = [
+                slot for slot, series_id in enumerate(self._series_ids)
+                if series_id is not None
+            ]
+        for name in tag_name_list(exclude_tag_names):
+            excluded = self._postings.get(name)
+            if excluded is not None and selected:
+                selected = _intersect(selected, excluded, keep=False)
+        return selected
+
+    def _ids(self, slots: Iterable[int]) -> list[str]:
+        series_ids = self._series_ids
+        return [series_ids[slot] for slot in slots]  # type: ignore[misc]
+
+    def _allocate(self, series_id: str) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._series_ids[slot] = series_id
+        else:
+            slot = len(self._series_ids)
+            self._series_ids.append(series_id)
+        self._slots[series_id] = slot
+        return slot
+
+    def _discard(self, name: str, slot: int) -> None:
+        slots = self._postings[name]
+        del slots[bisect_left(slots, slot)]
+        if not slots:
+            del self._postings[name]
+
+
+def _intersect(
+    selected: Sequence[int],
+    slots: Sequence[int],
+    keep: bool = True,
+) -> list[int]:
+    """Keep the ``selected`` slots found in ``slots``, or missing with ``keep=False``."""
+    if len(selected) * 16 < len(slots):
+        # Few candidates against a long array: binary search each one.
+        size = len(slots)
+        result = []
+        for slot in selected:
+            position = bisect_left(slots, slot)
+            if (position < size and slots[position] == slot) is keep:
+                result.append(slot)
+        return result
+    members = set(slots)
+    return [slot for slot in selected if (slot in members) is keep]
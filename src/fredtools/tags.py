@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import threading
+import time
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
+from .ENUMS import TagGroups
 from .client import get_current_client
+from .logging import get_logger
 
 if TYPE_CHECKING:
     from .series import Series
 
+logger = get_logger(__name__)
+
+_TAG_FIELDS = ("group_id", "notes", "created", "popularity", "series_count")
+
 
 class Tag:
     def __init__(self, name: str | None = None, **kwargs) -> None:
@@ -19,14 +27,17 @@ class Tag:
         self.popularity: int | None = kwargs.get("popularity")
         self.series_count: int | None = kwargs.get("series_count")
 
-        if (
-            not self.group_id
-            and not self.notes
-            and not self.created
-            and not self.popularity
-            and not self.series_count
-        ):
-            self.info()
+        if not any(kwargs.get(field) is not None for field in _TAG_FIELDS):
+            catalog = get_tag_catalog()
+            cached = (
+                catalog.get(self.name)
+                if catalog is not None and self.name
+                else None
+            )
+            if cached is not None:
+                self._apply(cached)
+            else:
+                self.info()
 
     def series(
         self,
@@ -90,12 +101,16 @@ class Tag:
         )
         return [Tag(**tag) for tag in response]
 
+    @staticmethod
     def all(
-        self,
         realtime_start: date | None = None,
         realtime_end: date | None = None,
         tag_names: list[str] | None = None,
-        tag_group_id: int | None = None,
+        tag_group_id: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        order_by: str | None = None,
+        sort_order: str | None = None,
     ) -> list[Tag]:
         client = get_current_client()
 
@@ -104,6 +119,10 @@ class Tag:
             "realtime_end": realtime_end,
             "tag_names": stringify_tags(tag_names),
             "tag_group_id": tag_group_id,
+            "limit": limit,
+            "offset": offset,
+            "order_by": order_by,
+            "sort_order": sort_order,
         }
 
         response = client.request("tags", params=params).get("tags", [])
@@ -119,13 +138,16 @@ class Tag:
             raise ValueError(f"No tag found with id {self.name}")
         tag_info = response[0]
         self.name = tag_info.get("name")
-        self.group_id = tag_info.get("group_id")
-        self.notes = tag_info.get("notes")
-        self.created = tag_info.get("created")
-        self.popularity = tag_info.get("popularity")
-        self.series_count = tag_info.get("series_count")
+        self._apply(tag_info)
         return self
 
+    def _apply(self, fields: dict[str, Any]) -> None:
+        self.group_id = fields.get("group_id")
+        self.notes = fields.get("notes")
+        self.created = fields.get("created")
+        self.popularity = fields.get("popularity")
+        self.series_count = fields.get("series_count")
+
     def __repr__(self) -> str:
         return (
             f"Tag(name={self.name}, group_id={self.group_id}, "
@@ -150,3 +172,130 @@ def stringify_tags(
             names.append(tag)
 
     return ";".join(names) if names else None
+
+
+def tag_name_list(
+    tags: list[str] | list[Tag] | None,
+) -> list[str]:
+    joined = stringify_tags(tags)
+    return joined.split(";") if joined else []
+
+
+class TagCatalog:
+    """In-memory catalog of every FRED tag, keyed by tag name.
+
+    The catalog is filled in bulk by paging through the ``tags`` endpoint
+    once per tag group and then answers lookups from a dictionary. Entries are
+    reloaded on the next lookup once ``ttl`` seconds have passed; a failed
+    reload keeps serving the previous snapshot.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = 24 * 60 * 60,
+        page_size: int = 1000,
+        tag_groups: Iterable[TagGroups] = tuple(TagGroups),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.page_size = page_size
+        self.tag_groups = tuple(tag_groups)
+        self._clock = clock
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        if self.ttl is None:
+            return False
+        return self._clock() - self._loaded_at >= self.ttl
+
+    def load(self) -> None:
+        """Fetch every tag group from the API and replace the cached entries."""
+        client = get_current_client()
+        entries: dict[str, dict[str, Any]] = {}
+        for group in self.tag_groups:
+            group_id = group.value[0]
+            offset = 0
+            while True:
+                # Read the raw dicts: building ``Tag`` objects here would
+                # consult this catalog again for tags without metadata.
+                page = client.request(
+                    "tags",
+                    params={
+                        "tag_group_id": group_id,
+                        "limit": self.page_size,
+                        "offset": offset,
+                    },
+                ).get("tags", [])
+                for tag in page:
+                    name = tag.get("name")
+                    if name is None:
+                        continue
+                    entries[name] = {field: tag.get(field) for field in _TAG_FIELDS}
+                if len(page) < self.page_size:
+                    break
+                offset += self.page_size
+        self._entries = entries
+        self._loaded_at = self._clock()
+        logger.debug("Loaded %s tags into the tag catalog", len(entries))
+
+    def refresh(self) -> None:
+        """Reload the catalog if its TTL has expired."""
+        if not self.is_stale:
+            return
+        with self._lock:
+            if not self.is_stale:
+                return
+            try:
+                self.load()
+            except Exception:
+                if self._loaded_at is None:
+                    raise
+                logger.warning(
+                    "Tag catalog refresh failed; serving cached entries",
+                    exc_info=True,
+                )
+                self._loaded_at = self._clock()
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Return the cached fields for ``name`` or ``None`` if unknown."""
+        self.refresh()
+        return self._entries.get(name)
+
+    def resolve(self, name: str) -> Tag | None:
+        """Build a :class:`Tag` for ``name`` from the catalog."""
+        fields = self.get(name)
+        if fields is None:
+            return None
+        return Tag(name=name, **fields)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._loaded_at = None
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"TagCatalog(tags={len(self)}, ttl={self.ttl})"
+
+
+_tag_catalog: TagCatalog | None = None
+
+
+def set_tag_catalog(catalog: TagCatalog | None) -> None:
+    """Install ``catalog`` as the process-wide source for ``Tag(name)``."""
+    global _tag_catalog
+    _tag_catalog = catalog
+
+
+def get_tag_catalog() -> TagCatalog | None:
+    return _tag_catalog
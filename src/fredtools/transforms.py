@@ -0,0 +1,308 @@
+"""Local equivalents of FRED's server-side observation transforms."""
+
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+from typing import Callable, Mapping, Sequence
+
+# Weekday (Monday=0) on which each weekly frequency code ends.
+_WEEK_ENDS = {
+    "w": 4,
+    "wef": 4,
+    "weth": 3,
+    "wew": 2,
+    "wetu": 1,
+    "wem": 0,
+    "wesu": 6,
+    "wesa": 5,
+}
+
+AGGREGATION_METHODS = ("avg", "sum", "eop")
+
+_ONE_DAY = timedelta(days=1)
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _quarter_start(value: date) -> date:
+    return date(value.year, 3 * ((value.month - 1) // 3) + 1, 1)
+
+
+def _half_year_start(value: date) -> date:
+    return date(value.year, 1 if value.month <= 6 else 7, 1)
+
+
+def _year_start(value: date) -> date:
+    return date(value.year, 1, 1)
+
+
+def _week_ending(weekday: int) -> Callable[[date], date]:
+    def label(value: date) -> date:
+        return value + timedelta(days=(weekday - value.weekday()) % 7)
+
+    return label
+
+
+def period_labeler(frequency: str) -> Callable[[date], date]:
+    """Return the function mapping an observation date to its period label.
+
+    Labels follow FRED: weekly periods are dated by their last day, all
+    longer periods by their first day.
+    """
+    code = frequency.strip().lower()
+    if code == "d":
+        return lambda value: value
+    if code in _WEEK_ENDS:
+        return _week_ending(_WEEK_ENDS[code])
+    if code == "m":
+        return _month_start
+    if code == "q":
+        return _quarter_start
+    if code == "sa":
+        return _half_year_start
+    if code == "a":
+        return _year_start
+    raise ValueError(
+        f"Unsupported frequency for local resampling: {frequency!r}. "
+        "Biweekly codes are only available from the API."
+    )
+
+
+def _aggregate(values: list[float], method: str) -> float:
+    present = [value for value in values if not math.isnan(value)]
+    if not present:
+        return math.nan
+    if method == "avg":
+        return math.fsum(present) / len(present)
+    if method == "sum":
+        return math.fsum(present)
+    return present[-1]
+
+
+def _vintages(columns: Mapping[str, Sequence]) -> list[tuple[date, date, list[int]]]:
+    """Split rows into the realtime windows over which their set is constant.
+
+    Each entry is ``(realtime_start, realtime_end, row indices)``: the rows
+    that were all in effect together throughout that window, i.e. one
+    vintage of the series. Input from a single realtime window is one entry.
+    """
+    starts = columns["realtime_start"]
+    ends = columns["realtime_end"]
+    windows = set(zip(starts, ends))
+    if len(windows) <= 1:
+        return [(start, end, list(range(len(starts)))) for start, end in windows]
+
+    bounds = sorted(
+        {start for start, _ in windows}
+        | {end + _ONE_DAY for _, end in windows if end < date.max}
+    )
+    last_end = max(end for _, end in windows)
+    vintages = []
+    for position, start in enumerate(bounds):
+        end = bounds[position + 1] - _ONE_DAY if position + 1 < len(bounds) else last_end
+        rows = [
+            index for index in range(len(starts)) if starts[index] <= start <= ends[index]
+        ]
+        if rows and start <= end:
+            vintages.append((start, end, rows))
+    return vintages
+
+
+def _per_vintage(
+    columns: Mapping[str, Sequence],
+    apply: Callable[[list[date], list[float]], tuple[list[date], list[float]]],
+) -> dict[str, list]:
+    """Run ``apply(dates, values)`` on each vintage and stitch the results.
+
+    Output rows carry the realtime window of the vintage they came from;
+    a date whose result is unchanged across consecutive vintages is kept
+    as one row spanning them.
+    """
+    dates = columns["date"]
+    values = columns["value"]
+    rows: list[tuple[date, date, date, float]] = []
+    vintages = _vintages(columns)
+    for start, end, indices in vintages:
+        out_dates, out_values = apply(
+            [dates[index] for index in indices], [values[index] for index in indices]
+        )
+        rows.extend(
+            (out_date, start, end, value) for out_date, value in zip(out_dates, out_values)
+        )
+    if len(vintages) > 1:
+        rows.sort(key=lambda row: (row[0], row[1]))
+        merged: list[tuple[date, date, date, float]] = []
+        for row in rows:
+            if merged:
+                last = merged[-1]
+                same_value = last[3] == row[3] or (math.isnan(last[3]) and math.isnan(row[3]))
+                if last[0] == row[0] and last[2] + _ONE_DAY == row[1] and same_value:
+                    merged[-1] = (last[0], last[1], row[2], last[3])
+                    continue
+            merged.append(row)
+        rows = merged
+    return {
+        "realtime_start": [row[1] for row in rows],
+        "realtime_end": [row[2] for row in rows],
+        "date": [row[0] for row in rows],
+        "value": [row[3] for row in rows],
+    }
+
+
+def resample(
+    columns: Mapping[str, Sequence],
+    frequency: str,
+    aggregation_method: str = "avg",
+) -> dict[str, list]:
+    """Aggregate observation columns to a lower frequency.
+
+    ``frequency`` takes the FRED codes accepted by ``series/observations``
+    (``d``, ``w``/``wef``/``weth``/``wew``/``wetu``/``wem``/``wesu``/``wesa``,
+    ``m``, ``q``, ``sa``, ``a``) and ``aggregation_method`` is ``avg``,
+    ``sum`` or ``eop``. Missing values are skipped, so a period whose rows
+    are all missing is NaN; periods without any rows are not emitted.
+    Vintage (ALFRED) input is resampled one vintage at a time and each
+    output row carries the realtime window of its vintage.
+    """
+    method = aggregation_method.strip().lower()
+    if method not in AGGREGATION_METHODS:
+        raise ValueError(f"Unsupported aggregation method: {aggregation_method!r}")
+    label = period_labeler(frequency)
+
+    def _resample(dates: list[date], values: list[float]) -> tuple[list[date], list[float]]:
+        order = sorted(range(len(dates)), key=dates.__getitem__)
+        periods: list[date] = []
+        aggregated: list[float] = []
+        current: date | None = None
+        members: list[float] = []
+        for index in order:
+            period = label(dates[index])
+            if period != current:
+                if current is not None:
+                    periods.append(current)
+                    aggregated.append(_aggregate(members, method))
+                current = period
+                members = []
+            members.append(values[index])
+        if current is not None:
+            periods.append(current)
+            aggregated.append(_aggregate(members, method))
+        return periods, aggregated
+
+    return _per_vintage(columns, _resample)
+
+
+UNITS = ("lin", "chg", "ch1", "pch", "pc1", "pca", "cch", "cca", "log")
+
+
+def infer_periods_per_year(dates: Sequence[date]) -> int:
+    """Guess observations per year from the typical spacing of ``dates``."""
+    if len(dates) < 2:
+        raise ValueError("At least two observations are needed to infer a frequency")
+    ordered = sorted(dates)
+    gaps = sorted(
+        (later - earlier).days for earlier, later in zip(ordered, ordered[1:])
+    )
+    median_gap = gaps[len(gaps) // 2]
+    if median_gap <= 3:
+        return 365 if any(value.weekday() >= 5 for value in ordered) else 260
+    if median_gap <= 10:
+        return 52
+    if median_gap <= 20:
+        return 26
+    if median_gap <= 45:
+        return 12
+    if median_gap <= 120:
+        return 4
+    if median_gap <= 250:
+        return 2
+    return 1
+
+
+def _log(value: float) -> float:
+    return math.log(value) if value > 0 else math.nan
+
+
+def _ratio(current: float, previous: float) -> float:
+    if previous == 0 or math.isnan(previous) or math.isnan(current):
+        return math.nan
+    return current / previous
+
+
+def apply_units(
+    columns: Mapping[str, Sequence],
+    units: str,
+    periods_per_year: int | None = None,
+) -> dict[str, list]:
+    """Apply a FRED ``units`` transformation to observation columns.
+
+    Implements the documented formulas, where ``n`` is the number of
+    observations per year:
+
+    * ``lin`` levels, ``log`` natural log
+    * ``chg`` x(t) - x(t-1), ``ch1`` x(t) - x(t-n)
+    * ``pch`` (x(t)/x(t-1) - 1) * 100, ``pc1`` (x(t)/x(t-n) - 1) * 100
+    * ``pca`` ((x(t)/x(t-1)) ** n - 1) * 100
+    * ``cch`` (ln x(t) - ln x(t-1)) * 100, ``cca`` the same times ``n``
+
+    Observations are taken in date order. Vintage (ALFRED) input is
+    transformed one vintage at a time, so lags never compare two releases
+    of the same date; a date repeated within one vintage is a
+    ``ValueError``. Any result depending on a missing, zero (as a divisor)
+    or non-positive (under a log) value is NaN, as are the leading rows
+    without enough history. ``n`` is inferred from the date spacing unless
+    ``periods_per_year`` is given; empty and single-row inputs transform
+    to empty and all-NaN results.
+    """
+    code = units.strip().lower()
+    if code not in UNITS:
+        raise ValueError(f"Unsupported units transformation: {units!r}")
+
+    if code in ("ch1", "pc1", "pca", "cca") and periods_per_year is None:
+        distinct = sorted(set(columns["date"]))
+        # Fewer than two dates have no history, so every result is NaN
+        # whatever the frequency; the server answers the same way.
+        periods_per_year = infer_periods_per_year(distinct) if len(distinct) >= 2 else 1
+    lag = periods_per_year if code in ("ch1", "pc1") else 1
+    n = periods_per_year or 1
+
+    def _transform(dates: list[date], values: list[float]) -> tuple[list[date], list[float]]:
+        order = sorted(range(len(dates)), key=dates.__getitem__)
+        dates = [dates[index] for index in order]
+        values = [values[index] for index in order]
+        for earlier, later in zip(dates, dates[1:]):
+            if earlier == later:
+                raise ValueError(
+                    f"Observation date {later} appears more than once within one "
+                    "realtime window; transform a single vintage at a time"
+                )
+        transformed: list[float] = []
+        for position, current in enumerate(values):
+            if code == "lin":
+                transformed.append(current)
+                continue
+            if code == "log":
+                transformed.append(_log(current))
+                continue
+            if position < lag:
+                transformed.append(math.nan)
+                continue
+            previous = values[position - lag]
+            if code in ("chg", "ch1"):
+                transformed.append(current - previous)
+            elif code in ("pch", "pc1"):
+                transformed.append((_ratio(current, previous) - 1) * 100)
+            elif code == "pca":
+                ratio = _ratio(current, previous)
+                transformed.append(
+                    (ratio**n - 1) * 100 if ratio > 0 else math.nan
+                )
+            else:
+                change = (_log(current) - _log(previous)) * 100
+                transformed.append(change * n if code == "cca" else change)
+        return dates, transformed
+
+    return _per_vintage(columns, _transform)
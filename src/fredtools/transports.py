@@ -0,0 +1,133 @@
+"""Optional transports for ``FredConfig.byte_transport`` or ``FredConfig.transport``."""
+
+from __future__ import annotations
+
+import threading
+from importlib.util import find_spec
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Mapping
+
+from .client import RawResponse
+from .decoders import JsonDecoder, resolve_json_decoder
+from .instrumentation import _current_stats
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_STREAMS = 100
+DEFAULT_MAX_CONNECTIONS = 4
+
+
+class Http2Transport:
+    """Multiplexes concurrent requests over a few HTTP/2 connections.
+
+    Built on ``httpx``; HTTP/2 additionally needs the ``h2`` package
+    (``pip install "httpx[http2]"``). Without ``h2``, or when the server
+    only offers HTTP/1.1, requests fall back to pooled HTTP/1.1
+    connections. ``max_streams`` caps requests in flight across all
+    connections; further callers block until a stream frees up.
+    The transport is thread-safe and should be closed when no longer
+    needed.
+
+    Pass :meth:`raw` as ``FredConfig.byte_transport`` so fredtools parses
+    the body buffer itself, using schemas where they apply. The instance
+    also works as a decoded ``FredConfig.transport`` and then decodes with
+    ``json_decoder``, resolved like ``FredConfig.json_decoder``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_streams: int = DEFAULT_MAX_STREAMS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        http2: bool = True,
+        timeout: float | None = 30.0,
+        client: "httpx.Client | None" = None,
+        json_decoder: str | JsonDecoder = "auto",
+    ) -> None:
+        if max_streams < 1:
+            raise ValueError("max_streams must be at least 1")
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        try:
+            import httpx
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "httpx is required for Http2Transport. Install it with "
+                '`pip install "httpx[http2]"`.'
+            ) from exc
+
+        if http2 and find_spec("h2") is None:
+            logger.warning("h2 is not installed; Http2Transport is using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.max_streams = max_streams
+        self.max_connections = max_connections
+        self._streams = threading.BoundedSemaphore(max_streams)
+        self._decode = resolve_json_decoder(json_decoder)
+        self._client = client or httpx.Client(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    def __call__(
+        self,
+        url: str,
+        params: Mapping[str, Any],
+        timeout: float | None = None,
+    ) -> Any:
+        raw = self.raw(url, params, timeout)
+        stats = _current_stats.get()
+        if stats is None:
+            return self._decode(raw.body)
+        started = perf_counter()
+        decoded = self._decode(raw.body)
+        stats.decode_time = perf_counter() - started
+        stats.bytes_received = len(raw.body)
+        stats.compressed_bytes = raw.wire_bytes
+        return decoded
+
+    def raw(
+        self,
+        url: str,
+        params: Mapping[str, Any],
+        timeout: float | None = None,
+    ) -> RawResponse:
+        """Byte-transport form, for ``FredConfig(byte_transport=transport.raw)``."""
+        extra = {} if timeout is None else {"timeout": timeout}
+        with self._streams:
+            response = self._client.get(url, params=dict(params), **extra)
+            response.raise_for_status()
+            body = response.content
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.extra["http_version"] = response.http_version
+        return RawResponse(
+            body,
+            headers=response.headers,
+            wire_bytes=response.num_bytes_downloaded,
+            content_encoding="identity",
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> Http2Transport:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(http2={self.http2}, "
+            f"max_streams={self.max_streams}, "
+            f"max_connections={self.max_connections})"
+        )
@@ -1,6 +1,6 @@
 from dataclasses import asdict, dataclass, field
 from datetime import date
-from typing import Iterable, TYPE_CHECKING
+from typing import Iterable, Mapping, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -59,6 +59,61 @@ class ObservationsResult(list[Observation]):
     def __init__(self, observations: Iterable[Observation]) -> None:
         super().__init__(observations)
 
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Mapping[str, Sequence],
+    ) -> "ObservationsResult":
+        """Build a result from ``realtime_start``/``realtime_end``/``date``/``value`` columns."""
+        return cls(
+            Observation(
+                realtime_start=realtime_start,
+                realtime_end=realtime_end,
+                date=observation_date,
+                value=value,
+            )
+            for realtime_start, realtime_end, observation_date, value in zip(
+                columns["realtime_start"],
+                columns["realtime_end"],
+                columns["date"],
+                columns["value"],
+            )
+        )
+
+    @property
+    def columns(self) -> dict[str, list]:
+        """Return the observations as per-field column lists."""
+        return {
+            "realtime_start": [item.realtime_start for item in self],
+            "realtime_end": [item.realtime_end for item in self],
+            "date": [item.date for item in self],
+            "value": [item.value for item in self],
+        }
+
+    def resample(
+        self,
+        frequency: str,
+        aggregation_method: str = "avg",
+    ) -> "ObservationsResult":
+        """Aggregate to a lower FRED frequency locally; see ``transforms.resample``."""
+        from .transforms import resample
+
+        return ObservationsResult.from_columns(
+            resample(self.columns, frequency, aggregation_method)
+        )
+
+    def transform(
+        self,
+        units: str,
+        periods_per_year: int | None = None,
+    ) -> "ObservationsResult":
+        """Apply a FRED ``units`` transform locally; see ``transforms.apply_units``."""
+        from .transforms import apply_units
+
+        return ObservationsResult.from_columns(
+            apply_units(self.columns, units, periods_per_year)
+        )
+
     @property
     def df(self) -> "pd.DataFrame":
         try:
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import io
+import json
+import threading
 from collections.abc import Callable, Mapping
 from contextvars import ContextVar
 from dataclasses import dataclass
+from datetime import date, timedelta
 from typing import Any
 
 import pytest
 
 from fredtools import client as client_module
+from fredtools.schemas import get_schema
 
 
 @pytest.fixture(autouse=True)
@@ -27,6 +32,62 @@ class StubResponse:
     assert_params: Callable[[Mapping[str, Any] | None], None] | None = None
 
 
+class DummyResponse:
+    """Minimal stand-in for the object returned by urlopen."""
+
+    def __init__(self, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self._stream = io.BytesIO(body)
+        self.headers = headers or {}
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+    def __enter__(self) -> "DummyResponse":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+class CappedObservationsServer:
+    """Decoded transport serving ``days`` daily observations at most ``cap`` per request.
+
+    Like the API, it reports the full ``count`` of rows matching the window.
+    """
+
+    def __init__(self, days: int, cap: int) -> None:
+        self.cap = cap
+        self.rows = [
+            {
+                "realtime_start": "2024-01-01",
+                "realtime_end": "9999-12-31",
+                "date": (date(2000, 1, 1) + timedelta(days=offset)).isoformat(),
+                "value": str(offset),
+            }
+            for offset in range(days)
+        ]
+        self.observation_requests = 0
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        url: str,
+        params: Mapping[str, Any],
+        timeout: float | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        if url.endswith("/series"):
+            body: Any = {"seriess": [{"id": params["series_id"], "title": "Title"}]}
+        else:
+            with self._lock:
+                self.observation_requests += 1
+            start = params.get("observation_start") or "0000-00-00"
+            end = params.get("observation_end") or "9999-99-99"
+            matched = [row for row in self.rows if start <= row["date"] <= end]
+            body = {"count": len(matched), "observations": matched[: self.cap]}
+        return body if decode is None else decode(json.dumps(body).encode())
+
+
 class StubClient:
     """Simple stub that returns canned responses and tracks calls."""
 
@@ -34,10 +95,14 @@ class StubClient:
         self._responses = list(responses)
         self.calls: list[tuple[str, Mapping[str, Any] | None]] = []
 
+    def schema_for(self, endpoint: str) -> Any:
+        return get_schema(endpoint)
+
     def request(
         self,
         endpoint: str,
         params: Mapping[str, Any] | None = None,
+        schema: Any = None,
     ) -> Any:
         if not self._responses:
             raise AssertionError(f"Unexpected request to {endpoint!r}")
@@ -49,7 +114,10 @@ class StubClient:
         if expected.assert_params:
             expected.assert_params(params)
         self.calls.append((endpoint, params))
-        return expected.response() if callable(expected.response) else expected.response
+        response = expected.response() if callable(expected.response) else expected.response
+        if schema is None:
+            return response
+        return schema.decode(json.dumps(response, default=str).encode())
 
     def assert_complete(self) -> None:
         if self._responses:
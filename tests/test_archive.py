@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import math
+import pickle
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fredtools.archive import ObservationArchive, write_archive
+from fredtools.types import Observation, ObservationsResult
+
+
+def gdp() -> ObservationsResult:
+    return ObservationsResult(
+        [
+            Observation(date(2024, 1, 1), date(2024, 6, 30), date(2023, 10, 1), 27.9),
+            Observation(date(2024, 1, 1), date(2024, 6, 30), date(2024, 1, 1), math.nan),
+        ]
+    )
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    unrate = {
+        "realtime_start": [date(2024, 2, 1)],
+        "realtime_end": [date(9999, 12, 31)],
+        "date": [date(1948, 1, 1)],
+        "value": [3.4],
+    }
+    return write_archive(tmp_path / "obs.fredarc", {"GDP": gdp(), "UNRATE": unrate}, {"GDP": "q"})
+
+
+def test_archive_round_trips_observations(archive_path) -> None:
+    with ObservationArchive(archive_path) as archive:
+        assert archive.keys() == ["GDP", "UNRATE"]
+        assert len(archive) == 2 and "GDP" in archive and "CPI" not in archive
+        assert archive.frequency("GDP") == "q"
+        assert archive.frequency("UNRATE") is None
+        restored = archive.get("GDP")
+        assert isinstance(restored, ObservationsResult)
+        assert restored[0] == gdp()[0]
+        assert math.isnan(restored[1].value)
+        assert archive["UNRATE"][0].realtime_end == date(9999, 12, 31)
+
+
+def test_archive_arrays_are_memory_mapped_views(archive_path) -> None:
+    archive = ObservationArchive(archive_path)
+    arrays = archive.arrays("UNRATE")
+    assert arrays["date"].dtype == np.dtype("datetime64[D]")
+    assert arrays["date"][0] == np.datetime64("1948-01-01")
+    assert arrays["value"].tolist() == [3.4]
+    assert not arrays["value"].flags["OWNDATA"]
+    assert not arrays["value"].flags["WRITEABLE"]
+
+
+def test_archive_reader_pickles_by_path(archive_path) -> None:
+    archive = pickle.loads(pickle.dumps(ObservationArchive(archive_path)))
+    assert archive.get("UNRATE")[0].value == 3.4
+
+
+def test_archive_rejects_unknown_files_and_series(tmp_path, archive_path) -> None:
+    bogus = tmp_path / "bogus"
+    bogus.write_bytes(b"not an archive")
+    with pytest.raises(ValueError):
+        ObservationArchive(bogus)
+    with pytest.raises(KeyError):
+        ObservationArchive(archive_path).get("CPI")
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+
+from benchmarks import run as bench_run
+from benchmarks.mock_server import MockFredServer
+from fredtools.client import Fred, FredConfig, use_client
+from fredtools.series import Series
+
+
+def test_mock_server_serves_observations_over_http() -> None:
+    with MockFredServer(observations=3) as server:
+        client = Fred(FredConfig(api_key="k", base_url=server.base_url), register_default=False)
+        with use_client(client):
+            series = Series("GDP")
+            observations = series.observations()
+    assert series.title == "Synthetic series GDP"
+    assert len(observations) == 3
+    assert server.requests == 2
+
+
+def test_benchmark_suite_runs_quick_and_compares(tmp_path) -> None:
+    output = tmp_path / "bench.json"
+    assert bench_run.main(["--quick", "--filter", "parse", "--output", str(output)]) == 0
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert "release.parse_release_table" in report["results"]
+    assert "pipeline.stream_observations" not in report["results"]
+
+    baseline = {name: {"median": result["median"] * 10} for name, result in report["results"].items()}
+    assert bench_run.compare(report["results"], baseline, threshold=1.25) == []
+    slower = {name: {"median": result["median"] / 10} for name, result in report["results"].items()}
+    assert sorted(bench_run.compare(report["results"], slower, threshold=1.25)) == sorted(report["results"])
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+from datetime import date, timedelta
+from typing import Any, Mapping
+
+import pytest
+
+from fredtools.chunking import fetch_observations
+from fredtools.types import Observation
+
+OPEN = date(9999, 12, 31)
+
+
+class CappedServer:
+    """Serves observations like the API: at most ``cap`` rows, plus the full count."""
+
+    def __init__(self, rows: list[Observation], cap: int) -> None:
+        self.rows = rows
+        self.cap = cap
+        self.requests: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, params: Mapping[str, Any]) -> tuple[list[Observation], int | None]:
+        with self._lock:
+            self.requests.append(dict(params))
+        start = _date(params.get("observation_start"), date.min)
+        end = _date(params.get("observation_end"), date.max)
+        realtime_start = _date(params.get("realtime_start"), None)
+        realtime_end = _date(params.get("realtime_end"), None)
+        matched = []
+        for row in self.rows:
+            if not start <= row.date <= end:
+                continue
+            if realtime_start is not None:
+                if row.realtime_end < realtime_start or row.realtime_start > realtime_end:
+                    continue
+                # The API clips vintages to the requested realtime window.
+                row = Observation(
+                    realtime_start=max(row.realtime_start, realtime_start),
+                    realtime_end=min(row.realtime_end, realtime_end),
+                    date=row.date,
+                    value=row.value,
+                )
+            else:
+                row = Observation(row.realtime_start, row.realtime_end, row.date, row.value)
+            matched.append(row)
+        return matched[: self.cap], len(matched)
+
+
+def _date(value: Any, default: Any) -> Any:
+    return default if value is None else date.fromisoformat(value)
+
+
+def daily(days: int, start: date = date(2000, 1, 1)) -> list[Observation]:
+    return [
+        Observation(date(2024, 1, 1), OPEN, start + timedelta(days=offset), float(offset))
+        for offset in range(days)
+    ]
+
+
+def test_untruncated_requests_are_sent_once() -> None:
+    server = CappedServer(daily(10), cap=100)
+    rows = fetch_observations(server, {"series_id": "X"})
+    assert len(rows) == 10
+    assert len(server.requests) == 1
+
+
+def test_truncated_requests_are_split_into_date_windows() -> None:
+    rows = daily(1000)
+    server = CappedServer(rows, cap=100)
+    result = fetch_observations(server, {"series_id": "X", "observation_end": "2002-12-31"})
+    assert result == rows
+    assert len(server.requests) > 10
+    assert all(request["series_id"] == "X" for request in server.requests)
+
+
+def test_open_ended_window_collects_every_row() -> None:
+    rows = daily(450)
+    server = CappedServer(rows, cap=100)
+    assert fetch_observations(server, {"series_id": "X"}, max_workers=1) == rows
+
+
+def test_transformed_requests_continue_from_last_date() -> None:
+    rows = daily(250)
+    server = CappedServer(rows, cap=100)
+    result = fetch_observations(server, {"series_id": "X", "units": "pch"})
+    assert result == rows
+    starts = [request.get("observation_start") for request in server.requests]
+    assert starts == [None, "2000-04-09", "2000-07-17"]
+
+
+def test_single_date_pages_split_the_realtime_window() -> None:
+    vintages = [
+        Observation(
+            realtime_start=date(2001, 1, 1) + timedelta(days=10 * index),
+            realtime_end=date(2001, 1, 10) + timedelta(days=10 * index),
+            date=date(2000, 1, 1),
+            value=float(index),
+        )
+        for index in range(30)
+    ]
+    server = CappedServer(vintages, cap=8)
+    result = fetch_observations(
+        server,
+        {"series_id": "X", "realtime_start": "2001-01-01", "realtime_end": "2001-12-31"},
+    )
+    assert result == vintages
+
+
+def test_vintages_spanning_a_realtime_split_are_joined() -> None:
+    vintages = [
+        Observation(date(2001, 1, 1), date(2001, 9, 30), date(2000, 1, 1), 1.0),
+        Observation(date(2001, 10, 1), date(2001, 10, 31), date(2000, 1, 1), 2.0),
+        Observation(date(2001, 11, 1), date(2001, 11, 30), date(2000, 1, 1), 3.0),
+        Observation(date(2001, 12, 1), date(2001, 12, 31), date(2000, 1, 1), 4.0),
+    ]
+    server = CappedServer(vintages, cap=3)
+    result = fetch_observations(
+        server,
+        {"series_id": "X", "realtime_start": "2001-01-01", "realtime_end": "2001-12-31"},
+    )
+    assert result == vintages
+
+
+def test_unsplittable_capped_responses_raise() -> None:
+    server = CappedServer(daily(300), cap=100)
+    with pytest.raises(RuntimeError, match="output_type=2"):
+        fetch_observations(server, {"series_id": "X", "output_type": 2})
+
+    same_day = [
+        Observation(date(2001, 1, 1), date(2001, 1, 1), date(2000, 1, 1), float(index))
+        for index in range(5)
+    ]
+    server = CappedServer(same_day, cap=2)
+    with pytest.raises(RuntimeError, match="single realtime day"):
+        fetch_observations(
+            server,
+            {"series_id": "X", "realtime_start": "2001-01-01", "realtime_end": "2001-01-01"},
+        )
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import csv
+from typing import Any, Mapping
+
+import pytest
+
+from fredtools import cli
+from fredtools.client import Fred
+
+
+def fake_transport(self: Fred, url: str, params: Mapping[str, Any], timeout: float | None = None) -> Any:
+    if params["series_id"] == "BROKEN":
+        raise RuntimeError("boom")
+    return {
+        "observations": [
+            {
+                "realtime_start": "2020-01-01",
+                "realtime_end": "2020-01-01",
+                "date": "2020-01-01",
+                "value": "1.5",
+            },
+            {
+                "realtime_start": "2020-01-01",
+                "realtime_end": "2020-01-01",
+                "date": "2020-02-01",
+                "value": ".",
+            },
+        ]
+    }
+
+
+@pytest.fixture
+def ids_file(tmp_path):
+    path = tmp_path / "ids.txt"
+    path.write_text("GDP\n# comment\n\nUNRATE  # inline\nGDP\n", encoding="utf-8")
+    return path
+
+
+def test_download_writes_csv_and_checkpoint(
+    tmp_path,
+    ids_file,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def recording_transport(self, url, params, timeout=None):
+        calls.append(params["series_id"])
+        assert params["observation_start"] == "2020-01-01"
+        return fake_transport(self, url, params, timeout)
+
+    monkeypatch.setattr(Fred, "_default_transport", recording_transport)
+    out = tmp_path / "out"
+    argv = [
+        "download",
+        "--ids", str(ids_file),
+        "--out", str(out),
+        "--workers", "1",
+        "--api-key", "k",
+        "--rate-limit", "6000",
+        "--observation-start", "2020-01-01",
+    ]
+    assert cli.main(argv) == 0
+    assert calls == ["GDP", "UNRATE"]
+    with (out / "GDP.csv").open(encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0] == ["date", "value", "realtime_start", "realtime_end"]
+    assert rows[1][:2] == ["2020-01-01", "1.5"]
+    assert rows[2][:2] == ["2020-02-01", "."]
+    assert (out / cli.CHECKPOINT_NAME).read_text(encoding="utf-8").split() == ["GDP", "UNRATE"]
+
+    assert cli.main(argv) == 0
+    assert calls == ["GDP", "UNRATE"]
+    assert cli.main([*argv, "--no-resume"]) == 0
+    assert calls == ["GDP", "UNRATE", "GDP", "UNRATE"]
+
+
+def test_download_reports_failures_without_checkpointing(
+    tmp_path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(Fred, "_default_transport", fake_transport)
+    ids = tmp_path / "ids.txt"
+    ids.write_text("BROKEN\nGDP\n", encoding="utf-8")
+    out = tmp_path / "out"
+    code = cli.main(
+        ["download", "--ids", str(ids), "--out", str(out), "--workers", "1", "--api-key", "k", "--rate-limit", "6000"]
+    )
+    assert code == 1
+    assert "BROKEN: RuntimeError: boom" in capsys.readouterr().err
+    assert (out / cli.CHECKPOINT_NAME).read_text(encoding="utf-8").split() == ["GDP"]
+    assert not (out / "BROKEN.csv").exists()
+    assert not list(out.glob(".*.partial"))
+
+
+def test_download_writes_npz(tmp_path, ids_file, monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+    monkeypatch.setattr(Fred, "_default_transport", fake_transport)
+    out = tmp_path / "out"
+    cli.main(["download", "--ids", str(ids_file), "--out", str(out), "--workers", "1", "--api-key", "k", "--format", "npz", "--rate-limit", "6000"])
+    with np.load(out / "UNRATE.npz") as data:
+        assert str(data["date"][1]) == "2020-02-01"
+        assert np.isnan(data["value"][1])
+
+
+def test_download_requires_api_key(tmp_path, ids_file, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("FRED_API_KEY", raising=False)
+    with pytest.raises(SystemExit):
+        cli.main(["download", "--ids", str(ids_file), "--out", str(tmp_path), "--api-key", ""])
+
+
+def test_download_fetches_rows_beyond_the_row_cap(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from tests.conftest import CappedObservationsServer
+
+    server = CappedObservationsServer(days=250, cap=100)
+    monkeypatch.setattr(
+        Fred,
+        "_default_transport",
+        lambda self, url, params, timeout=None, decode=None: server(url, params, timeout, decode),
+    )
+    ids = tmp_path / "ids.txt"
+    ids.write_text("GDP\n", encoding="utf-8")
+    out = tmp_path / "out"
+    argv = ["download", "--ids", str(ids), "--out", str(out), "--workers", "1", "--api-key", "k"]
+    assert cli.main(argv) == 0
+    with (out / "GDP.csv").open(encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert len(rows) == 251
+    assert rows[-1][:2] == ["2000-09-06", "249.0"]
+    assert server.observation_requests > 1
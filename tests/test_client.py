@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import gzip
 import io
 import json
-from types import SimpleNamespace
+import zlib
 
 import pytest
 
@@ -14,6 +15,7 @@ from fredtools.client import (
     set_default_client,
     use_client,
 )
+from tests.conftest import DummyResponse
 
 
 class DummyClient:
@@ -84,20 +86,12 @@ def test_default_transport_builds_query_and_loads_json(monkeypatch: pytest.Monke
     fred = Fred(FredConfig(api_key="k"), register_default=False)
     captured: dict[str, object] = {}
 
-    def fake_urlopen(url: str, timeout: float | None = None) -> SimpleNamespace:
-        captured["url"] = url
+    def fake_urlopen(request, timeout: float | None = None) -> DummyResponse:
+        captured["url"] = request.full_url
         captured["timeout"] = timeout
+        return DummyResponse(json.dumps({"status": "ok"}).encode())
 
-        class DummyResponse:
-            def __enter__(self) -> io.StringIO:
-                return io.StringIO(json.dumps({"status": "ok"}))
-
-            def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
-                return None
-
-        return DummyResponse()
-
-    monkeypatch.setattr(client_module.urlrequest, "urlopen", fake_urlopen)
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
     result = fred._default_transport("https://fred", {"a": "1"}, timeout=3.0)
     assert captured == {"url": "https://fred?a=1", "timeout": 3.0}
     assert result == {"status": "ok"}
@@ -119,3 +113,158 @@ def test_request_invokes_transport_with_prepared_values() -> None:
     assert captured["url"] == "https://example.org/release/series"
     assert captured["timeout"] == 2.5
     assert captured["params"] == {"api_key": "k", "file_type": "json", "limit": 10}
+
+
+def test_default_transport_reports_bytes_and_decode_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    from fredtools.instrumentation import MetricsCollector
+
+    body = json.dumps({"status": "ok"}).encode()
+    monkeypatch.setattr("urllib.request.urlopen", lambda request, timeout=None: DummyResponse(body))
+    metrics = MetricsCollector()
+    fred = Fred(FredConfig(api_key="k", hooks=[metrics]), register_default=False)
+    assert fred.request("series") == {"status": "ok"}
+    counters = metrics.snapshot()["endpoints"]["series"]["counters"]
+    assert counters["bytes_received"] == len(body)
+    assert metrics.snapshot()["endpoints"]["series"]["histograms"]["decode_time"]["count"] == 1
+
+
+def test_request_log_redacts_api_key(caplog: pytest.LogCaptureFixture) -> None:
+    config = FredConfig(api_key="secret-key", transport=lambda url, params, timeout: {})
+    fred = Fred(config, register_default=False)
+    with caplog.at_level("INFO", logger="fredtools.client"):
+        fred.request("tags/series", params={"tag_names": "gdp;usa"})
+    message = caplog.records[0].getMessage()
+    assert "secret-key" not in message
+    assert message.startswith("Requesting https://api.stlouisfed.org/fred/tags/series?api_key=REDACTED")
+    assert "tag_names=gdp;usa" in message
+    assert caplog.records[0].fred_endpoint == "tags/series"
+
+
+def test_request_skips_url_building_when_logging_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_urlencode(*args, **kwargs):
+        raise AssertionError("query string built while logging is disabled")
+
+    monkeypatch.setattr(client_module.urlparse, "urlencode", fail_urlencode)
+    original_level = client_module.logger.level
+    client_module.logger.setLevel("WARNING")
+    try:
+        fred = Fred(FredConfig(api_key="k", transport=lambda url, params, timeout: {"ok": 1}), register_default=False)
+        assert fred.request("series") == {"ok": 1}
+    finally:
+        client_module.logger.setLevel(original_level)
+
+
+@pytest.mark.parametrize(
+    ("encoding", "compress"),
+    [
+        ("gzip", gzip.compress),
+        ("deflate", zlib.compress),
+        ("deflate", lambda data: zlib.compress(data)[2:-4]),
+        (None, lambda data: data),
+    ],
+)
+def test_default_transport_negotiates_and_decompresses(
+    monkeypatch: pytest.MonkeyPatch,
+    encoding,
+    compress,
+) -> None:
+    from fredtools.instrumentation import MetricsCollector
+
+    body = json.dumps({"observations": [{"value": "1"}] * 200}).encode()
+    wire = compress(body)
+    captured: dict[str, object] = {}
+
+    def fake_urlopen(request, timeout=None) -> DummyResponse:
+        captured["accept"] = request.get_header("Accept-encoding")
+        headers = {"Content-Encoding": encoding} if encoding else {}
+        return DummyResponse(wire, headers)
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    metrics = MetricsCollector()
+    fred = Fred(FredConfig(api_key="k", hooks=[metrics]), register_default=False)
+    assert fred.request("series/observations") == json.loads(body)
+    assert "gzip" in captured["accept"] and "deflate" in captured["accept"]
+    counters = metrics.snapshot()["endpoints"]["series/observations"]["counters"]
+    assert counters["bytes_received"] == len(body)
+    assert counters["compressed_bytes"] == len(wire)
+
+
+def test_default_transport_can_disable_compression(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, object] = {}
+
+    def fake_urlopen(request, timeout=None) -> DummyResponse:
+        captured["accept"] = request.get_header("Accept-encoding")
+        return DummyResponse(b"{}")
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    fred = Fred(FredConfig(api_key="k", compression=False), register_default=False)
+    assert fred.request("series") == {}
+    assert captured["accept"] is None
+
+
+def test_default_transport_uses_configured_json_decoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = json.dumps({"status": "ok"}).encode()
+    seen: list[bytes] = []
+    monkeypatch.setattr("urllib.request.urlopen", lambda request, timeout=None: DummyResponse(body))
+    fred = Fred(
+        FredConfig(api_key="k", json_decoder=lambda raw: seen.append(raw) or {"decoded": True}),
+        register_default=False,
+    )
+    assert fred.request("series") == {"decoded": True}
+    assert seen == [body]
+
+
+def test_byte_transport_body_reaches_decoder_without_copy() -> None:
+    from fredtools.client import RawResponse
+
+    body = memoryview(json.dumps({"status": "ok"}).encode())
+    seen: list[object] = []
+
+    def decoder(raw):
+        seen.append(raw)
+        return json.loads(bytes(raw))
+
+    fred = Fred(
+        FredConfig(api_key="k", byte_transport=lambda url, params, timeout: RawResponse(body), json_decoder=decoder),
+        register_default=False,
+    )
+    assert fred.request("series") == {"status": "ok"}
+    assert seen[0] is body
+
+
+def test_byte_transport_streams_are_read_and_decompressed() -> None:
+    from fredtools.client import RawResponse
+    from fredtools.instrumentation import MetricsCollector
+
+    body = json.dumps({"seriess": []}).encode()
+    wire = gzip.compress(body)
+    metrics = MetricsCollector()
+    fred = Fred(
+        FredConfig(
+            api_key="k",
+            byte_transport=lambda url, params, timeout: RawResponse(io.BytesIO(wire), {"content-encoding": "gzip"}),
+            hooks=[metrics],
+        ),
+        register_default=False,
+    )
+    assert fred.request("series") == {"seriess": []}
+    counters = metrics.snapshot()["endpoints"]["series"]["counters"]
+    assert (counters["bytes_received"], counters["compressed_bytes"]) == (len(body), len(wire))
+
+
+def test_request_raw_returns_undecoded_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("urllib.request.urlopen", lambda request, timeout=None: DummyResponse(b"a,b\n1,2\n", {"Content-Type": "text/csv"}))
+    raw = Fred(FredConfig(api_key="k"), register_default=False).request_raw("series/observations", {"file_type": "csv"})
+    assert bytes(raw.buffer()) == b"a,b\n1,2\n"
+    assert raw.headers["Content-Type"] == "text/csv"
+
+
+def test_transport_and_byte_transport_are_exclusive() -> None:
+    legacy = Fred(FredConfig(api_key="k", transport=lambda url, params, timeout: {}), register_default=False)
+    with pytest.raises(RuntimeError):
+        legacy.request_raw("series")
+    with pytest.raises(ValueError):
+        Fred(
+            FredConfig(api_key="k", transport=lambda *args: {}, byte_transport=lambda *args: None),
+            register_default=False,
+        )
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextvars import ContextVar
+
+import pytest
+
+from fredtools.client import Fred, FredConfig, get_current_client
+from fredtools.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimiter,
+    ContextThreadPoolExecutor,
+    response_status,
+)
+from fredtools.instrumentation import MetricsCollector
+from fredtools.series import Series
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+class CountingTransport:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def __call__(self, url, params, timeout):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return {"seriess": [{"id": params["series_id"], "title": params["series_id"].lower()}]}
+
+
+def test_executor_runs_tasks_in_the_submitting_context() -> None:
+    request_id.set("outer")
+    with ContextThreadPoolExecutor(max_workers=2) as executor:
+        assert executor.submit(request_id.get).result() == "outer"
+        request_id.set("changed")
+        assert list(executor.map(lambda _: request_id.get(), range(2))) == ["changed", "changed"]
+
+
+def test_fred_map_binds_client_and_enforces_max_concurrency() -> None:
+    transport = CountingTransport()
+    fred = Fred(FredConfig(api_key="k", transport=transport, max_concurrency=2), register_default=False)
+    with pytest.raises(RuntimeError):
+        get_current_client()
+
+    titles = fred.map(lambda series_id: Series(series_id).title, [f"S{index}" for index in range(8)], max_workers=6)
+
+    assert titles == [f"s{index}" for index in range(8)]
+    assert transport.peak == 2
+    assert fred.concurrency_limiter.in_flight == 0
+
+
+def test_fred_map_reraises_worker_errors() -> None:
+    fred = Fred(FredConfig(api_key="k", transport=lambda url, params, timeout: {"seriess": []}), register_default=False)
+    with pytest.raises(ValueError):
+        fred.map(lambda series_id: Series.hydrate_many([series_id], max_workers=1), ["MISSING"])
+
+
+def test_concurrency_limiter_releases_on_error() -> None:
+    limiter = ConcurrencyLimiter(1)
+    with pytest.raises(KeyError):
+        with limiter:
+            raise KeyError("boom")
+    assert limiter.in_flight == 0
+    with pytest.raises(ValueError):
+        ConcurrencyLimiter(0)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class HTTPStatusError(Exception):
+    def __init__(self, code: int) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+def run_request(limiter: ConcurrencyLimiter, latency: float | None = 0.1, error: BaseException | None = None) -> None:
+    limiter.acquire()
+    limiter.release(latency=latency, error=error)
+
+
+def test_adaptive_limiter_grows_additively_and_publishes_gauge() -> None:
+    metrics = MetricsCollector()
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4, metrics=metrics)
+    assert metrics.snapshot()["gauges"] == {"concurrency_limit": 2}
+    for _ in range(2):
+        run_request(limiter)
+    assert limiter.limit == 2
+    run_request(limiter)
+    assert limiter.limit == 3
+    for _ in range(20):
+        run_request(limiter)
+    assert limiter.limit == 4
+    assert metrics.snapshot()["gauges"] == {"concurrency_limit": 4}
+
+
+def test_adaptive_limiter_backs_off_on_overload_and_latency_spikes() -> None:
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial=16, cooldown=1.0, clock=clock)
+    run_request(limiter, error=HTTPStatusError(429))
+    assert limiter.limit == 8
+    run_request(limiter, error=HTTPStatusError(503))
+    assert limiter.limit == 8  # still cooling down
+    run_request(limiter, error=ValueError("bad payload"))
+    clock.now = 2.0
+    run_request(limiter, error=HTTPStatusError(404))
+    assert limiter.limit == 8
+
+    run_request(limiter, latency=0.1)
+    clock.now = 4.0
+    run_request(limiter, latency=1.0)
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_fred_reports_outcomes_to_its_shared_limiter() -> None:
+    def overloaded(url, params, timeout):
+        raise HTTPStatusError(429)
+
+    limiter = AdaptiveConcurrencyLimiter(initial=8)
+    fred = Fred(FredConfig(api_key="k", transport=overloaded, concurrency_limiter=limiter), register_default=False)
+    with pytest.raises(HTTPStatusError):
+        fred.request("series")
+    assert limiter.limit == 4
+    assert fred.executor()._max_workers == limiter.max_limit
+    with pytest.raises(ValueError):
+        Fred(FredConfig(api_key="k", max_concurrency=2, concurrency_limiter=limiter), register_default=False)
+
+
+def test_response_status_reads_common_error_shapes() -> None:
+    class Response:
+        status_code = 502
+
+    class WithResponse(Exception):
+        response = Response()
+
+    assert response_status(WithResponse()) == 502
+    assert response_status(HTTPStatusError(429)) == 429
+    assert response_status(ValueError()) is None
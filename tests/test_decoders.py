@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from fredtools import decoders
+from fredtools.decoders import available_backends, resolve_json_decoder
+
+BODY = json.dumps({"observations": [{"date": "2024-01-01", "value": "1.5"}], "count": 1}).encode()
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_every_available_backend_decodes_bytes(name: str) -> None:
+    assert resolve_json_decoder(name)(BODY) == json.loads(BODY)
+
+
+def test_auto_prefers_fast_backends(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(decoders, "available_backends", lambda: ["msgspec", "json"])
+    loaded: list[str] = []
+    monkeypatch.setattr(decoders, "_load_backend", lambda name: loaded.append(name) or json.loads)
+    resolve_json_decoder("auto")
+    assert loaded == ["msgspec"]
+    assert available_backends()[-1:] == ["json"]
+
+
+def test_resolve_accepts_callables_and_rejects_unknown_names() -> None:
+    def custom(body: bytes) -> str:
+        return "custom"
+
+    assert resolve_json_decoder(custom) is custom
+    with pytest.raises(ValueError):
+        resolve_json_decoder("yaml")
+
+
+def test_missing_backend_raises_install_hint(monkeypatch: pytest.MonkeyPatch) -> None:
+    import builtins
+
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "orjson":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    with pytest.raises(RuntimeError, match="pip install orjson"):
+        resolve_json_decoder("orjson")
+    assert "orjson" not in available_backends()
+
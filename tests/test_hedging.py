@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from fredtools.client import Fred, FredConfig
+from fredtools.hedging import HedgePolicy
+from fredtools.instrumentation import MetricsCollector
+
+
+class CountingLimiter:
+    def __init__(self) -> None:
+        self.acquired = 0
+
+    def acquire(self) -> float:
+        self.acquired += 1
+        return 0.0
+
+
+class SequencedTransport:
+    """Serves calls in order; each entry is (delay, result or exception)."""
+
+    def __init__(self, *behaviours) -> None:
+        self.behaviours = list(behaviours)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url, params, timeout):
+        with self.lock:
+            delay, outcome = self.behaviours[self.calls]
+            self.calls += 1
+        time.sleep(delay)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def make_client(transport, policy: HedgePolicy, **kwargs) -> Fred:
+    return Fred(FredConfig(api_key="k", transport=transport, hedging=policy, **kwargs), register_default=False)
+
+
+def test_policy_uses_percentile_after_warmup_and_caps_budget() -> None:
+    policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0.0, budget=0.5, burst=1)
+    assert policy.delay_for("series") is None
+    for latency in range(1, 11):
+        policy.record("series", latency / 100)
+    assert policy.delay_for("series") == 0.10
+    assert policy.delay_for("/series/observations") is None
+
+    assert policy.try_spend()
+    assert not policy.try_spend()
+    policy.record("series", 0.01)
+    policy.record("series", 0.01)
+    assert policy.try_spend()
+    assert policy.hedges_sent == 2
+
+
+def test_slow_primary_is_hedged_and_hedge_wins() -> None:
+    transport = SequencedTransport((0.5, {"from": "primary"}), (0.0, {"from": "hedge"}))
+    limiter = CountingLimiter()
+    metrics = MetricsCollector()
+    fred = make_client(transport, HedgePolicy(delay=0.02), rate_limiter=limiter, hooks=[metrics])
+
+    started = time.perf_counter()
+    assert fred.request("series/observations") == {"from": "hedge"}
+    assert time.perf_counter() - started < 0.4
+    assert limiter.acquired == 2
+    counters = metrics.snapshot()["endpoints"]["series/observations"]["counters"]
+    assert (counters["hedged"], counters["hedge_wins"]) == (1, 1)
+
+
+def test_hedge_covers_a_failed_primary_and_errors_surface_when_both_fail() -> None:
+    transport = SequencedTransport((0.05, RuntimeError("primary")), (0.0, {"ok": True}))
+    assert make_client(transport, HedgePolicy(delay=0.01)).request("series") == {"ok": True}
+
+    failing = SequencedTransport((0.05, RuntimeError("primary")), (0.0, RuntimeError("hedge")))
+    with pytest.raises(RuntimeError, match="primary"):
+        make_client(failing, HedgePolicy(delay=0.01)).request("series")
+
+
+def test_no_hedge_for_other_endpoints_or_without_budget() -> None:
+    transport = SequencedTransport((0.05, {"ok": 1}), (0.05, {"ok": 2}))
+    fred = make_client(transport, HedgePolicy(delay=0.01, endpoints=["series/observations"]))
+    assert fred.request("series") == {"ok": 1}
+
+    fred = make_client(transport, HedgePolicy(delay=0.01, burst=0))
+    assert fred.request("series") == {"ok": 2}
+    assert transport.calls == 2
+
+
+def test_hedge_delay_counts_from_when_the_primary_starts() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from fredtools.hedging import hedged_call
+
+    policy = HedgePolicy(delay=0.05)
+    hedged = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        blocker = executor.submit(time.sleep, 0.1)
+        result = hedged_call(
+            policy, executor, "series", lambda: time.sleep(0.02) or "primary",
+            on_hedge=hedged.append,
+        )
+        blocker.result()
+    assert result == "primary"
+    assert (policy.hedges_sent, hedged) == (0, [])
+    assert policy._latencies["series"][0] < 0.05
+
+
+class SlowLimiter(CountingLimiter):
+    def acquire(self) -> float:
+        time.sleep(0.1)
+        return super().acquire()
+
+
+def test_hedge_skips_its_request_once_the_primary_has_won() -> None:
+    transport = SequencedTransport((0.05, {"from": "primary"}), (0.0, {"from": "hedge"}))
+    with make_client(transport, HedgePolicy(delay=0.01), rate_limiter=SlowLimiter()) as fred:
+        assert fred.request("series") == {"from": "primary"}
+        time.sleep(0.15)
+    assert transport.calls == 1
+
+
+def test_closing_the_client_shuts_down_the_hedge_pool() -> None:
+    transport = SequencedTransport((0.05, {"from": "primary"}), (0.0, {"from": "hedge"}))
+    with make_client(transport, HedgePolicy(delay=0.01)) as fred:
+        assert fred.request("series") == {"from": "hedge"}
+        executor = fred._hedge_executor
+        assert executor is not None
+    assert fred._hedge_executor is None
+    for thread in list(executor._threads):
+        thread.join(1)
+        assert not thread.is_alive()
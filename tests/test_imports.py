@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import fredtools
+
+# Cumulative import time of the bare package, in microseconds. Measured at
+# ~2ms; the headroom absorbs slow CI machines, not new eager imports.
+IMPORT_BUDGET_US = 50_000
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def loaded_modules(statement: str) -> set[str]:
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    return set(json.loads(run_python(code).stdout))
+
+
+def test_import_fredtools_loads_no_submodules() -> None:
+    modules = loaded_modules("import fredtools")
+    assert {name for name in modules if name.startswith("fredtools.")} == set()
+    assert "urllib.request" not in modules
+
+
+def test_client_import_defers_http_stack_and_unrelated_modules() -> None:
+    modules = loaded_modules("from fredtools import Fred, Series")
+    assert "urllib.request" not in modules
+    assert "fredtools.releases" not in modules
+    assert "fredtools.categories" not in modules
+
+
+def test_import_time_within_budget() -> None:
+    stderr = run_python("import fredtools", "-X", "importtime").stderr
+    line = next(line for line in stderr.splitlines() if line.rstrip().endswith("| fredtools"))
+    cumulative = int(line.split("|")[1])
+    assert cumulative < IMPORT_BUDGET_US
+
+
+def test_lazy_attributes_resolve_and_are_listed() -> None:
+    from fredtools.client import Fred
+
+    assert fredtools.Fred is Fred
+    assert set(fredtools.__all__) <= set(dir(fredtools))
+    with pytest.raises(AttributeError):
+        fredtools.NotAThing
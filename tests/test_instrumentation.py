@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+import pytest
+
+from fredtools.client import Fred, FredConfig, use_client
+from fredtools.instrumentation import (
+    Histogram,
+    MetricsCollector,
+    OpenTelemetryHook,
+    RequestStats,
+    current_request_stats,
+)
+from fredtools.series import Series
+
+
+class FakeSpan:
+    def __init__(self, name: str, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exceptions: list[BaseException] = []
+        self.ended = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.exceptions.append(exc)
+
+    def end(self) -> None:
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self) -> None:
+        self.spans: list[FakeSpan] = []
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> FakeSpan:
+        span = FakeSpan(name, attributes)
+        self.spans.append(span)
+        return span
+
+
+OBSERVATIONS = {
+    "observations": [
+        {
+            "realtime_start": "2020-01-01",
+            "realtime_end": "2020-01-01",
+            "date": "2020-01-01",
+            "value": "1",
+        }
+    ]
+}
+
+
+def reporting_transport(url: str, params: dict[str, Any], timeout: float | None) -> Any:
+    stats = current_request_stats()
+    assert stats is not None
+    stats.bytes_received = 2048
+    stats.decode_time = 0.001
+    stats.retries = 1
+    stats.cache_hit = params.get("cached") == "1"
+    if params.get("fail"):
+        raise RuntimeError("boom")
+    return OBSERVATIONS
+
+
+def make_client(*hooks) -> Fred:
+    return Fred(
+        FredConfig(api_key="k", transport=reporting_transport, hooks=hooks),
+        register_default=False,
+    )
+
+
+def test_metrics_collector_aggregates_per_endpoint() -> None:
+    metrics = MetricsCollector()
+    client = make_client(metrics)
+    client.request("series/observations")
+    client.request("/series/observations", params={"cached": "1"})
+    with pytest.raises(RuntimeError):
+        client.request("series", params={"fail": True})
+
+    snapshot = metrics.snapshot()["endpoints"]
+    observations = snapshot["series/observations"]
+    assert observations["counters"]["requests"] == 2
+    assert observations["counters"]["cache_hits"] == 1
+    assert observations["counters"]["retries"] == 2
+    assert observations["counters"]["bytes_received"] == 4096
+    assert observations["histograms"]["latency"]["count"] == 2
+    assert observations["histograms"]["decode_time"]["sum"] == pytest.approx(0.002)
+    assert snapshot["series"]["counters"]["errors"] == 1
+
+
+def test_parse_time_is_reported_for_observations() -> None:
+    metrics = MetricsCollector()
+    client = make_client(metrics)
+    with use_client(client):
+        Series(series_id="S1", title="S", realtime_start=date(2020, 1, 1)).observations()
+    parse_time = metrics.snapshot()["endpoints"]["series/observations"]["histograms"]["parse_time"]
+    assert parse_time["count"] == 1
+
+
+def test_opentelemetry_hook_records_spans_and_errors() -> None:
+    tracer = FakeTracer()
+    client = make_client(OpenTelemetryHook(tracer))
+    client.request("series/observations")
+    with pytest.raises(RuntimeError):
+        client.request("series", params={"fail": True})
+    first, second = tracer.spans
+    assert first.attributes["fred.endpoint"] == "series/observations"
+    assert first.attributes["fred.bytes_received"] == 2048
+    assert first.ended and second.ended
+    assert isinstance(second.exceptions[0], RuntimeError)
+
+
+def test_failing_hooks_do_not_break_requests() -> None:
+    class BrokenHook:
+        def on_request_start(self, stats: RequestStats) -> None:
+            raise ValueError("start")
+
+        def on_request_end(self, stats: RequestStats, token: Any) -> None:
+            raise ValueError("end")
+
+        def on_parse(self, endpoint: str, seconds: float) -> None:
+            raise ValueError("parse")
+
+    client = make_client(BrokenHook())
+    assert client.request("series/observations") == OBSERVATIONS
+
+
+def test_uninstrumented_requests_do_not_track_stats() -> None:
+    seen: list[Any] = []
+
+    def transport(url: str, params: dict[str, Any], timeout: float | None) -> Any:
+        seen.append(current_request_stats())
+        return {}
+
+    client = Fred(FredConfig(api_key="k", transport=transport), register_default=False)
+    client.request("series")
+    assert seen == [None]
+    assert client.hooks == ()
+
+
+def test_histogram_buckets_values() -> None:
+    histogram = Histogram([1, 10])
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {1: 2, 10: 1, float("inf"): 1}
+    assert (snapshot["min"], snapshot["max"], snapshot["count"]) == (0.5, 50, 4)
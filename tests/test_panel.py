@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import math
+from datetime import date
+
+import pytest
+
+from fredtools import panel as panel_module
+from fredtools.panel import Panel
+from fredtools.types import Observation, ObservationsResult
+
+
+def result(pairs: list[tuple[date, float]]) -> ObservationsResult:
+    return ObservationsResult(
+        Observation(
+            realtime_start=date(2024, 1, 1),
+            realtime_end=date(2024, 1, 1),
+            date=observation_date,
+            value=value,
+        )
+        for observation_date, value in pairs
+    )
+
+
+def nan_to_none(values: list[float]) -> list[float | None]:
+    return [None if math.isnan(value) else value for value in values]
+
+
+@pytest.fixture(autouse=True, params=["numpy", "python"])
+def alignment(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(panel_module, "_numpy", lambda: None)
+    return request.param
+
+
+@pytest.fixture
+def panel() -> Panel:
+    monthly = result([(date(2020, 1, 1), 1.0), (date(2020, 2, 1), math.nan), (date(2020, 3, 1), 3.0)])
+    weekly_columns = {
+        "date": [date(2020, 1, 10), date(2020, 2, 1), date(2020, 3, 1)],
+        "value": [10.0, 20.0, 30.0],
+    }
+    return Panel({"M": monthly}).add("W", weekly_columns)
+
+
+def test_outer_join_aligns_on_union_of_dates(panel: Panel) -> None:
+    frame = panel.build()
+    assert frame.dates == [date(2020, 1, 1), date(2020, 1, 10), date(2020, 2, 1), date(2020, 3, 1)]
+    assert frame.shape == (4, 2)
+    assert nan_to_none(frame.column("M")) == [1.0, None, None, 3.0]
+    assert nan_to_none(frame.column("W")) == [None, 10.0, 20.0, 30.0]
+
+
+def test_outer_join_forward_fills_unobserved_dates_only(panel: Panel) -> None:
+    frame = panel.build(fill="ffill")
+    assert nan_to_none(frame.column("M")) == [1.0, 1.0, None, 3.0]
+    assert nan_to_none(frame.column("W")) == [None, 10.0, 20.0, 30.0]
+
+
+def test_inner_join_keeps_common_dates(panel: Panel) -> None:
+    frame = panel.build(how="inner")
+    assert frame.dates == [date(2020, 2, 1), date(2020, 3, 1)]
+    assert nan_to_none(list(frame.values)) == [None, 20.0, 3.0, 30.0]
+
+
+def test_to_numpy_is_a_zero_copy_view(panel: Panel) -> None:
+    np = pytest.importorskip("numpy")
+    frame = panel.build(fill="ffill")
+    matrix = frame.to_numpy()
+    assert matrix.shape == (4, 2)
+    assert matrix.flags["C_CONTIGUOUS"]
+    assert matrix[1, 0] == 1.0
+    frame.values[0] = 99.0
+    assert matrix[0, 0] == 99.0
+    assert np.isnan(matrix[0, 1])
+
+
+def test_panel_rejects_bad_arguments(panel: Panel) -> None:
+    with pytest.raises(ValueError):
+        panel.add("M", {"date": [], "value": []})
+    with pytest.raises(ValueError):
+        panel.build(how="left")
+    with pytest.raises(ValueError):
+        panel.build(fill="bfill")
+    assert Panel().build().shape == (0, 0)
+
+
+@pytest.mark.parametrize("how", ["outer", "inner"])
+def test_series_without_shared_dates_align(how: str) -> None:
+    panel = Panel(
+        {
+            "A": {"date": [date(2021, 1, 1), date(2021, 1, 3)], "value": [1.0, 3.0]},
+            "B": {"date": [date(2021, 1, 2)], "value": [2.0]},
+            "C": {"date": [], "value": []},
+        }
+    )
+    frame = panel.build(how=how, fill="ffill")
+    if how == "inner":
+        assert frame.shape == (0, 3)
+        return
+    assert frame.dates == [date(2021, 1, 1), date(2021, 1, 2), date(2021, 1, 3)]
+    assert nan_to_none(list(frame.values)) == [
+        1.0, None, None, 1.0, 2.0, None, 3.0, 2.0, None,
+    ]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import date
+from typing import Any, Mapping
+
+import pytest
+
+from fredtools.pipeline import stream_observations
+
+
+class RecordingClient:
+    """Thread-safe fake client that serves series metadata and observations."""
+
+    def __init__(self, delays: Mapping[str, float] | None = None) -> None:
+        self.delays = dict(delays or {})
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requested: list[str] = []
+        self._lock = threading.Lock()
+
+    def request(self, endpoint: str, params: Mapping[str, Any] | None = None) -> Any:
+        series_id = params["series_id"]
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.requested.append(f"{endpoint}:{series_id}")
+        try:
+            time.sleep(self.delays.get(series_id, 0.01))
+            if series_id == "MISSING":
+                return {"seriess": []}
+            if endpoint == "series":
+                return {"seriess": [{"id": series_id, "title": f"Title {series_id}"}]}
+            return {
+                "observations": [
+                    {
+                        "realtime_start": "2020-01-01",
+                        "realtime_end": "2020-01-01",
+                        "date": "2019-12-01",
+                        "value": ".",
+                    },
+                    {
+                        "realtime_start": "2020-01-01",
+                        "realtime_end": "2020-01-01",
+                        "date": "2020-01-01",
+                        "value": "2.5",
+                    },
+                ]
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+async def collect(stream) -> list:
+    return [item async for item in stream]
+
+
+def test_stream_yields_series_and_columns_in_completion_order() -> None:
+    client = RecordingClient(delays={"SLOW": 0.2})
+    results = asyncio.run(
+        collect(stream_observations(["SLOW", "FAST"], client=client, concurrency=2))
+    )
+    assert [series.series_id for series, _ in results] == ["FAST", "SLOW"]
+    series, columns = results[1]
+    assert series.title == "Title SLOW"
+    assert columns["date"] == [date(2019, 12, 1), date(2020, 1, 1)]
+    assert columns["value"][1] == 2.5
+    assert columns["value"][0] != columns["value"][0]
+
+
+def test_stream_bounds_concurrency_and_pulls_ids_lazily() -> None:
+    client = RecordingClient()
+    pulled: list[str] = []
+
+    def ids():
+        for index in range(10):
+            pulled.append(f"S{index}")
+            yield f"S{index}"
+
+    async def take_first() -> int:
+        stream = stream_observations(ids(), client=client, concurrency=3)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        return len(pulled)
+
+    assert asyncio.run(take_first()) == 3
+    assert client.max_in_flight <= 3
+
+    # The three workers already running when the first stream closed finish
+    # (two requests each) in the background; let them drain so the second
+    # stream is measured alone.
+    deadline = time.monotonic() + 2
+    while (client.in_flight or len(client.requested) < 6) and time.monotonic() < deadline:
+        time.sleep(0.005)
+    client.max_in_flight = 0
+    results = asyncio.run(collect(stream_observations(ids(), client=client, concurrency=3)))
+    assert len(results) == 10
+    assert client.max_in_flight <= 3
+
+
+def test_stream_accepts_async_iterables() -> None:
+    async def ids():
+        for series_id in ("A", "B"):
+            yield series_id
+
+    client = RecordingClient()
+    results = asyncio.run(collect(stream_observations(ids(), client=client)))
+    assert sorted(series.series_id for series, _ in results) == ["A", "B"]
+
+
+def test_stream_propagates_fetch_errors() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(collect(stream_observations(["MISSING"], client=RecordingClient())))
+    with pytest.raises(ValueError):
+        asyncio.run(collect(stream_observations(["A"], client=RecordingClient(), concurrency=0)))
+
+
+def test_stream_observations_fetches_rows_beyond_the_row_cap() -> None:
+    from fredtools.client import Fred, FredConfig
+    from tests.conftest import CappedObservationsServer
+
+    server = CappedObservationsServer(days=250, cap=100)
+    client = Fred(FredConfig(api_key="k", transport=server), register_default=False)
+    results = asyncio.run(collect(stream_observations(["A", "B"], client=client)))
+    assert sorted(series.series_id for series, _ in results) == ["A", "B"]
+    assert all(len(columns["date"]) == 250 for _, columns in results)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import multiprocessing
+
+import pytest
+
+from fredtools.ratelimit import RateLimiter, SharedRateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+
+
+def test_rate_limiter_spaces_calls_evenly() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(max_calls=2, period=1.0, clock=clock, sleep=clock.sleep)
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert limiter.acquire() == pytest.approx(1.0)
+    clock.now += 5
+    assert limiter.acquire() == 0.0
+    assert clock.sleeps == [pytest.approx(0.5), pytest.approx(1.0)]
+
+
+def test_rate_limiter_rejects_invalid_budget() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(max_calls=0)
+    with pytest.raises(ValueError):
+        RateLimiter(period=0)
+
+
+def test_shared_rate_limiter_reserves_from_shared_state() -> None:
+    limiter = SharedRateLimiter(max_calls=10, period=1.0)
+    first = limiter._reserve(50.0)
+    second = limiter._reserve(50.0)
+    assert second - first == pytest.approx(0.1)
+
+    process = multiprocessing.Process(target=_reserve_in_child, args=(limiter,))
+    process.start()
+    process.join(timeout=10)
+    assert process.exitcode == 0
+    assert limiter._reserve(50.0) == pytest.approx(50.3)
+
+
+def _reserve_in_child(limiter: SharedRateLimiter) -> None:
+    limiter._reserve(50.0)
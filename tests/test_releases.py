@@ -4,6 +4,7 @@ from datetime import date
 
 import pytest
 
+from fredtools.client import Fred, FredConfig, RawResponse
 from fredtools.releases import Release
 from fredtools.types import ReleaseTable, Source
 from tests.conftest import StubResponse
@@ -294,3 +295,18 @@ def test_release_repr_includes_key_fields() -> None:
     release = make_release_instance()
     text = repr(release)
     assert "Sample" in text and "53" in text
+
+
+def test_release_table_parses_byte_transport_buffers() -> None:
+    body = memoryview(
+        b'{"name": "Parent", "element_id": 1, "release_id": "53", "elements": {"1": '
+        b'{"element_id": 1, "parent_id": null, "type": "section", "name": "Root", "level": "0", '
+        b'"children": [{"element_id": "2", "parent_id": 1, "series_id": "S1", "type": "series", '
+        b'"name": "Goods", "level": "1"}]}}}'
+    )
+    Fred(FredConfig(api_key="k", byte_transport=lambda url, params, timeout: RawResponse(body)))
+    table = make_release_instance().table(element_id=1)
+    assert table.release_id == 53
+    (root,) = table.elements
+    assert (root.name, root.level, root.release_id) == ("Root", 0, 53)
+    assert [(child.element_id, child.series_id) for child in root.children] == [(2, "S1")]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from fredtools.client import Fred, FredConfig
+from fredtools.scheduler import BATCH, INTERACTIVE, Lane, RequestScheduler, current_lane, lane
+
+
+class CountingLimiter:
+    def __init__(self) -> None:
+        self.acquired = 0
+
+    def acquire(self) -> float:
+        self.acquired += 1
+        return 0.0
+
+
+def start_waiter(
+    scheduler: RequestScheduler, lane_name: str, order: list[str], label: str
+) -> threading.Thread:
+    def run() -> None:
+        with lane(lane_name):
+            scheduler.acquire()
+            order.append(label)
+            scheduler.release()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def wait_for_queue(scheduler: RequestScheduler, name: str, size: int) -> None:
+    deadline = time.monotonic() + 2
+    while scheduler.snapshot()[name]["queued"] < size and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_interactive_requests_jump_ahead_of_queued_batch_work() -> None:
+    scheduler = RequestScheduler(
+        capacity=1, lanes=[Lane(INTERACTIVE, priority=1), Lane(BATCH)]
+    )
+    order: list[str] = []
+    with lane(BATCH):
+        scheduler.acquire()
+    threads = [start_waiter(scheduler, BATCH, order, f"batch{index}") for index in range(3)]
+    wait_for_queue(scheduler, BATCH, 3)
+    threads.append(start_waiter(scheduler, INTERACTIVE, order, "interactive"))
+    wait_for_queue(scheduler, INTERACTIVE, 1)
+    with lane(BATCH):
+        scheduler.release()
+    for thread in threads:
+        thread.join(2)
+    assert order == ["interactive", "batch0", "batch1", "batch2"]
+
+
+def test_equal_priority_lanes_share_slots_by_weight() -> None:
+    scheduler = RequestScheduler(
+        capacity=1,
+        lanes=[Lane(INTERACTIVE, priority=1), Lane("a", weight=2), Lane("b", weight=1)],
+    )
+    order: list[str] = []
+    with lane("a"):
+        scheduler.acquire()
+    threads = [start_waiter(scheduler, "a", order, "a") for _ in range(4)]
+    wait_for_queue(scheduler, "a", 4)
+    threads += [start_waiter(scheduler, "b", order, "b") for _ in range(2)]
+    wait_for_queue(scheduler, "b", 2)
+    with lane("a"):
+        scheduler.release()
+    for thread in threads:
+        thread.join(2)
+    # "a" just held the slot, so "b" goes first; then two "a" per "b".
+    assert order == ["b", "a", "a", "b", "a", "a"]
+
+
+def test_default_lanes_keep_a_slot_free_of_batch_work() -> None:
+    scheduler = RequestScheduler(capacity=2)
+    assert current_lane() == INTERACTIVE
+    order: list[str] = []
+    with lane(BATCH):
+        scheduler.acquire()
+    blocked = start_waiter(scheduler, BATCH, order, "batch")
+    wait_for_queue(scheduler, BATCH, 1)
+    scheduler.acquire()
+    assert scheduler.snapshot()[INTERACTIVE]["in_flight"] == 1
+    assert scheduler.snapshot()[BATCH] == {"queued": 1, "in_flight": 1, "dispatched": 1}
+    scheduler.release()
+    assert order == []
+    with lane(BATCH):
+        scheduler.release()
+    blocked.join(2)
+    assert order == ["batch"]
+    assert scheduler.snapshot()[BATCH]["dispatched"] == 2
+
+
+def test_fred_requests_run_through_lane_rate_limiters() -> None:
+    limiter = CountingLimiter()
+    scheduler = RequestScheduler(
+        capacity=2,
+        lanes=[Lane(INTERACTIVE, priority=1), Lane(BATCH, rate_limiter=limiter)],
+    )
+    fred = Fred(
+        FredConfig(
+            api_key="k",
+            transport=lambda url, params, timeout: {"ok": True},
+            concurrency_limiter=scheduler,
+        ),
+        register_default=False,
+    )
+    fred.request("series")
+    with lane(BATCH):
+        assert fred.map(lambda _: fred.request("series"), range(3)) == [{"ok": True}] * 3
+    assert limiter.acquired == 3
+    assert scheduler.snapshot()[BATCH]["dispatched"] == 3
+    with lane("background"), pytest.raises(ValueError):
+        fred.request("series")
+
+
+def test_scheduler_validates_lanes_up_front() -> None:
+    with pytest.raises(ValueError, match="capacity >= 2"):
+        RequestScheduler(capacity=1)
+    with pytest.raises(ValueError, match="interactive"):
+        RequestScheduler(capacity=2, lanes=[Lane(BATCH)])
+    with pytest.raises(ValueError, match="unique"):
+        RequestScheduler(capacity=2, lanes=[Lane(INTERACTIVE), Lane(INTERACTIVE)])
+    single = RequestScheduler(capacity=1, lanes=[Lane(INTERACTIVE)])
+    assert single.lanes == [Lane(INTERACTIVE)]
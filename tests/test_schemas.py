@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import math
+import sys
+from datetime import date
+
+import pytest
+
+pytest.importorskip("msgspec")
+
+from fredtools import schemas
+from fredtools.client import Fred, FredConfig
+from fredtools.schemas import get_schema
+from fredtools.types import Observation, Source
+from tests.conftest import DummyResponse
+
+OBSERVATIONS = {
+    "count": 2,
+    "observations": [
+        {"realtime_start": "2024-01-01", "realtime_end": "2024-01-01", "date": "2020-01-01", "value": "1.5"},
+        {"realtime_start": "2024-01-01", "realtime_end": "2024-01-01", "date": "2020-02-01", "value": "."},
+    ],
+}
+
+
+def test_observations_decode_straight_into_dataclasses() -> None:
+    response = get_schema("series/observations").decode(json.dumps(OBSERVATIONS, indent=1).encode())
+    first, missing = response.observations
+    assert first == Observation(date(2024, 1, 1), date(2024, 1, 1), date(2020, 1, 1), 1.5)
+    assert missing.date == date(2020, 2, 1)
+    assert math.isnan(missing.value)
+
+
+def test_empty_values_decode_as_nan() -> None:
+    body = b'{"observations": [{"realtime_start": "2024-01-01", "realtime_end": "2024-01-01", "date": "2020-01-01", "value": ""}]}'
+    (observation,) = get_schema("series/observations").decode(body).observations
+    assert math.isnan(observation.value)
+
+
+@pytest.mark.parametrize("msgspec_available", [True, False])
+def test_release_sources_types_do_not_depend_on_msgspec(
+    monkeypatch: pytest.MonkeyPatch, msgspec_available: bool
+) -> None:
+    from fredtools.releases import Release
+
+    body = json.dumps(
+        {"sources": [{"id": 1, "name": "BLS", "realtime_start": "2024-01-01", "realtime_end": "2024-01-02", "link": "x"}]}
+    ).encode()
+    if not msgspec_available:
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        get_schema.cache_clear()
+        schemas._response_types.cache_clear()
+    monkeypatch.setattr("urllib.request.urlopen", lambda request, timeout=None: DummyResponse(body))
+    try:
+        Fred(FredConfig(api_key="k"))
+        release = Release(release_id=1, name="R", realtime_start=date(2024, 1, 1), realtime_end=date(2024, 1, 2))
+        sources = release.sources()
+    finally:
+        get_schema.cache_clear()
+        schemas._response_types.cache_clear()
+    assert sources == [Source(1, "BLS", date(2024, 1, 1), date(2024, 1, 2), "x")]
+
+
+def test_get_schema_returns_none_for_unknown_endpoints_and_without_msgspec(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_schema("series/search") is None
+
+    def missing() -> dict:
+        raise ImportError("msgspec")
+
+    monkeypatch.setattr(schemas, "_response_types", missing)
+    get_schema.cache_clear()
+    try:
+        assert get_schema("series/observations") is None
+    finally:
+        get_schema.cache_clear()
+
+
+def test_schemas_only_apply_to_byte_bodies_decoded_by_msgspec(monkeypatch: pytest.MonkeyPatch) -> None:
+    schema = get_schema("series/observations")
+    custom = Fred(FredConfig(api_key="k", transport=lambda url, params, timeout: OBSERVATIONS), register_default=False)
+    assert custom.schema_for("series/observations") is None
+    with pytest.raises(ValueError):
+        custom.request("series/observations", schema=schema)
+    explicit = Fred(FredConfig(api_key="k", json_decoder="json"), register_default=False)
+    assert explicit.schema_for("series/observations") is None
+
+    body = json.dumps(OBSERVATIONS).encode()
+    monkeypatch.setattr("urllib.request.urlopen", lambda request, timeout=None: DummyResponse(body))
+    fred = Fred(FredConfig(api_key="k"), register_default=False)
+    assert fred.schema_for("series/observations") is schema
+    assert len(fred.request("series/observations", schema=schema).observations) == 2
+
+
+def test_schema_decodes_byte_transport_buffers() -> None:
+    from fredtools.client import RawResponse
+
+    body = memoryview(json.dumps(OBSERVATIONS).encode())
+    fred = Fred(
+        FredConfig(api_key="k", byte_transport=lambda url, params, timeout: RawResponse(body)),
+        register_default=False,
+    )
+    observations = fred.request("series/observations", schema=get_schema("series/observations")).observations
+    assert observations[0].value == 1.5
+    assert math.isnan(observations[1].value)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from fredtools.search_index import SeriesIndex
+from fredtools.series import Series
+from tests.conftest import StubResponse
+
+
+def make_series(series_id: str, title: str, **kwargs) -> Series:
+    fields = {
+        "realtime_start": date(2020, 1, 1),
+        "realtime_end": date(2020, 1, 2),
+        "frequency": "Monthly",
+        "frequency_short": "M",
+        "seasonal_adjustment": "Seasonally Adjusted",
+        "seasonal_adjustment_short": "SA",
+        "units": "Percent",
+        "popularity": 10,
+    }
+    fields.update(kwargs)
+    return Series(series_id=series_id, title=title, **fields)
+
+
+@pytest.fixture
+def index() -> SeriesIndex:
+    series = [
+        make_series("UNRATE", "Unemployment Rate", popularity=90),
+        make_series(
+            "GDP",
+            "Gross Domestic Product",
+            frequency="Quarterly",
+            frequency_short="Q",
+            units="Billions of Dollars",
+            popularity=95,
+        ),
+        make_series(
+            "UNRATENSA",
+            "Unemployment Rate",
+            seasonal_adjustment="Not Seasonally Adjusted",
+            seasonal_adjustment_short="NSA",
+            notes="Not adjusted for seasonal swings.",
+            popularity=40,
+        ),
+    ]
+    tags = {
+        "UNRATE": ["unemployment", "usa", "sa"],
+        "UNRATENSA": ["unemployment", "usa", "nsa"],
+        "GDP": ["gdp", "usa"],
+    }
+    with SeriesIndex.build(series, tags) as built:
+        yield built
+
+
+def test_search_ranks_full_text_matches(index: SeriesIndex) -> None:
+    results = index.search("unemployment rate ")
+    assert [series.series_id for series in results] == ["UNRATE", "UNRATENSA"]
+    assert results[0].title == "Unemployment Rate"
+
+
+def test_search_treats_trailing_word_as_prefix(index: SeriesIndex) -> None:
+    assert [s.series_id for s in index.search("gross dom")] == ["GDP"]
+    assert index.search("gross dom ") == []
+    assert [s.series_id for s in index.search("unemp", prefix=True)] == [
+        "UNRATE",
+        "UNRATENSA",
+    ]
+
+
+def test_search_filters_by_metadata_and_tags(index: SeriesIndex) -> None:
+    assert [s.series_id for s in index.search(frequency="q")] == ["GDP"]
+    assert [
+        s.series_id
+        for s in index.search("unemployment", seasonal_adjustment="NSA")
+    ] == ["UNRATENSA"]
+    assert [s.series_id for s in index.search(tag_names=["usa", "sa"])] == [
+        "UNRATE"
+    ]
+
+
+def test_search_without_text_orders_by_popularity(index: SeriesIndex) -> None:
+    results = index.search(limit=2)
+    assert [s.series_id for s in results] == ["GDP", "UNRATE"]
+    assert [s.series_id for s in index.search(limit=1, offset=2)] == ["UNRATENSA"]
+
+
+def test_add_replaces_existing_series_and_remove_drops_it(index: SeriesIndex) -> None:
+    index.add(make_series("GDP", "Real Output"), tags=["output"])
+    assert len(index) == 3
+    assert index.search("gross") == []
+    assert index.tags("GDP") == ["output"]
+    assert index.remove("GDP") is True
+    assert "GDP" not in index
+    assert index.remove("GDP") is False
+
+
+def test_index_persists_to_disk(tmp_path) -> None:
+    path = tmp_path / "series.db"
+    with SeriesIndex(path) as index:
+        index.add(make_series("CPI", "Consumer Price Index", last_updated=date(2020, 3, 1)))
+    with SeriesIndex(path) as reopened:
+        results = reopened.search("consumer price")
+    assert results[0].series_id == "CPI"
+    assert results[0].last_updated == date(2020, 3, 1)
+    assert results[0].realtime_start == date(2020, 1, 1)
+
+
+def test_search_restores_timestamps_and_skips_api_for_sparse_rows() -> None:
+    sparse = Series._from_metadata("BARE", last_updated="2013-07-31 09:26:16-05")
+    with SeriesIndex() as index:
+        index.add(sparse)
+        # No client is configured, so an info() call would raise.
+        (result,) = index.search("bare")
+    assert result.series_id == "BARE"
+    assert result.title is None
+    assert result.last_updated == datetime(2013, 7, 31, 9, 26, 16, tzinfo=timezone(timedelta(hours=-5)))
+
+
+def test_search_round_trips_api_hydrated_series(make_stub_client) -> None:
+    payload = {
+        "id": "UNRATE",
+        "realtime_start": "2024-05-01",
+        "realtime_end": "2024-05-01",
+        "title": "Unemployment Rate",
+        "observation_start": "1948-01-01",
+        "observation_end": "2024-04-01",
+        "frequency": "Monthly",
+        "frequency_short": "M",
+        "units": "Percent",
+        "units_short": "%",
+        "seasonal_adjustment": "Seasonally Adjusted",
+        "seasonal_adjustment_short": "SA",
+        "last_updated": "2024-05-03 07:44:02-05",
+        "popularity": 94,
+        "notes": "Civilian unemployment.",
+    }
+    stub = make_stub_client([StubResponse("series", {"seriess": [payload]})])
+    hydrated = Series("UNRATE")
+    stub.assert_complete()
+    assert hydrated.observation_start == date(1948, 1, 1)
+    assert hydrated.last_updated == datetime(2024, 5, 3, 7, 44, 2, tzinfo=timezone(timedelta(hours=-5)))
+
+    with SeriesIndex() as index:
+        index.add(hydrated)
+        (result,) = index.search("unemployment")
+    assert vars(result) == vars(hydrated)
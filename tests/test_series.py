@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import threading
 from datetime import date
 
 import pytest
 
+from fredtools.client import set_default_client
 from fredtools.series import Series
-from tests.conftest import StubResponse
+from tests.conftest import CappedObservationsServer, StubResponse
 
 
 def make_series() -> Series:
@@ -66,6 +68,47 @@ def test_series_observations_parses_values(make_stub_client) -> None:
     stub.assert_complete()
 
 
+def test_series_observations_fetches_rows_beyond_the_row_cap(make_stub_client) -> None:
+    def rows(*days: int) -> list[dict[str, str]]:
+        return [
+            {
+                "realtime_start": "2020-01-01",
+                "realtime_end": "9999-12-31",
+                "date": f"2020-01-{day:02d}",
+                "value": str(day),
+            }
+            for day in days
+        ]
+
+    def assert_rest_requested(params) -> None:
+        assert params["observation_start"] == "2020-01-03"
+        assert params["observation_end"] is None
+
+    stub = make_stub_client(
+        [
+            StubResponse("series/observations", {"count": 4, "observations": rows(1, 2, 3)}),
+            StubResponse(
+                "series/observations",
+                {"count": 2, "observations": rows(3, 4)},
+                assert_rest_requested,
+            ),
+        ]
+    )
+    observations = make_series().observations()
+    assert [item.value for item in observations] == [1.0, 2.0, 3.0, 4.0]
+    stub.assert_complete()
+
+
+def test_series_observation_columns_fetch_rows_beyond_the_row_cap() -> None:
+    from fredtools.client import Fred, FredConfig
+
+    server = CappedObservationsServer(days=250, cap=100)
+    Fred(FredConfig(api_key="k", transport=server))
+    columns = make_series().observation_columns()
+    assert columns["value"] == [float(day) for day in range(250)]
+    assert server.observation_requests > 1
+
+
 def test_series_release_returns_release(make_stub_client) -> None:
     response = {
         "releases": [
@@ -223,3 +266,81 @@ def test_series_repr_and_str_include_fields() -> None:
     series = make_series()
     assert "Series(series_id=S1" in repr(series)
     assert "Series ID: S1" in str(series)
+
+
+def test_series_observation_columns_parses_columnar(make_stub_client) -> None:
+    response = {
+        "observations": [
+            {
+                "realtime_start": "2020-01-01",
+                "realtime_end": "2020-01-02",
+                "date": "2020-01-15",
+                "value": "1.5",
+            },
+            {
+                "realtime_start": "2020-01-01",
+                "realtime_end": "2020-01-02",
+                "date": "2020-02-15",
+                "value": ".",
+            },
+        ]
+    }
+    stub = make_stub_client([StubResponse("series/observations", response)])
+    columns = make_series().observation_columns(units="pch")
+    assert columns["date"] == [date(2020, 1, 15), date(2020, 2, 15)]
+    assert columns["value"][0] == 1.5
+    assert columns["value"][1] != columns["value"][1]
+    assert stub.calls[0][1]["units"] == "pch"
+    stub.assert_complete()
+
+
+class ThreadSafeSeriesClient:
+    def __init__(self) -> None:
+        self.requested: list[str] = []
+        self._lock = threading.Lock()
+
+    def request(self, endpoint: str, params=None):
+        assert endpoint == "series"
+        with self._lock:
+            self.requested.append(params["series_id"])
+        if params["series_id"] == "MISSING":
+            return {"seriess": []}
+        return {
+            "seriess": [
+                {
+                    "id": params["series_id"],
+                    "title": f"Title {params['series_id']}",
+                    "realtime_start": "2020-01-01",
+                    "frequency_short": "M",
+                }
+            ]
+        }
+
+
+def test_series_hydrate_many_reuses_payloads_and_dedupes(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = ThreadSafeSeriesClient()
+    set_default_client(client)  # type: ignore[arg-type]
+    known = make_series()
+
+    def fake_info(self: Series) -> Series:
+        self.title = "Filled"
+        return self
+
+    monkeypatch.setattr(Series, "info", fake_info)
+    partial = Series(series_id="P1")
+    partial.title = None
+
+    hydrated = Series.hydrate_many(["A", known, "B", "A", partial, "S1"], max_workers=4)
+
+    assert [series.series_id for series in hydrated] == ["A", "S1", "B", "A", "P1", "S1"]
+    assert hydrated[0] is hydrated[3]
+    assert hydrated[1] is known and hydrated[5] is known
+    assert hydrated[4] is partial and partial.title == "Filled"
+    assert hydrated[2].title == "Title B"
+    assert sorted(client.requested) == ["A", "B"]
+
+
+def test_series_hydrate_many_raises_for_unknown_ids() -> None:
+    set_default_client(ThreadSafeSeriesClient())  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        Series.hydrate_many(["MISSING"])
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+from datetime import date
+
+import pytest
+
+from fredtools.series import Series
+from fredtools.tag_index import TagIndex
+from fredtools.tags import Tag
+from tests.conftest import StubResponse
+
+
+@pytest.fixture
+def index() -> TagIndex:
+    return TagIndex.from_mapping(
+        {
+            "UNRATE": ["unemployment", "usa", "sa", "monthly"],
+            "UNRATENSA": ["unemployment", "usa", "nsa", "monthly"],
+            "GDP": ["gdp", "usa", "sa", "quarterly"],
+            "CLAIMS": ["unemployment", "weekly", "nsa"],
+        }
+    )
+
+
+def test_series_intersects_and_excludes_tags(index: TagIndex) -> None:
+    assert index.series(["unemployment", "usa"]) == ["UNRATE", "UNRATENSA"]
+    assert index.series(["unemployment"], exclude_tag_names=["nsa"]) == ["UNRATE"]
+    assert index.series(exclude_tag_names=["usa"]) == ["CLAIMS"]
+    assert index.series(["unknown"]) == []
+    assert index.count(["usa"]) == 3
+
+
+def test_union_returns_series_with_any_tag(index: TagIndex) -> None:
+    assert index.union(["gdp", "weekly"]) == ["GDP", "CLAIMS"]
+
+
+def test_related_tags_counts_co_occurring_tags(index: TagIndex) -> None:
+    related = index.related_tags(["unemployment"])
+    assert related == {"nsa": 2, "monthly": 2, "usa": 2, "sa": 1, "weekly": 1}
+    assert list(related)[:3] == ["monthly", "nsa", "usa"]
+    assert index.related_tags(["unemployment"], exclude_tag_names=["nsa"]) == {
+        "monthly": 1,
+        "sa": 1,
+        "usa": 1,
+    }
+
+
+def test_update_and_remove_are_incremental(index: TagIndex) -> None:
+    index.update("GDP", ["gdp", "annual"])
+    assert index.series(["sa"]) == ["UNRATE"]
+    assert index.tags("GDP") == ["annual", "gdp"]
+    assert index.remove("UNRATE") is True
+    assert index.remove("UNRATE") is False
+    assert index.series(["sa"]) == []
+    assert "sa" not in index.tag_names()
+
+    index.update("PAYEMS", [Tag(name="usa", group_id="geo")])
+    assert "PAYEMS" in index
+    assert index.series(["usa"]) == ["PAYEMS", "UNRATENSA"]
+    assert len(index) == 4
+
+
+def test_from_series_fetches_series_tags(make_stub_client) -> None:
+    response = {
+        "tags": [
+            {"name": "gdp", "group_id": "gen", "popularity": 1},
+            {"name": "usa", "group_id": "geo", "popularity": 1},
+        ]
+    }
+    stub = make_stub_client([StubResponse("series/tags", response)])
+    series = Series(series_id="GDP", title="GDP", realtime_start=date(2020, 1, 1))
+    index = TagIndex.from_series([series])
+    assert index.tags("GDP") == ["gdp", "usa"]
+    stub.assert_complete()
+
+
+def test_large_index_stays_compact_and_queries_scale_with_matches() -> None:
+    size = 100_000
+    index = TagIndex.from_mapping(
+        {
+            f"S{number}": ["usa" if number % 3 == 0 else "can", f"group{number % 50}"]
+            for number in range(size)
+        }
+    )
+    postings = index._postings.values()
+    assert {slots.itemsize for slots in postings} == {4}
+    assert sum(len(slots) for slots in postings) == 2 * size
+
+    started = time.perf_counter()
+    matches = index.series(["usa"])
+    narrowed = index.series(["group7", "usa"], exclude_tag_names=["can"])
+    related = index.related_tags(["group7"])
+    elapsed = time.perf_counter() - started
+    assert len(matches) == 33_334
+    assert len(narrowed) == 667
+    assert related == {"can": 1333, "usa": 667}
+    # Integer bitmaps took over a second here; id arrays take milliseconds.
+    assert elapsed < 0.25
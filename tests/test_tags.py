@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import contextvars
+import threading
 from datetime import date
 
 import pytest
 
-from fredtools.tags import Tag, stringify_tags
+from fredtools import tags as tags_module
+from fredtools.ENUMS import TagGroups
+from fredtools.tags import Tag, TagCatalog, set_tag_catalog, stringify_tags
 from tests.conftest import StubResponse
 
 
@@ -130,3 +134,113 @@ def test_stringify_tags_handles_mixed_inputs() -> None:
     assert stringify_tags(["a", "b"]) == "a;b"
     assert stringify_tags([t, "b"]) == "macro;b"
     assert stringify_tags([]) is None
+
+
+def test_tag_init_skips_info_when_response_fields_are_falsy() -> None:
+    tag = Tag(name="obscure", group_id="gen", notes="", popularity=0, series_count=0)
+    assert tag.popularity == 0
+
+
+def test_tag_all_passes_pagination_params(make_stub_client) -> None:
+    def assert_params(params):
+        assert params["tag_group_id"] == "freq"
+        assert params["limit"] == 2
+        assert params["offset"] == 4
+
+    stub = make_stub_client(
+        [StubResponse("tags", {"tags": []}, assert_params=assert_params)]
+    )
+    assert Tag.all(tag_group_id="freq", limit=2, offset=4) == []
+    stub.assert_complete()
+
+
+def make_catalog_client(make_stub_client, clock_value: list[float]):
+    page_one = {
+        "tags": [
+            {"name": "monthly", "group_id": "freq", "notes": "", "popularity": 90, "series_count": 10},
+            {"name": "weekly", "group_id": "freq", "notes": "", "popularity": 70, "series_count": 4},
+        ]
+    }
+    page_two = {
+        "tags": [
+            {"name": "annual", "group_id": "freq", "notes": "", "popularity": 0, "series_count": 1},
+        ]
+    }
+    geo = {
+        "tags": [
+            {"name": "usa", "group_id": "geo", "notes": "United States", "popularity": 100, "series_count": 50},
+        ]
+    }
+    stub = make_stub_client(
+        [
+            StubResponse("tags", page_one),
+            StubResponse("tags", page_two),
+            StubResponse("tags", geo),
+        ]
+    )
+    catalog = TagCatalog(
+        ttl=60,
+        page_size=2,
+        tag_groups=[TagGroups.FREQ, TagGroups.GEO],
+        clock=lambda: clock_value[0],
+    )
+    return stub, catalog
+
+
+def test_tag_catalog_pages_through_groups_and_resolves_tags(
+    make_stub_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(tags_module, "_tag_catalog", None)
+    stub, catalog = make_catalog_client(make_stub_client, [0.0])
+    set_tag_catalog(catalog)
+
+    tag = Tag("usa")
+    assert tag.group_id == "geo"
+    assert tag.notes == "United States"
+    assert Tag("annual").series_count == 1
+    assert len(catalog) == 4
+    assert [call[1]["offset"] for call in stub.calls] == [0, 2, 0]
+    stub.assert_complete()
+
+
+def test_tag_catalog_reloads_after_ttl_and_keeps_stale_on_failure(
+    make_stub_client,
+) -> None:
+    clock = [0.0]
+    stub, catalog = make_catalog_client(make_stub_client, clock)
+    assert catalog.resolve("weekly").popularity == 70
+    clock[0] = 30.0
+    assert "monthly" in catalog
+    stub.assert_complete()
+
+    clock[0] = 61.0
+    assert catalog.is_stale
+    assert catalog.get("monthly")["popularity"] == 90
+    assert not catalog.is_stale
+    with pytest.raises(AssertionError):
+        catalog.load()
+
+
+def test_tag_catalog_loads_tags_without_metadata(
+    make_stub_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(tags_module, "_tag_catalog", None)
+    bare = {"tags": [{"name": "bare", "group_id": None, "notes": None, "popularity": None, "series_count": None}]}
+    stub = make_stub_client([StubResponse("tags", bare)])
+    catalog = TagCatalog(page_size=10, tag_groups=[TagGroups.FREQ])
+    set_tag_catalog(catalog)
+
+    result: list[Tag] = []
+    context = contextvars.copy_context()
+    worker = threading.Thread(
+        target=lambda: context.run(lambda: result.append(Tag("bare"))),
+        daemon=True,
+    )
+    worker.start()
+    worker.join(5)
+    assert not worker.is_alive(), "catalog load deadlocked"
+    assert result[0].name == "bare" and result[0].group_id is None
+    assert "bare" in catalog
+    stub.assert_complete()
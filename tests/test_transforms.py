@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+
+import pytest
+
+from fredtools.transforms import apply_units, period_labeler, resample
+from fredtools.types import Observation, ObservationsResult
+
+
+def daily(start: date, values: list[float]) -> ObservationsResult:
+    return ObservationsResult(
+        Observation(
+            realtime_start=date(2024, 1, 1),
+            realtime_end=date(2024, 1, 1),
+            date=start + timedelta(days=offset),
+            value=value,
+        )
+        for offset, value in enumerate(values)
+    )
+
+
+def test_resample_monthly_methods_skip_missing_values() -> None:
+    values = [1.0, math.nan, 3.0] + [0.0] * 28 + [10.0, math.nan]
+    result = daily(date(2020, 1, 1), values)
+    average = result.resample("m")
+    assert [item.date for item in average] == [date(2020, 1, 1), date(2020, 2, 1)]
+    assert average[0].value == pytest.approx(4.0 / 30)
+    assert average[1].value == 10.0
+    assert result.resample("M", "sum")[0].value == 4.0
+    assert result.resample("m", "eop")[1].value == 10.0
+
+
+def test_resample_weekly_labels_by_week_end() -> None:
+    # 2024-01-01 is a Monday.
+    result = daily(date(2024, 1, 1), [float(day) for day in range(10)])
+    weekly = result.resample("w", "sum")
+    assert [item.date for item in weekly] == [date(2024, 1, 5), date(2024, 1, 12)]
+    assert [item.value for item in weekly] == [10.0, 35.0]
+    assert [item.date for item in result.resample("wesu")] == [date(2024, 1, 7), date(2024, 1, 14)]
+
+
+def test_resample_longer_periods_and_empty_periods() -> None:
+    columns = {
+        "realtime_start": [date(2024, 1, 1)] * 4,
+        "realtime_end": [date(2024, 1, 1)] * 4,
+        "date": [date(2020, 8, 1), date(2020, 2, 1), date(2020, 5, 1), date(2021, 2, 1)],
+        "value": [1.0, math.nan, math.nan, 2.0],
+    }
+    quarterly = resample(columns, "q")
+    # The all-NaN quarters are NaN; 2020Q4 has no rows and is not emitted.
+    assert quarterly["date"] == [
+        date(2020, 1, 1), date(2020, 4, 1), date(2020, 7, 1), date(2021, 1, 1),
+    ]
+    assert [value if not math.isnan(value) else "nan" for value in quarterly["value"]] == [
+        "nan", "nan", 1.0, 2.0,
+    ]
+    assert quarterly["realtime_start"] == [date(2024, 1, 1)] * 4
+    semiannual = resample(columns, "sa", "avg")
+    assert semiannual["date"] == [date(2020, 1, 1), date(2020, 7, 1), date(2021, 1, 1)]
+    assert math.isnan(semiannual["value"][0])
+    assert resample(columns, "a", "eop")["value"] == [1.0, 2.0]
+
+
+def test_resample_vintage_input_per_vintage() -> None:
+    columns = {
+        "realtime_start": [date(2024, 1, 1), date(2024, 2, 1), date(2024, 1, 1), date(2024, 3, 1)],
+        "realtime_end": [date(2024, 1, 31), date(9999, 12, 31), date(9999, 12, 31), date(9999, 12, 31)],
+        "date": [date(2020, 1, 1), date(2020, 1, 1), date(2020, 2, 1), date(2020, 3, 1)],
+        "value": [1.0, 3.0, 2.0, 2.5],
+    }
+    annual = resample(columns, "a")
+    # January's vintage averages the first release; the March release leaves
+    # the average at 2.5, so February and March collapse into one row.
+    assert annual == {
+        "realtime_start": [date(2024, 1, 1), date(2024, 2, 1)],
+        "realtime_end": [date(2024, 1, 31), date(9999, 12, 31)],
+        "date": [date(2020, 1, 1), date(2020, 1, 1)],
+        "value": [1.5, 2.5],
+    }
+
+
+def test_resample_rejects_unknown_codes() -> None:
+    with pytest.raises(ValueError):
+        period_labeler("bw")
+    with pytest.raises(ValueError):
+        resample({"realtime_start": [], "realtime_end": [], "date": [], "value": []}, "m", "median")
+
+
+def quarterly(values: list[float]) -> ObservationsResult:
+    return ObservationsResult(
+        Observation(
+            realtime_start=date(2024, 1, 1),
+            realtime_end=date(2024, 1, 1),
+            date=date(2019 + index // 4, 3 * (index % 4) + 1, 1),
+            value=value,
+        )
+        for index, value in enumerate(values)
+    )
+
+
+def values_of(result: ObservationsResult) -> list[float]:
+    return [round(item.value, 6) if not math.isnan(item.value) else "nan" for item in result]
+
+
+def test_transform_period_changes() -> None:
+    result = quarterly([100.0, 102.0, math.nan, 104.0, 110.0])
+    assert values_of(result.transform("lin")) == [100.0, 102.0, "nan", 104.0, 110.0]
+    assert values_of(result.transform("chg")) == ["nan", 2.0, "nan", "nan", 6.0]
+    assert values_of(result.transform("pch")) == ["nan", 2.0, "nan", "nan", round(600 / 104, 6)]
+    assert values_of(result.transform("ch1")) == ["nan"] * 4 + [10.0]
+    assert values_of(result.transform("pc1")) == ["nan"] * 4 + [10.0]
+
+
+def test_transform_compounded_and_log_units() -> None:
+    result = quarterly([100.0, 101.0, 0.0, 5.0])
+    assert values_of(result.transform("pca"))[1] == round((1.01**4 - 1) * 100, 6)
+    assert values_of(result.transform("cch"))[1] == round(math.log(1.01) * 100, 6)
+    assert values_of(result.transform("cca"))[1] == round(math.log(1.01) * 400, 6)
+    assert values_of(result.transform("cca", periods_per_year=12))[1] == round(math.log(1.01) * 1200, 6)
+    assert values_of(result.transform("log")) == [round(math.log(100), 6), round(math.log(101), 6), "nan", round(math.log(5), 6)]
+    assert values_of(result.transform("pch"))[3] == "nan"
+
+
+def test_infer_periods_per_year_from_spacing() -> None:
+    from fredtools.transforms import infer_periods_per_year
+
+    weekdays = [date(2024, 1, 1) + timedelta(days=offset) for offset in range(5)]
+    assert infer_periods_per_year(weekdays) == 260
+    assert infer_periods_per_year([date(2024, 1, 1) + timedelta(days=o) for o in range(7)]) == 365
+    assert infer_periods_per_year([date(2024, 1, 5), date(2024, 1, 12), date(2024, 1, 19)]) == 52
+    assert infer_periods_per_year([date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)]) == 12
+    assert infer_periods_per_year([date(2020, 1, 1), date(2021, 1, 1)]) == 1
+    with pytest.raises(ValueError):
+        infer_periods_per_year([date(2024, 1, 1)])
+    with pytest.raises(ValueError):
+        quarterly([1.0, 2.0]).transform("pct")
+
+
+@pytest.mark.parametrize("units", ["pc1", "pca", "cca", "ch1"])
+def test_transform_short_results_need_no_frequency(units: str) -> None:
+    assert quarterly([]).transform(units) == []
+    assert values_of(quarterly([1.0]).transform(units)) == ["nan"]
+
+
+def test_transform_vintage_input_lags_within_each_vintage() -> None:
+    columns = {
+        "realtime_start": [date(2024, 1, 1), date(2024, 2, 1), date(2024, 1, 1)],
+        "realtime_end": [date(2024, 1, 31), date(9999, 12, 31), date(9999, 12, 31)],
+        "date": [date(2020, 1, 1), date(2020, 1, 1), date(2020, 2, 1)],
+        "value": [100.0, 104.0, 110.0],
+    }
+    changes = apply_units(columns, "chg")
+    # February 2020 is compared with the release of January current at the time.
+    assert changes["date"] == [date(2020, 1, 1), date(2020, 2, 1), date(2020, 2, 1)]
+    assert changes["realtime_start"] == [date(2024, 1, 1), date(2024, 1, 1), date(2024, 2, 1)]
+    assert changes["realtime_end"] == [date(9999, 12, 31), date(2024, 1, 31), date(9999, 12, 31)]
+    assert math.isnan(changes["value"][0])
+    assert changes["value"][1:] == [10.0, 6.0]
+
+    duplicated = {**columns, "realtime_start": [date(2024, 1, 1)] * 3, "realtime_end": [date(2024, 1, 1)] * 3}
+    with pytest.raises(ValueError, match="more than once"):
+        apply_units(duplicated, "pch")
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from fredtools import transports as transports_module
+from fredtools.client import Fred, FredConfig
+from fredtools.instrumentation import MetricsCollector
+from fredtools.transports import Http2Transport
+
+
+def mock_client(handler) -> "httpx.Client":
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_http2_transport_plugs_into_fred() -> None:
+    seen: dict[str, object] = {}
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        seen["url"] = str(request.url)
+        return httpx.Response(200, json={"seriess": [{"id": "GDP"}]})
+
+    metrics = MetricsCollector()
+    with Http2Transport(client=mock_client(handler)) as transport:
+        fred = Fred(
+            FredConfig(api_key="k", base_url="https://example.org", transport=transport, hooks=[metrics]),
+            register_default=False,
+        )
+        assert fred.request("series", params={"series_id": "GDP"}) == {"seriess": [{"id": "GDP"}]}
+    assert seen["url"] == "https://example.org/series?api_key=k&file_type=json&series_id=GDP"
+    counters = metrics.snapshot()["endpoints"]["series"]["counters"]
+    assert counters["bytes_received"] > 0
+
+
+def test_http2_transport_caps_streams_in_flight() -> None:
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(200, json={})
+
+    transport = Http2Transport(max_streams=2, client=mock_client(handler))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: transport("https://example.org/series", {}), range(16)))
+    assert peak == 2
+
+
+def test_http2_transport_raises_for_http_errors() -> None:
+    transport = Http2Transport(client=mock_client(lambda request: httpx.Response(429)))
+    with pytest.raises(httpx.HTTPStatusError):
+        transport("https://example.org/series", {})
+
+
+def test_http2_transport_falls_back_without_h2(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    monkeypatch.setattr(transports_module, "find_spec", lambda name: None)
+    with caplog.at_level("WARNING", logger="fredtools.transports"):
+        transport = Http2Transport()
+    assert transport.http2 is False
+    assert "HTTP/1.1" in caplog.text
+    transport.close()
+    with pytest.raises(ValueError):
+        Http2Transport(max_streams=0)
+
+
+def test_http2_transport_works_as_byte_transport() -> None:
+    transport = Http2Transport(client=mock_client(lambda request: httpx.Response(200, json={"ok": 1})))
+    fred = Fred(FredConfig(api_key="k", byte_transport=transport.raw), register_default=False)
+    assert fred.request("series") == {"ok": 1}
+    assert fred.request_raw("series").buffer() == b'{"ok":1}'
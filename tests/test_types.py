@@ -50,3 +50,11 @@ def test_observations_result_df_raises_without_pandas(monkeypatch: pytest.Monkey
     with pytest.raises(RuntimeError) as excinfo:
         _ = result.df
     assert "pandas is required" in str(excinfo.value)
+
+
+def test_observations_result_round_trips_columns() -> None:
+    result = ObservationsResult([make_observation()])
+    columns = result.columns
+    assert columns["value"] == [1.23]
+    assert columns["date"] == [date(2020, 1, 15)]
+    assert ObservationsResult.from_columns(columns) == result
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import io
+import math
+import zipfile
+from datetime import date
+from typing import Any, Mapping
+
+import pytest
+
+from fredtools.client import Fred, FredConfig, RawResponse
+from fredtools.series import Series
+from fredtools.wire_formats import download_observations, parse_observations_csv
+
+CSV = (
+    b"realtime_start_date,realtime_end_date,date,value\n"
+    b"2024-01-01,9999-12-31,2020-01-01,1.5\n"
+    b"2024-01-01,9999-12-31,2020-02-01,.\n"
+    b"2024-01-01,9999-12-31,2020-03-01,2.25\n"
+)
+
+
+def zipped(body: bytes, name: str = "S1_1.csv") -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("README_SERIES_ID_SORT.txt", "readme")
+        archive.writestr(name, body)
+    return buffer.getvalue()
+
+
+class ZipServer:
+    def __init__(self) -> None:
+        self.params: list[Mapping[str, Any]] = []
+
+    def __call__(self, url: str, params: Mapping[str, Any], timeout: float | None) -> RawResponse:
+        self.params.append(params)
+        return RawResponse(zipped(CSV), headers={"Content-Type": "application/zip"})
+
+
+def test_parse_observations_csv_reads_zipped_files() -> None:
+    columns = parse_observations_csv(zipped(CSV))
+    assert columns["date"] == [date(2020, 1, 1), date(2020, 2, 1), date(2020, 3, 1)]
+    assert columns["realtime_end"] == [date(9999, 12, 31)] * 3
+    assert columns["value"][0] == 1.5
+    assert math.isnan(columns["value"][1])
+
+
+def test_parse_observations_csv_closes_the_archive(monkeypatch: pytest.MonkeyPatch) -> None:
+    body, without_csv = zipped(CSV), zipped(CSV, name="notes.txt")
+    opened: list[zipfile.ZipFile] = []
+
+    class RecordingZipFile(zipfile.ZipFile):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            opened.append(self)
+
+    monkeypatch.setattr(zipfile, "ZipFile", RecordingZipFile)
+    assert len(parse_observations_csv(body)["date"]) == 3
+    with pytest.raises(ValueError, match="No CSV file"):
+        parse_observations_csv(without_csv)
+    assert len(opened) == 2
+    assert all(archive.fp is None for archive in opened)
+
+
+def test_parse_observations_csv_fills_missing_realtime_columns() -> None:
+    body = memoryview(b"observation_date,GDP\n2020-01-01,3.0\n")
+    columns = parse_observations_csv(body, realtime_start=date(2024, 5, 1), realtime_end=date(2024, 5, 2))
+    assert columns == {
+        "realtime_start": [date(2024, 5, 1)],
+        "realtime_end": [date(2024, 5, 2)],
+        "date": [date(2020, 1, 1)],
+        "value": [3.0],
+    }
+
+
+def test_parse_observations_csv_rejects_archives_without_csv() -> None:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("README.txt", "readme")
+    with pytest.raises(ValueError):
+        parse_observations_csv(buffer.getvalue())
+
+
+def test_series_observations_csv_wire_format_requests_csv() -> None:
+    server = ZipServer()
+    Fred(FredConfig(api_key="k", byte_transport=server))
+    series = Series("S1", title="Series 1")
+    result = series.observations(observation_start=date(2020, 1, 1), wire_format="csv")
+    assert [item.date for item in result] == [date(2020, 1, 1), date(2020, 2, 1), date(2020, 3, 1)]
+    assert server.params[0]["file_type"] == "csv"
+    assert server.params[0]["observation_start"] == "2020-01-01"
+    assert series.observation_columns(wire_format="csv")["value"][2] == 2.25
+    with pytest.raises(ValueError):
+        series.observations(wire_format="xml")
+
+
+def test_download_observations_fetches_each_id_once() -> None:
+    server = ZipServer()
+    client = Fred(FredConfig(api_key="k", byte_transport=server), register_default=False)
+    results = download_observations(["A", "B", "A"], client=client, observation_end=date(2020, 12, 31))
+    assert list(results) == ["A", "B"]
+    assert len(results["B"]) == 3
+    assert sorted(params["series_id"] for params in server.params) == ["A", "B"]
+    assert all(params["observation_end"] == "2020-12-31" for params in server.params)
+
+
+def test_csv_wire_format_uses_raw_method_of_decoded_transports() -> None:
+    class DecodingTransport:
+        def __init__(self) -> None:
+            self.raw = ZipServer()
+
+        def __call__(self, url: str, params: Mapping[str, Any], timeout: float | None) -> Any:
+            raise AssertionError("decoded path used")
+
+    transport = DecodingTransport()
+    Fred(FredConfig(api_key="k", transport=transport))
+    result = Series("S1", title="Series 1").observations(wire_format="csv")
+    assert len(result) == 3
+    assert transport.raw.params[0]["file_type"] == "csv"
+
+
+def test_csv_wire_format_rejects_decoded_only_transports() -> None:
+    client = Fred(FredConfig(api_key="k", transport=lambda url, params, timeout: {}))
+    assert not client.supports_raw
+    with pytest.raises(RuntimeError, match="byte_transport"):
+        Series("S1", title="Series 1").observations(wire_format="csv")
+    with pytest.raises(RuntimeError, match="byte_transport"):
+        download_observations(["S1"], client=client)